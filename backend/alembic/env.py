@@ -30,6 +30,10 @@ from models.user import User
 from models.post import Post
 from models.category import Category
 from models.district import District
+from models.refresh_token import RefreshToken
+from models.stat_counter import StatCounter
+from models.seed_state import SeedState
+from models.post_snapshot import PostSnapshot
 
 target_metadata = Base.metadata
 
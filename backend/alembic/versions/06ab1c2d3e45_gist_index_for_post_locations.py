@@ -0,0 +1,35 @@
+"""gist index for post locations
+
+Revision ID: 06ab1c2d3e45
+Revises: f59a0b1c2d34
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '06ab1c2d3e45'
+down_revision: Union[str, Sequence[str], None] = 'f59a0b1c2d34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # Bileşik btree sadece latitude aralığını daraltabiliyordu; GiST iki ekseni birlikte kullanır
+    op.drop_index('ix_posts_latitude_longitude', table_name='posts')
+    op.create_index('ix_posts_location', 'posts', [sa.text('point(longitude, latitude)')], unique=False, postgresql_using='gist')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_posts_location', table_name='posts', postgresql_using='gist')
+    op.create_index('ix_posts_latitude_longitude', 'posts', ['latitude', 'longitude'], unique=False)
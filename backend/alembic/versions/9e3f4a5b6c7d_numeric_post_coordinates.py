@@ -0,0 +1,47 @@
+"""numeric post coordinates
+
+Revision ID: 9e3f4a5b6c7d
+Revises: 8d2e3f4a5b6c
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e3f4a5b6c7d'
+down_revision: Union[str, Sequence[str], None] = '8d2e3f4a5b6c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Sayıya çevrilemeyen (boş string vb.) değerler NULL olur
+NUMERIC_PATTERN = r"^\s*-?[0-9]+(\.[0-9]+)?\s*$"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in ('latitude', 'longitude'):
+        op.alter_column(
+            'posts', column,
+            existing_type=sa.String(),
+            type_=sa.Float(),
+            existing_nullable=True,
+            postgresql_using=f"CASE WHEN {column} ~ '{NUMERIC_PATTERN}' THEN {column}::double precision END"
+        )
+    op.create_index('ix_posts_latitude_longitude', 'posts', ['latitude', 'longitude'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_posts_latitude_longitude', table_name='posts')
+    for column in ('latitude', 'longitude'):
+        op.alter_column(
+            'posts', column,
+            existing_type=sa.Float(),
+            type_=sa.String(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::varchar"
+        )
@@ -0,0 +1,33 @@
+"""add summary columns to posts
+
+Revision ID: a04a5b6c7d8e
+Revises: 9e3f4a5b6c7d
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a04a5b6c7d8e'
+down_revision: Union[str, Sequence[str], None] = '9e3f4a5b6c7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column('summary', sa.String(), nullable=True))
+    op.add_column('posts', sa.Column('first_image', sa.String(), nullable=True))
+    op.add_column('posts', sa.Column('reading_time', sa.Integer(), nullable=True))
+    # Mevcut postlar için: python -m functions.backfill_posts summaries
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('posts', 'reading_time')
+    op.drop_column('posts', 'first_image')
+    op.drop_column('posts', 'summary')
@@ -0,0 +1,31 @@
+"""add slug pattern indexes
+
+Revision ID: b15c6d7e8f90
+Revises: a04a5b6c7d8e
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b15c6d7e8f90'
+down_revision: Union[str, Sequence[str], None] = 'a04a5b6c7d8e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Slug ataması için önek aramaları (slug LIKE 'baz-%') index kullanabilsin
+    op.create_index('ix_posts_slug_pattern', 'posts', ['slug'], unique=False, postgresql_ops={'slug': 'text_pattern_ops'})
+    op.create_index('ix_categories_slug_pattern', 'categories', ['slug'], unique=False, postgresql_ops={'slug': 'text_pattern_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_categories_slug_pattern', table_name='categories')
+    op.drop_index('ix_posts_slug_pattern', table_name='posts')
@@ -0,0 +1,35 @@
+"""add stat counters
+
+Revision ID: d37e8f9a0b12
+Revises: c26d7e8f9a01
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd37e8f9a0b12'
+down_revision: Union[str, Sequence[str], None] = 'c26d7e8f9a01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('stat_counters',
+    sa.Column('dimension', sa.String(length=16), nullable=False),
+    sa.Column('dimension_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=16), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('dimension', 'dimension_id', 'status')
+    )
+    # Mevcut veriler için: python -m functions.backfill_posts stats
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('stat_counters')
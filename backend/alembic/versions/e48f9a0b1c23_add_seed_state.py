@@ -0,0 +1,34 @@
+"""add seed state
+
+Revision ID: e48f9a0b1c23
+Revises: d37e8f9a0b12
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e48f9a0b1c23'
+down_revision: Union[str, Sequence[str], None] = 'd37e8f9a0b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('seed_state',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+    # İlçeleri yüklemek için: python -m functions.seed_districts
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('seed_state')
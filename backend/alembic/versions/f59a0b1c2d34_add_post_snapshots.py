@@ -0,0 +1,41 @@
+"""add post snapshots
+
+Revision ID: f59a0b1c2d34
+Revises: e48f9a0b1c23
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f59a0b1c2d34'
+down_revision: Union[str, Sequence[str], None] = 'e48f9a0b1c23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('post_snapshots',
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('slug', sa.String(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('body', sa.LargeBinary(), nullable=False),
+    sa.Column('etag', sa.String(length=66), nullable=False),
+    sa.Column('last_modified', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('post_id')
+    )
+    op.create_index(op.f('ix_post_snapshots_slug'), 'post_snapshots', ['slug'], unique=False)
+    # Mevcut onaylı postlar için: python -m functions.backfill_posts snapshots
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_post_snapshots_slug'), table_name='post_snapshots')
+    op.drop_table('post_snapshots')
@@ -0,0 +1,193 @@
+"""
+Sıcak API uçları için gecikme (p50/p95/p99) ve throughput ölçümü.
+
+Veri seti benchmarks.dataset ile üretilmiş olmalı. Varsayılan olarak
+uygulama aynı süreçte (ASGI transport) çalıştırılır; --base-url verilirse
+çalışan bir sunucuya istek atılır. Sonuçlar JSON olarak yazılır ve
+--compare ile önceki bir çalıştırmanın sonucuyla karşılaştırılabilir.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.api_scenarios --requests 500 --concurrency 20 --output bench.json
+    python -m benchmarks.api_scenarios --compare bench.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import subprocess
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from benchmarks.dataset import BENCH_EMAIL_DOMAIN, BENCH_PASSWORD
+
+try:
+    import httpx
+except ImportError:
+    raise SystemExit("Bu benchmark için 'httpx' paketini yükleyin")
+
+# Senaryo: rastgele üreteçten (method, path, json gövdesi) üreten fonksiyon
+RequestFactory = Callable[[random.Random], Tuple[str, str, Optional[dict]]]
+
+
+def build_scenarios(slugs: List[str], users: int) -> Dict[str, RequestFactory]:
+    return {
+        "posts_list": lambda rng: ("GET", "/posts/?limit=20", None),
+        "posts_featured": lambda rng: ("GET", "/posts/featured", None),
+        "posts_map": lambda rng: ("GET", "/posts/map-posts", None),
+        "post_by_slug": lambda rng: ("GET", f"/posts/slug/{rng.choice(slugs)}", None),
+        "auth_login": lambda rng: ("POST", "/auth/login", {
+            "email": f"user{rng.randint(1, users - 1)}@{BENCH_EMAIL_DOMAIN}",
+            "password": BENCH_PASSWORD,
+        }),
+    }
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """En yakın sıra (nearest-rank) yöntemiyle yüzdelik."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+async def run_scenario(client: "httpx.AsyncClient", name: str, factory: RequestFactory,
+                       requests: int, concurrency: int, warmup: int, seed: int) -> dict:
+    rng = random.Random(f"{seed}:{name}")
+    plan = [factory(rng) for _ in range(warmup + requests)]
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(method: str, path: str, body: Optional[dict], record: bool):
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.request(method, path, json=body)
+            elapsed = time.perf_counter() - started
+        if record:
+            latencies.append(elapsed)
+            statuses[response.status_code] += 1
+
+    # Isınma istekleri önbellekleri ve bağlantı havuzunu doldurur, ölçüme girmez
+    await asyncio.gather(*(send(*request, record=False) for request in plan[:warmup]))
+    started = time.perf_counter()
+    await asyncio.gather(*(send(*request, record=True) for request in plan[warmup:]))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "scenario": name,
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": sum(count for code, count in statuses.items() if code >= 400),
+        "status_codes": {str(code): count for code, count in sorted(statuses.items())},
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        "elapsed_s": round(wall, 3),
+        "throughput_rps": round(requests / wall, 2) if wall else 0.0,
+    }
+
+
+async def sample_slugs(client: "httpx.AsyncClient", pages: int = 5) -> List[str]:
+    """Onaylı postların slug'larını listeleme ucundan toplar."""
+    slugs, cursor = [], None
+    for _ in range(pages):
+        params = {"limit": 100, **({"cursor": cursor} if cursor else {})}
+        page = (await client.get("/posts/", params=params)).json()
+        slugs.extend(item["slug"] for item in page["items"])
+        cursor = page.get("next_cursor")
+        if not cursor:
+            break
+    if not slugs:
+        raise SystemExit("Onaylı post bulunamadı; önce benchmarks.dataset ile veri üretin")
+    return slugs
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def _client(base_url: Optional[str]) -> "httpx.AsyncClient":
+    if base_url:
+        return httpx.AsyncClient(base_url=base_url, timeout=60)
+    from main import app
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60)
+
+
+def _database_dialect(base_url: Optional[str]) -> Optional[str]:
+    if base_url:
+        return None
+    from database import engine
+    return engine.dialect.name
+
+
+async def main(args) -> dict:
+    async with _client(args.base_url) as client:
+        scenarios = build_scenarios(await sample_slugs(client), args.users)
+        selected = args.scenarios or list(scenarios)
+        results = []
+        for name in selected:
+            requests = args.login_requests if name == "auth_login" else args.requests
+            results.append(await run_scenario(
+                client, name, scenarios[name], requests, args.concurrency, args.warmup, args.seed
+            ))
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "target": args.base_url or "in-process",
+            "database": _database_dialect(args.base_url),
+            "python": platform.python_version(),
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict) -> List[dict]:
+    """İki çalıştırmanın ortak senaryolarını p50/p95/p99 ve throughput farkıyla listeler."""
+    previous = {result["scenario"]: result for result in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        before = previous.get(result["scenario"])
+        if not before:
+            continue
+        row = {"scenario": result["scenario"]}
+        for metric in ("p50_ms", "p95_ms", "p99_ms", "throughput_rps"):
+            row[metric] = result[metric]
+            row[f"{metric}_change_pct"] = (
+                round((result[metric] - before[metric]) / before[metric] * 100, 1) if before[metric] else None
+            )
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", help="Çalışan bir sunucu (ör. http://localhost:8000); verilmezse süreç içi")
+    parser.add_argument("--scenarios", nargs="+",
+                        choices=["posts_list", "posts_featured", "posts_map", "post_by_slug", "auth_login"])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--login-requests", type=int, default=50, help="bcrypt pahalı olduğu için ayrı sayı")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--users", type=int, default=50, help="benchmarks.dataset ile üretilen kullanıcı sayısı")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", help="Karşılaştırılacak önceki sonuç dosyası")
+    args = parser.parse_args()
+
+    report = asyncio.run(main(args))
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            report["comparison"] = compare(json.load(baseline_file), report)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,241 @@
+"""
+Benchmark için deterministik sentetik İstanbul veri seti üretir.
+
+Aynı --seed ve boyutlarla her çalıştırmada aynı kullanıcılar, kategoriler,
+39 ilçe ve blok içerikli, koordinatlı postlar oluşur; böylece farklı
+commit'lerde alınan ölçümler karşılaştırılabilir. Türetilmiş kolonlar
+(slug, summary, search_vector, istatistik sayaçları, post snapshot'ları)
+uygulamanın kendi servisleriyle hesaplanır.
+
+Boş bir veritabanına yazar (backend dizininden):
+    python -m benchmarks.dataset --users 50 --posts 5000 --create-tables
+"""
+import argparse
+import json
+import random
+from datetime import datetime, timedelta
+from sqlalchemy import func, select
+from database import Base, SessionLocal, engine
+from functions.auth_functions import get_password_hash
+from functions.seed_districts import seed_districts
+from models.category import Category
+from models.district import District, DistrictRegion
+from models.post import Post, PostStatus
+from models.user import User, UserRole
+from services.post_snapshot import rebuild_snapshots
+from services.post_summary import refresh_summary
+from services.search_service import refresh_search_vector
+from services.slug_service import slugify
+from services.stats_service import rebuild_counters
+
+# Senaryo çalıştırıcısı (benchmarks.api_scenarios) bu hesaplarla giriş yapar
+BENCH_EMAIL_DOMAIN = "bench.istancool.dev"
+BENCH_PASSWORD = "benchmark-password"
+ADMIN_EMAIL = f"admin@{BENCH_EMAIL_DOMAIN}"
+
+BATCH_SIZE = 500
+FEATURED_COUNT = 12
+# Sabit bir başlangıç; utcnow kullanılsaydı her çalıştırmada tarihler değişirdi
+CREATED_FROM = datetime(2023, 1, 1)
+CREATED_SPAN_DAYS = 730
+
+CATEGORIES = [
+    ("Tarihi Yerler", "#8B4513", "landmark"),
+    ("Yeme İçme", "#E4572E", "utensils"),
+    ("Müzeler", "#4C6EF5", "building-columns"),
+    ("Parklar ve Doğa", "#2F9E44", "tree"),
+    ("Sanat ve Kültür", "#AE3EC9", "palette"),
+    ("Manzara Noktaları", "#1098AD", "binoculars"),
+    ("Alışveriş", "#F59F00", "bag-shopping"),
+    ("Kahveciler", "#6F4E37", "mug-hot"),
+]
+
+# Yakalara göre kaba sınır kutuları (güney, batı, kuzey, doğu)
+REGION_BOUNDS = {
+    DistrictRegion.EUROPE: (40.96, 28.55, 41.20, 29.02),
+    DistrictRegion.ASIA: (40.84, 29.03, 41.17, 29.40),
+}
+
+FIRST_NAMES = ["Ayşe", "Mehmet", "Zeynep", "Emre", "Elif", "Can", "Selin", "Burak", "Deniz", "Merve", "Kerem", "Ece"]
+LAST_NAMES = ["Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Öztürk", "Aydın", "Arslan", "Doğan"]
+
+TITLE_ADJECTIVES = ["Gizli", "Tarihi", "Sakin", "Renkli", "Unutulmuş", "Meşhur", "Küçük", "Eski", "Yeni", "Şirin"]
+TITLE_NOUNS = ["Sokak", "Çarşı", "Kahve", "Meydan", "Sahil", "Yokuş", "Han", "Çeşme", "Bahçe", "Lokanta", "Cami", "Köşk"]
+WORDS = (
+    "boğaz vapur simit martı çay kahve tarih sokak mahalle çarşı han cami köşk yalı sahil "
+    "manzara gün batımı bahar lodos poyraz rıhtım iskele tramvay yokuş merdiven pazar "
+    "balık ekmek lokum baklava kitapçı sahaf galeri sergi konser müze saray kule surlar "
+    "kapı avlu çeşme bahçe çınar erguvan lale akşam sabah kalabalık sessiz eski yeni"
+).split()
+
+
+def _sentence(rng: random.Random, low: int = 8, high: int = 18) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(low, high))]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng: random.Random) -> str:
+    return " ".join(_sentence(rng) for _ in range(rng.randint(2, 6)))
+
+
+def _image_url(rng: random.Random) -> str:
+    return f"https://res.cloudinary.com/istancool/image/upload/v1/posts/blocks/{rng.getrandbits(48):012x}.jpg"
+
+
+def make_blocks(rng: random.Random) -> list:
+    """
+    Frontend blok editörünün ürettiğine benzer bir blok listesi: başlıklar,
+    paragraflar, listeler, tekil resimler ve resimli grid'ler.
+    """
+    blocks = [{"type": "paragraph", "content": _paragraph(rng)}]
+    for _ in range(rng.randint(2, 8)):
+        kind = rng.choices(["paragraph", "h2", "image", "list", "grid"], weights=[5, 2, 2, 1, 1])[0]
+        if kind == "paragraph":
+            blocks.append({"type": "paragraph", "content": _paragraph(rng)})
+        elif kind == "h2":
+            blocks.append({"type": "h2", "content": _sentence(rng, 2, 5)[:-1]})
+        elif kind == "image":
+            blocks.append({"type": "image", "src": _image_url(rng), "alt": _sentence(rng, 3, 6)})
+        elif kind == "list":
+            blocks.append({"type": "list", "items": [_sentence(rng, 3, 8) for _ in range(rng.randint(3, 6))]})
+        else:
+            blocks.append({"type": "grid", "columns": 2, "blocks": [
+                {"type": "image", "src": _image_url(rng), "alt": _sentence(rng, 2, 4)}
+                for _ in range(rng.choice([2, 4]))
+            ]})
+    return blocks
+
+
+def _coordinates(rng: random.Random, region: DistrictRegion):
+    south, west, north, east = REGION_BOUNDS[region]
+    return round(rng.uniform(south, north), 6), round(rng.uniform(west, east), 6)
+
+
+def _insert_users(db, rng: random.Random, count: int) -> list:
+    # bcrypt pahalı; tüm benchmark kullanıcıları aynı parolayı paylaşıyor
+    hashed_password = get_password_hash(BENCH_PASSWORD)
+    users = [User(email=ADMIN_EMAIL, first_name="Bench", last_name="Admin",
+                  hashed_password=hashed_password, role=UserRole.ADMIN)]
+    for index in range(1, count):
+        users.append(User(
+            email=f"user{index}@{BENCH_EMAIL_DOMAIN}",
+            first_name=rng.choice(FIRST_NAMES),
+            last_name=rng.choice(LAST_NAMES),
+            hashed_password=hashed_password,
+            role=UserRole.EDITOR if index % 10 == 0 else UserRole.USER
+        ))
+    db.add_all(users)
+    db.flush()
+    return users
+
+
+def _insert_categories(db) -> list:
+    categories = [
+        Category(name=name, slug=slugify(name), color=color, icon=icon, show_on_homepage=index < 4)
+        for index, (name, color, icon) in enumerate(CATEGORIES)
+    ]
+    db.add_all(categories)
+    db.flush()
+    return categories
+
+
+def _insert_posts(db, rng: random.Random, count: int, users: list, categories: list, districts: list) -> None:
+    taken = {}
+    featured = 0
+    for start in range(0, count, BATCH_SIZE):
+        batch = []
+        for index in range(start, min(start + BATCH_SIZE, count)):
+            district = rng.choice(districts)
+            title = f"{district.name}'da {rng.choice(TITLE_ADJECTIVES)} {rng.choice(TITLE_NOUNS)}"
+            # Başlıklarda rakam olmadığından base-N başka bir kökle çakışmaz
+            base = slugify(title)
+            used = taken.get(base, 0)
+            slug = f"{base}-{used}" if used else base
+            taken[base] = used + 1
+
+            status = rng.choices(
+                [PostStatus.APPROVED, PostStatus.PENDING, PostStatus.REJECTED], weights=[80, 15, 5]
+            )[0]
+            is_featured = status == PostStatus.APPROVED and featured < FEATURED_COUNT and rng.random() < 0.2
+            latitude, longitude = _coordinates(rng, district.region) if rng.random() < 0.9 else (None, None)
+            created_at = CREATED_FROM + timedelta(seconds=rng.randint(0, CREATED_SPAN_DAYS * 86400))
+
+            post = Post(
+                title=title,
+                slug=slug,
+                content=_paragraph(rng) if rng.random() < 0.3 else None,
+                cover_image=_image_url(rng),
+                status=status,
+                is_active=rng.random() < 0.95,
+                is_featured=is_featured,
+                featured_order=featured + 1 if is_featured else None,
+                latitude=latitude,
+                longitude=longitude,
+                category_id=rng.choice(categories).id,
+                district_id=district.id,
+                author_id=rng.choice(users).id,
+                created_at=created_at,
+                updated_at=created_at,
+                blocks=make_blocks(rng)
+            )
+            featured += is_featured
+            refresh_summary(post)
+            refresh_search_vector(db, post)
+            batch.append(post)
+        db.add_all(batch)
+        db.flush()
+        print(f"{min(start + BATCH_SIZE, count)} post eklendi...")
+
+
+def generate(users: int, posts: int, seed: int) -> dict:
+    """
+    Veri setini tek transaction içinde yazar ve oluşan satır sayılarını döndürür.
+    """
+    rng = random.Random(seed)
+    seed_districts()
+
+    db = SessionLocal()
+    try:
+        if db.scalar(select(func.count()).select_from(Post)) or db.scalar(select(func.count()).select_from(User)):
+            raise SystemExit("Veri seti boş bir veritabanı bekliyor (posts/users tabloları dolu)")
+
+        districts = db.scalars(select(District).order_by(District.id)).all()
+        user_rows = _insert_users(db, rng, users)
+        category_rows = _insert_categories(db)
+        _insert_posts(db, rng, posts, user_rows, category_rows, districts)
+        rebuild_counters(db)
+        db.commit()
+        # Snapshot'lar olmadan detay istekleri yedek yoldan serileştirilir ve ölçüm yanıltıcı olur
+        snapshots = rebuild_snapshots(db)
+
+        counts = {
+            "seed": seed,
+            "users": len(user_rows),
+            "categories": len(category_rows),
+            "districts": len(districts),
+            "posts": posts,
+            "snapshots": snapshots,
+        }
+        for status in PostStatus:
+            counts[f"posts_{status.value}"] = db.scalar(
+                select(func.count()).select_from(Post).where(Post.status == status)
+            )
+        return counts
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--posts", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--create-tables", action="store_true",
+                        help="Tabloları migration yerine metadata'dan oluştur (yerel SQLite için)")
+    args = parser.parse_args()
+
+    # Mapper'ların çözülebilmesi için tüm modellerin yüklenmiş olması gerekiyor
+    import models.refresh_token, models.stat_counter, models.seed_state, models.post_snapshot  # noqa: F401
+    if args.create_tables:
+        Base.metadata.create_all(bind=engine)
+    print(json.dumps(generate(args.users, args.posts, args.seed), indent=2))
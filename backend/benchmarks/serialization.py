@@ -0,0 +1,109 @@
+"""
+Okuma uçlarındaki JSON üretim yollarının mikro benchmark'ı.
+
+benchmarks.dataset ile üretilmiş postları bir kez yükler ve aynı ORM
+nesnelerini farklı yollarla JSON'a çevirir:
+
+* fastapi: response_model doğrulaması + mode="json" dump + json.dumps
+  (FastAPI'nin ORM nesnesi döndüren bir route için yaptığı adımlar)
+* encoder: model_validate + jsonable_encoder + json.dumps (eski to_json_bytes)
+* typeadapter: derlenmiş TypeAdapter ile tek geçişte doğrulama + dump_json
+  (services.serializers.serialize)
+* orjson: doğrulama + dump_python + orjson.dumps (orjson kuruluysa)
+
+Kullanım (backend dizininden):
+    python -m benchmarks.serialization --posts 200 --repeat 20
+"""
+import argparse
+import json
+import statistics
+import time
+from typing import Callable, List
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, undefer_group
+from database import SessionLocal
+from models.post import Post
+from models.user import User  # noqa: F401
+from models.category import Category  # noqa: F401
+from models.district import District  # noqa: F401
+from schemas.post import Post as PostSchema, PostListItem
+from services.serializers import adapter, serialize
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_posts(limit: int) -> List[Post]:
+    db = SessionLocal()
+    try:
+        posts = db.scalars(select(Post).options(
+            joinedload(Post.category), joinedload(Post.author), joinedload(Post.district), undefer_group("body")
+        ).order_by(Post.id).limit(limit)).unique().all()
+        db.expunge_all()
+        return posts
+    finally:
+        db.close()
+
+
+def paths(schema) -> dict:
+    type_adapter = adapter(schema, many=True)
+
+    def fastapi_path(posts):
+        validated = type_adapter.validate_python(posts, from_attributes=True)
+        content = type_adapter.dump_python(validated, mode="json")
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def encoder_path(posts):
+        models = [schema.model_validate(post) for post in posts]
+        return json.dumps(jsonable_encoder(models), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def typeadapter_path(posts):
+        return serialize(schema, posts, many=True)
+
+    result = {"fastapi": fastapi_path, "encoder": encoder_path, "typeadapter": typeadapter_path}
+    if orjson is not None:
+        def orjson_path(posts):
+            return orjson.dumps(type_adapter.dump_python(type_adapter.validate_python(posts, from_attributes=True)))
+        result["orjson"] = orjson_path
+    return result
+
+
+def measure(func: Callable, posts: List[Post], repeat: int) -> dict:
+    func(posts)  # ısınma
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = func(posts)
+        timings.append(time.perf_counter() - started)
+    median = statistics.median(timings)
+    return {
+        "median_ms": round(median * 1000, 3),
+        "min_ms": round(min(timings) * 1000, 3),
+        "posts_per_s": round(len(posts) / median) if median else None,
+        "bytes": len(body),
+    }
+
+
+def main(limit: int, repeat: int) -> dict:
+    posts = load_posts(limit)
+    if not posts:
+        raise SystemExit("Post bulunamadı; önce benchmarks.dataset ile veri üretin")
+    report = {"posts": len(posts), "repeat": repeat, "schemas": {}}
+    for schema in (PostSchema, PostListItem):
+        results = {name: measure(func, posts, repeat) for name, func in paths(schema).items()}
+        baseline = results["fastapi"]["median_ms"]
+        for result in results.values():
+            result["speedup"] = round(baseline / result["median_ms"], 2) if result["median_ms"] else None
+        report["schemas"][schema.__name__] = results
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(main(args.posts, args.repeat), indent=2))
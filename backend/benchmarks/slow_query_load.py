@@ -0,0 +1,98 @@
+"""
+Yavaş sorgular altında eşzamanlılık yük testi.
+
+Aynı yavaş sorguyu (PostgreSQL'de pg_sleep, SQLite'ta kayıtlı sleep()) üç
+farklı handler biçimiyle eşzamanlı olarak çalıştırır ve toplam süreyi ölçer:
+
+* blocking: async def + sync Session (eski yapı, event loop'u bloklar)
+* threadpool: def + sync Session (FastAPI threadpool'da çalıştırır)
+* async: async def + AsyncSession (asyncpg/aiosqlite)
+
+Kullanım (backend dizininden):
+    python -m benchmarks.slow_query_load --requests 20 --delay 0.2
+"""
+import argparse
+import asyncio
+import json
+import time
+from fastapi import Depends, FastAPI
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from database import engine, async_engine, get_db, get_async_db
+
+try:
+    import httpx
+except ImportError:
+    raise SystemExit("Bu yük testi için 'httpx' paketini yükleyin")
+
+
+def _sleep_statement(dialect_name: str):
+    if dialect_name == "postgresql":
+        return text("SELECT pg_sleep(:delay)")
+    return text("SELECT sleep(:delay)")
+
+
+def _register_sqlite_sleep(sync_engine):
+    @event.listens_for(sync_engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        dbapi_connection.create_function("sleep", 1, lambda seconds: time.sleep(seconds) or 0)
+
+
+def build_app(delay: float) -> FastAPI:
+    statement = _sleep_statement(engine.dialect.name)
+    app = FastAPI()
+
+    @app.get("/blocking")
+    async def blocking(db: Session = Depends(get_db)):
+        db.execute(statement, {"delay": delay})
+        return {"ok": True}
+
+    @app.get("/threadpool")
+    def threadpool(db: Session = Depends(get_db)):
+        db.execute(statement, {"delay": delay})
+        return {"ok": True}
+
+    @app.get("/async")
+    async def async_handler(db: AsyncSession = Depends(get_async_db)):
+        await db.execute(statement, {"delay": delay})
+        return {"ok": True}
+
+    return app
+
+
+async def run_scenario(app: FastAPI, path: str, requests: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        responses = await asyncio.gather(*(client.get(path) for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+    return {
+        "scenario": path.strip("/"),
+        "requests": requests,
+        "errors": sum(response.status_code != 200 for response in responses),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 2),
+    }
+
+
+async def main(requests: int, delay: float) -> list:
+    if engine.dialect.name == "sqlite":
+        _register_sqlite_sleep(engine)
+        _register_sqlite_sleep(async_engine.sync_engine)
+    app = build_app(delay)
+    results = []
+    for path in ("/blocking", "/threadpool", "/async"):
+        results.append(await run_scenario(app, path, requests))
+    # Tam seri çalışmada beklenen süre, karşılaştırma için
+    for result in results:
+        result["serial_s"] = round(requests * delay, 3)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.2, help="Her sorgunun süresi (saniye)")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(main(args.requests, args.delay)), indent=2))
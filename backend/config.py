@@ -4,8 +4,104 @@ from dotenv import load_dotenv
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Boşsa DATABASE_URL'den türetilir (postgresql -> asyncpg)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+
+# JWT ayarları
+SECRET_KEY = os.getenv("SECRET_KEY")
+ALGORITHM = os.getenv("ALGORITHM")
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+
+# Google OAuth
+GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
+GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET")
 
 # Cloudinary Config
 CLOUDINARY_CLOUD_NAME = os.getenv("CLOUDINARY_CLOUD_NAME")
 CLOUDINARY_API_KEY = os.getenv("CLOUDINARY_API_KEY")
-CLOUDINARY_API_SECRET = os.getenv("CLOUDINARY_API_SECRET") 
\ No newline at end of file
+CLOUDINARY_API_SECRET = os.getenv("CLOUDINARY_API_SECRET") 
+
+# Harita kümeleme ayarları
+MAP_CLUSTER_MAX_ZOOM = int(os.getenv("MAP_CLUSTER_MAX_ZOOM", "14"))
+MAP_CLUSTER_RADIUS_PX = int(os.getenv("MAP_CLUSTER_RADIUS_PX", "60"))
+MAP_MAX_POINTS = int(os.getenv("MAP_MAX_POINTS", "1000"))
+
+# Önbellek ayarları (CACHE_BACKEND: memory | redis). memory süreç içidir: yazma
+# sonrası invalidation yalnızca o worker'ı temizler, birden fazla worker'la
+# çalışırken redis kullanın (functions/serve.py --workers > 1 bunu zorunlu tutar).
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+CACHE_DEFAULT_TTL = int(os.getenv("CACHE_DEFAULT_TTL", "300"))
+# İlçeler yalnızca seed ile değişir
+DISTRICTS_CACHE_TTL = int(os.getenv("DISTRICTS_CACHE_TTL", "3600"))
+
+# JSON yanıt kodlayıcısı (JSON_BACKEND: json | orjson). orjson opsiyonel bir paket.
+JSON_BACKEND = os.getenv("JSON_BACKEND", "json")
+
+# Yanıt sıkıştırma. brotli opsiyonel bir paket; kurulu değilse sadece gzip kullanılır.
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+COMPRESSION_CONTENT_TYPES = [
+    content_type.strip()
+    for content_type in os.getenv(
+        "COMPRESSION_CONTENT_TYPES", "application/json,application/x-ndjson,text/"
+    ).split(",")
+    if content_type.strip()
+]
+
+# Route bazında Cache-Control başlıkları
+CACHE_CONTROL = {
+    "posts": os.getenv("CACHE_CONTROL_POSTS", "public, max-age=60, stale-while-revalidate=300"),
+    "categories": os.getenv("CACHE_CONTROL_CATEGORIES", "public, max-age=300, stale-while-revalidate=3600"),
+    "districts": os.getenv("CACHE_CONTROL_DISTRICTS", "public, max-age=3600, stale-while-revalidate=86400"),
+}
+
+# Veritabanı bağlantı havuzu ayarları
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# PgBouncer (transaction pooling) arkasında çalışırken havuzlamayı PgBouncer'a bırak
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
+
+# Resim yükleme ayarları
+UPLOAD_CONCURRENCY = int(os.getenv("UPLOAD_CONCURRENCY", "4"))
+UPLOAD_TIMEOUT = float(os.getenv("UPLOAD_TIMEOUT", "30"))
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(6 * 1024 * 1024)))  # Cloudinary en az 5 MB ister
+UPLOAD_MAX_FILE_SIZE = int(os.getenv("UPLOAD_MAX_FILE_SIZE", str(10 * 1024 * 1024)))
+UPLOAD_MAX_REQUEST_SIZE = int(os.getenv("UPLOAD_MAX_REQUEST_SIZE", str(50 * 1024 * 1024)))
+UPLOAD_MAX_IMAGE_DIMENSION = int(os.getenv("UPLOAD_MAX_IMAGE_DIMENSION", "10000"))
+
+# Kimliği doğrulanmış kullanıcı önbelleği
+PRINCIPAL_CACHE_TTL = int(os.getenv("PRINCIPAL_CACHE_TTL", "60"))
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "1024"))
+# Token'daki uid/role claim'lerine güvenilip veritabanına hiç gidilmesin mi?
+# Açıksa AUTH_STATE_BACKEND=redis zorunludur (uygulama açılmaz).
+AUTH_TRUST_TOKEN_CLAIMS = os.getenv("AUTH_TRUST_TOKEN_CLAIMS", "false").lower() == "true"
+# Kullanıcı silme/pasifleştirme/rol değişikliği işaretlerinin deposu (memory | redis).
+# Yanıt önbelleğinden ayrıdır; Redis'te maxmemory-policy allkeys-* olmamalı.
+AUTH_STATE_BACKEND = os.getenv("AUTH_STATE_BACKEND", "memory")
+AUTH_REDIS_URL = os.getenv("AUTH_REDIS_URL", CACHE_REDIS_URL)
+
+# Parola hash ayarları. bcrypt maliyeti değişirse eski hash'ler girişte yenilenir.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+# Kuyrukta bekleyebilecek en fazla hash işi; aşılırsa 503 döner
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "32"))
+PASSWORD_HASH_RETRY_AFTER = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", "2"))
+
+# Yenileme token'ları
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "30"))
+# İptal edilen access token'lar için bellek içi bloom filter boyutu
+TOKEN_DENYLIST_CAPACITY = int(os.getenv("TOKEN_DENYLIST_CAPACITY", "100000"))
+
+# Uygulama açılışında ilçe seed'i çalışsın mı? Hızlı worker açılışı için
+# false yapıp seed'i deploy adımında "python -m functions.seed_districts"
+# ile çalıştırın.
+SEED_ON_STARTUP = os.getenv("SEED_ON_STARTUP", "true").lower() == "true"
+# Açılışta create_all çalışsın mı? Tablolar Alembic ile yönetiliyorsa
+# (alembic upgrade head deploy adımında) false yapılabilir.
+CREATE_TABLES_ON_STARTUP = os.getenv("CREATE_TABLES_ON_STARTUP", "true").lower() == "true"
@@ -1,31 +1,152 @@
+import threading
+import time
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from dotenv import load_dotenv
-import os
-
-# .env dosyasını yükle
-load_dotenv()
-
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool, NullPool
+from config import (
+    DATABASE_URL,
+    ASYNC_DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_PGBOUNCER,
+)
 # Veritabanı URL'sini al
-SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
+SQLALCHEMY_DATABASE_URL = DATABASE_URL
 
 if not SQLALCHEMY_DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
-# Engine oluştur
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+# Async sürücüye karşılık gelen URL (postgresql -> asyncpg, sqlite -> aiosqlite)
+ASYNC_DRIVERS = {
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def to_async_url(url: str) -> str:
+    scheme, rest = url.split("://", 1)
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}://{rest}"
+
+ASYNC_DATABASE_URL = ASYNC_DATABASE_URL or to_async_url(SQLALCHEMY_DATABASE_URL)
+
+
+class PoolWaitStats:
+    """Havuzdan bağlantı alma sürelerini toplar."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, elapsed: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total += elapsed
+            self.max = max(self.max, elapsed)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.count,
+                "wait_total_ms": round(self.total * 1000, 2),
+                "wait_avg_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+                "wait_max_ms": round(self.max * 1000, 2),
+            }
+
+
+class _InstrumentedPoolMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_stats.record(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(url: str, is_async: bool) -> dict:
+    """
+    Ortam değişkenlerinden havuz ayarlarını üretir. PgBouncer modunda
+    havuzlama PgBouncer'a bırakılır ve asyncpg'nin prepared statement
+    önbelleği kapatılır (transaction pooling ile uyumsuz).
+    """
+    if url.startswith("sqlite"):
+        return {}
+    if DB_PGBOUNCER:
+        options = {"poolclass": NullPool}
+        if is_async:
+            options["connect_args"] = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        return options
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+def create_db_engine(url: str = SQLALCHEMY_DATABASE_URL):
+    return create_engine(url, **engine_options(url, is_async=False))
+
+def create_async_db_engine(url: str = ASYNC_DATABASE_URL):
+    return create_async_engine(url, **engine_options(url, is_async=True))
+
+def pool_status(pool) -> dict:
+    """Havuzdaki kullanımda, boşta ve taşma bağlantı sayılarını döndürür."""
+    status = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+        })
+    if isinstance(pool, _InstrumentedPoolMixin):
+        status.update(pool.wait_stats.as_dict())
+    return status
+
+# Uygulama genelinde paylaşılan engine'ler
+engine = create_db_engine()
+async_engine = create_async_db_engine()
 
 # Session oluştur
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Async tarafta commit sonrası nesneler expire edilmez; lazy load yapılamadığı için
+# ilişkiler sorguda açıkça yüklenmelidir.
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 # Base class oluştur
 Base = declarative_base()
 
-# Veritabanı bağlantısı için dependency
+# Veritabanı bağlantısı için dependency (sync handler'lar, threadpool'da çalışır)
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+# async def handler'lar için event loop'u bloklamayan dependency
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
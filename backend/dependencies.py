@@ -1,29 +1,42 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db
 from models.user import User, UserRole
-from functions.auth_functions import verify_token
+from functions.auth_functions import verify_token, get_user_by_email_async
+from services.principal_cache import Principal, principal_cache, claims_principal
+from services.token_service import is_access_token_revoked
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> Principal:
     payload = verify_token(token)
-    user = db.query(User).filter(User.email == payload.get("sub")).first()
-    if not user:
+    subject = payload.get("sub")
+    if is_access_token_revoked(payload):
+        subject = None
+    # Sırasıyla: token claim'leri (açıksa), süreç içi önbellek, veritabanı
+    principal = claims_principal(payload) if subject else None
+    if principal is None and subject:
+        principal = principal_cache.get(subject)
+        if principal is None:
+            user = await get_user_by_email_async(db, subject)
+            if user:
+                principal = Principal.from_user(user)
+                principal_cache.set(subject, principal)
+    if principal is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return user
+    return principal
 
-async def get_current_active_user(current_user: User = Depends(get_current_user)):
+async def get_current_active_user(current_user: Principal = Depends(get_current_user)):
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
-async def get_current_admin(current_user: User = Depends(get_current_active_user)):
+async def get_current_admin(current_user: Principal = Depends(get_current_active_user)):
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -31,7 +44,7 @@ async def get_current_admin(current_user: User = Depends(get_current_active_user
         )
     return current_user
 
-async def get_current_editor_or_admin(current_user: User = Depends(get_current_active_user)):
+async def get_current_editor_or_admin(current_user: Principal = Depends(get_current_active_user)):
     if current_user.role not in [UserRole.EDITOR, UserRole.ADMIN]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,87 @@
+import argparse
+from sqlalchemy.orm import undefer_group
+from database import SessionLocal
+from models.post import Post
+from models.user import User
+from models.category import Category
+from models.district import District
+from services.search_service import refresh_search_vector
+from services.post_summary import refresh_summary
+from services.stats_service import rebuild_counters
+from models.stat_counter import StatCounter
+from models.post_snapshot import PostSnapshot
+from services.post_snapshot import rebuild_snapshots
+
+BATCH_SIZE = 200
+
+def _backfill(refresh, label):
+    """
+    Postları id sırasıyla BATCH_SIZE'lık gruplar halinde gezip refresh(db, post) uygular.
+    """
+    db = SessionLocal()
+    try:
+        last_id, total = 0, 0
+        while True:
+            # content/blocks ertelenmiş kolonlar; batch'le birlikte yüklenmezse her post ayrı sorgu atar
+            posts = (
+                db.query(Post).options(undefer_group("body"))
+                .filter(Post.id > last_id).order_by(Post.id).limit(BATCH_SIZE).all()
+            )
+            if not posts:
+                break
+            for post in posts:
+                refresh(db, post)
+            last_id = posts[-1].id
+            total += len(posts)
+            db.commit()
+            print(f"{total} post güncellendi...")
+        print(f"{label} tamamlandı: {total} post")
+    finally:
+        db.close()
+
+def backfill_search_vectors():
+    """
+    Tüm postların search_vector kolonunu yeniden hesaplar.
+    """
+    _backfill(refresh_search_vector, "Arama vektörleri")
+
+def backfill_summaries():
+    """
+    Tüm postların summary, first_image ve reading_time kolonlarını yeniden hesaplar.
+    """
+    _backfill(lambda db, post: refresh_summary(post), "Özetler")
+
+def rebuild_stats():
+    """
+    Admin istatistik sayaçlarını tablolardan yeniden hesaplar.
+    """
+    db = SessionLocal()
+    try:
+        rebuild_counters(db)
+        print("İstatistik sayaçları yeniden hesaplandı")
+    finally:
+        db.close()
+
+def backfill_snapshots():
+    """
+    Onaylı postların yayın snapshot'larını yeniden yazar.
+    """
+    db = SessionLocal()
+    try:
+        total = rebuild_snapshots(db)
+        print(f"Snapshot'lar tamamlandı: {total} post")
+    finally:
+        db.close()
+
+TASKS = {
+    "search": backfill_search_vectors,
+    "summaries": backfill_summaries,
+    "stats": rebuild_stats,
+    "snapshots": backfill_snapshots,
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mevcut postlar için türetilmiş kolonları doldurur")
+    parser.add_argument("task", choices=sorted(TASKS))
+    args = parser.parse_args()
+    TASKS[args.task]()
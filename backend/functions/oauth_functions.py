@@ -1,16 +1,12 @@
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.user import User
-from functions.auth_functions import create_access_token, get_password_hash
+from functions.auth_functions import create_access_token, hash_password, get_user_by_email_async
+from services.principal_cache import token_claims
+from services.token_service import issue_refresh_token
+from services.stats_service import apply_deltas, entity_delta
 from datetime import timedelta
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
-GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
+from config import GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET, ACCESS_TOKEN_EXPIRE_MINUTES
 
 async def verify_google_token(token: str) -> dict:
     try:
@@ -23,11 +19,11 @@ async def verify_google_token(token: str) -> dict:
             detail="Invalid Google token"
         )
 
-async def handle_google_login(db: Session, token: str):
+async def handle_google_login(db: AsyncSession, token: str):
     user_data = await verify_google_token(token)
     
     # Kullanıcı var mı kontrol et
-    user = db.query(User).filter(User.email == user_data["email"]).first()
+    user = await get_user_by_email_async(db, user_data["email"])
     
     if not user:
         # Yeni kullanıcı oluştur
@@ -35,21 +31,26 @@ async def handle_google_login(db: Session, token: str):
             email=user_data["email"],
             first_name=user_data["name"],
             last_name="",
-            hashed_password=get_password_hash("google_oauth"),  # Rastgele şifre
+            hashed_password=await hash_password("google_oauth"),  # Rastgele şifre
             is_google_oauth=True
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await apply_deltas(db, entity_delta("users", 1))
+        await db.commit()
+        await db.refresh(user)
     
     # Access token oluştur
     access_token = create_access_token(
-        data={"sub": user.email},
+        data=token_claims(user),
         expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     
+    refresh_token, _ = await issue_refresh_token(db, user.id)
+    await db.commit()
+
     return {
         "access_token": access_token,
         "token_type": "bearer",
+        "refresh_token": refresh_token,
         "user": user
     } 
\ No newline at end of file
@@ -1,13 +1,20 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import hashlib
+import json
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from database import SessionLocal
 from models.district import District, DistrictRegion
-from config import DATABASE_URL
+from models.seed_state import SeedState
+from services.cache import cache
+from services.post_snapshot import published_post_ids, sync_snapshots_sync
+from config import CACHE_BACKEND, DISTRICTS_CACHE_TTL
 import unicodedata
 
-# Veritabanı bağlantısı
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-db = SessionLocal()
+SEED_NAME = "districts"
+# pg_advisory_xact_lock anahtarı (uygulamaya özgü sabit bir sayı)
+SEED_LOCK_KEY = 7_318_001
 
 def slugify(value):
     value = unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii')
@@ -62,24 +69,95 @@ districts = [
     {"name": "Üsküdar", "region": DistrictRegion.ASIA}
 ]
 
-def seed_districts():
+def _district_rows():
+    return [
+        {"name": district_data["name"], "region": district_data["region"], "slug": slugify(district_data["name"])}
+        for district_data in districts
+    ]
+
+def content_hash(rows) -> str:
+    """Seed verisinin özeti; değişmediyse seed tamamen atlanır."""
+    payload = json.dumps(
+        sorted((row["slug"], row["name"], row["region"].value) for row in rows),
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def seed_districts(db: Session = None) -> bool:
+    """
+    İlçeleri slug'a göre toplu upsert eder. Mevcut kayıtların id'leri korunur,
+    listede olmayan ilçelere dokunulmaz. Seed verisinin özeti seed_state
+    tablosundakiyle aynıysa hiçbir şey yazılmaz. PostgreSQL'de advisory lock
+    alınır; aynı anda başlayan worker'lardan yalnızca biri seed eder.
+    Veri yazıldıysa True döner.
+    """
+    own_session = db is None
+    db = db or SessionLocal()
     try:
-        # Mevcut ilçeleri temizle
-        db.query(District).delete()
-        
-        # Yeni ilçeleri ekle
-        for district_data in districts:
-            slug = slugify(district_data['name'])
-            district = District(name=district_data['name'], region=district_data['region'], slug=slug)
-            db.add(district)
-        
+        rows = _district_rows()
+        digest = content_hash(rows)
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            # Transaction sonunda kendiliğinden bırakılır
+            db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SEED_LOCK_KEY})
+
+        state = db.get(SeedState, SEED_NAME)
+        if state and state.content_hash == digest:
+            db.rollback()
+            print("İlçeler güncel, seed atlandı")
+            return False
+
+        # Adı veya yakası değişecek mevcut ilçeler; postların snapshot'larına gömülüler
+        current = {slug: (district_id, name, region) for district_id, slug, name, region in db.execute(
+            select(District.id, District.slug, District.name, District.region)
+        )}
+        changed = [
+            current[row["slug"]][0] for row in rows
+            if row["slug"] in current and current[row["slug"]][1:] != (row["name"], row["region"])
+        ]
+
+        insert = pg_insert if dialect == "postgresql" else sqlite_insert
+        stmt = insert(District).values(rows)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[District.slug],
+            set_={"name": stmt.excluded.name, "region": stmt.excluded.region}
+        ))
+        if changed:
+            # Aksi halde detay uçları post yeniden onaylanana kadar eski ilçe adını döndürür
+            sync_snapshots_sync(db, db.scalars(published_post_ids(district_ids=changed)).all())
+        if state:
+            state.content_hash = digest
+        else:
+            db.add(SeedState(name=SEED_NAME, content_hash=digest))
         db.commit()
-        print("İlçeler başarıyla eklendi!")
-    except Exception as e:
+        invalidate_district_caches()
+        print(f"{len(rows)} ilçe eklendi/güncellendi")
+        return True
+    except Exception:
         db.rollback()
-        print(f"Hata oluştu: {str(e)}")
+        raise
     finally:
-        db.close()
+        if own_session:
+            db.close()
+
+def invalidate_district_caches() -> None:
+    """
+    İlçe listesini ve ilçe gömülü post yanıtlarını önbellekten siler. Redis
+    backend'inde çalışan tüm worker'lar etkilenir; bellek backend'i süreç
+    içi olduğu için deploy adımı olarak ayrı süreçte çalışırken sadece kendi
+    önbelleğini temizler.
+    """
+    cache.invalidate_sync("districts", "posts")
+    if CACHE_BACKEND != "redis":
+        print(
+            "Uyarı: CACHE_BACKEND=memory; çalışan worker'ların önbelleği temizlenmedi. "
+            f"/districts/ yanıtları {DISTRICTS_CACHE_TTL} sn'ye kadar eski kalabilir, "
+            "hemen görünmesi için uygulamayı yeniden başlatın."
+        )
 
 if __name__ == "__main__":
-    seed_districts() 
\ No newline at end of file
+    # CLI olarak çalışırken ilişkilerin çözülebilmesi için tüm modeller yüklenmeli
+    from models.post import Post
+    from models.user import User
+    from models.category import Category
+    seed_districts()
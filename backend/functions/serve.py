@@ -0,0 +1,118 @@
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def profile_imports(module: str = "main") -> List[Tuple[int, int, str]]:
+    """
+    Modülü temiz bir süreçte `python -X importtime` ile içe aktarır ve
+    her modül için (kendi süresi, kümülatif süre, ad) mikro saniye cinsinden döndürür.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings.append((int(self_us), int(cumulative_us), name.strip()))
+    return timings
+
+
+async def _timed(label: str, func, results: list):
+    started = time.perf_counter()
+    try:
+        result = func()
+        if asyncio.iscoroutine(result):
+            await result
+        status = "ok"
+    except Exception as e:
+        status = f"hata: {e}"
+    results.append((label, time.perf_counter() - started, status))
+
+
+def profile_initialisation() -> List[Tuple[str, float, str]]:
+    """
+    Uygulamayı bu süreçte yükler ve açılış adımlarını tek tek ölçer:
+    import, startup handler'ları, ilk DB bağlantısı, şema kontrolü, Cloudinary.
+    """
+    results = []
+    started = time.perf_counter()
+    try:
+        import main
+    except Exception as e:
+        return [("import main", time.perf_counter() - started, f"hata: {e}")]
+    results.append(("import main", time.perf_counter() - started, "ok"))
+
+    from database import AsyncSessionLocal, async_engine
+    from services.health import check_database, missing_tables
+    from services.cloudinary_service import get_uploader
+
+    async def with_session(check):
+        async with AsyncSessionLocal() as db:
+            return await check(db)
+
+    async def run_steps():
+        # asyncpg bağlantıları açıldıkları event loop'a bağlı; tüm adımlar tek
+        # loop'ta çalışır ve havuz, uvicorn kendi loop'unu açmadan önce boşaltılır.
+        try:
+            await _timed("startup handlers", main.app.router.startup, results)
+            await _timed("ilk DB bağlantısı", lambda: with_session(check_database), results)
+            await _timed("şema kontrolü", lambda: with_session(missing_tables), results)
+            await _timed("Cloudinary istemcisi", get_uploader, results)
+        finally:
+            await async_engine.dispose()
+
+    asyncio.run(run_steps())
+    return results
+
+
+def print_report(top: int) -> None:
+    imports = profile_imports()
+    total_us = max((cumulative for _, cumulative, name in imports if name == "main"), default=0)
+    print(f"\nImport süreleri (toplam {total_us / 1000:.1f} ms, en yavaş {top} modül, kendi süresine göre)")
+    print(f"{'kendi ms':>10} {'kümülatif ms':>13}  modül")
+    for self_us, cumulative_us, name in sorted(imports, reverse=True)[:top]:
+        print(f"{self_us / 1000:>10.1f} {cumulative_us / 1000:>13.1f}  {name}")
+
+    print("\nUygulama modülleri (kümülatif)")
+    local = {entry.split(".")[0] for entry in os.listdir(BACKEND_DIR)}
+    own = [item for item in imports if item[2].split(".")[0] in local]
+    for self_us, cumulative_us, name in sorted(own, key=lambda item: -item[1])[:top]:
+        print(f"{self_us / 1000:>10.1f} {cumulative_us / 1000:>13.1f}  {name}")
+
+    print("\nBaşlatma adımları")
+    for label, seconds, status in profile_initialisation():
+        print(f"{seconds * 1000:>10.1f} ms  {label} ({status})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="API'yi uvicorn ile başlatır")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Modül bazında import ve başlatma sürelerini raporla")
+    parser.add_argument("--top", type=int, default=25, help="Raporda gösterilecek modül sayısı")
+    parser.add_argument("--no-serve", action="store_true", help="Rapordan sonra sunucuyu başlatma")
+    args = parser.parse_args()
+    from config import CACHE_BACKEND
+    if args.workers > 1 and CACHE_BACKEND != "redis":
+        # Bellek önbelleği süreç içi; bir worker'daki invalidation diğerlerine ulaşmaz
+        parser.error("--workers > 1 için CACHE_BACKEND=redis gerekli")
+
+    if args.profile_startup:
+        print_report(args.top)
+    if not args.no_serve:
+        import uvicorn
+        uvicorn.run("main:app", host=args.host, port=args.port, workers=args.workers)
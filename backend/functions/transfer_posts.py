@@ -0,0 +1,73 @@
+import argparse
+import asyncio
+import sys
+import time
+from sqlalchemy import select
+from database import AsyncSessionLocal
+from models.post import PostStatus
+from models.user import User
+from models.category import Category
+from models.district import District
+from services.post_transfer import PostImporter, IMPORT_BATCH_SIZE, export_posts
+
+
+async def export_to(path: str, status: PostStatus = None) -> None:
+    """
+    Postları NDJSON dosyasına (veya '-' ile stdout'a) yazar.
+    """
+    output = sys.stdout.buffer if path == "-" else open(path, "wb")
+    try:
+        async for chunk in export_posts(status):
+            output.write(chunk)
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+
+
+async def _file_lines(path: str):
+    # Satırlar bytes okunur; UTF-8 olmayanlar içe aktarma raporuna yazılır
+    with (sys.stdin.buffer if path == "-" else open(path, "rb")) as source:
+        for line in source:
+            yield line
+
+
+async def import_from(path: str, author_email: str, batch_size: int) -> None:
+    """
+    NDJSON dosyasındaki postları içe aktarır. Yazarı bulunamayan kayıtlar
+    author_email kullanıcısına atanır.
+    """
+    started = time.perf_counter()
+
+    def progress(report):
+        rate = report.processed / max(time.perf_counter() - started, 1e-9)
+        print(f"{report.processed} satır işlendi, {report.inserted} eklendi, {report.failed} hatalı ({rate:.0f} satır/sn)",
+              file=sys.stderr)
+
+    async with AsyncSessionLocal() as db:
+        author_id = await db.scalar(select(User.id).where(User.email == author_email))
+        if author_id is None:
+            raise SystemExit(f"Kullanıcı bulunamadı: {author_email}")
+        report = await PostImporter(db, author_id, batch_size, progress).run(_file_lines(path))
+
+    print(f"İçe aktarma tamamlandı: {report.inserted} post eklendi, {report.failed} hatalı, "
+          f"{report.renamed_slugs} slug yeniden adlandırıldı", file=sys.stderr)
+    for error in report.errors:
+        print(f"  satır {error['line']}: {error['error']}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Postları NDJSON olarak dışa/içe aktarır")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export_parser = commands.add_parser("export")
+    export_parser.add_argument("path", help="Çıktı dosyası ('-' stdout)")
+    export_parser.add_argument("--status", type=PostStatus, choices=list(PostStatus))
+    import_parser = commands.add_parser("import")
+    import_parser.add_argument("path", help="NDJSON dosyası ('-' stdin)")
+    import_parser.add_argument("--author-email", required=True, help="Yazarı eşlenemeyen postların sahibi")
+    import_parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    if args.command == "export":
+        asyncio.run(export_to(args.path, args.status))
+    else:
+        asyncio.run(import_from(args.path, args.author_email, args.batch_size))
@@ -1,14 +1,21 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from database import engine, Base
-from routers import auth, categories, posts, districts
+from routers import auth, categories, posts, districts, admin, health
 from routers import users as users_router
 from functions.seed_districts import seed_districts
+from middlewares.body_size import BodySizeLimitMiddleware
+from middlewares.compression import CompressionMiddleware
+from services.serializers import FastJSONResponse
+from config import UPLOAD_MAX_REQUEST_SIZE, SEED_ON_STARTUP, CREATE_TABLES_ON_STARTUP, JSON_BACKEND
 
-# Veritabanı tablolarını oluştur
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI(title="istancool Blog API", description="Blog sitesi için REST API")
+app = FastAPI(
+    title="istancool Blog API",
+    description="Blog sitesi için REST API",
+    # JSON_BACKEND=orjson ile tüm JSON yanıtları orjson ile yazılır
+    default_response_class=FastJSONResponse if JSON_BACKEND == "orjson" else JSONResponse
+)
 
 # CORS ayarları
 origins = [
@@ -18,6 +25,14 @@ origins = [
     "https://www.istan.cool",  # Backend URL'i
 ]
 
+# Eşiği aşan JSON/metin yanıtlarını sıkıştır. En içte; önbellekten gelen
+# hazır sıkıştırılmış gövdeler Content-Encoding taşıdığı için atlanır.
+app.add_middleware(CompressionMiddleware)
+
+# Büyük istekleri gövde okunmadan reddet (CORS'un içinde kalsın ki
+# 413 yanıtları da CORS başlıklarını alsın)
+app.add_middleware(BodySizeLimitMiddleware, max_body_size=UPLOAD_MAX_REQUEST_SIZE)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -32,11 +47,19 @@ app.include_router(categories.router)
 app.include_router(posts.router)
 app.include_router(districts.router)
 app.include_router(users_router.router)
+app.include_router(admin.router)
+app.include_router(health.router)
 
 @app.get("/")
 async def root():
     return {"message": "Blog API'ye Hoş Geldiniz!"}
 @app.on_event("startup")
 def on_startup():
-    seed_districts()
+    # Import sırasında veritabanına gidilmez. Şema ve seed varsayılan olarak
+    # açılışta hazırlanır; deploy adımında yapılıyorsa (alembic upgrade,
+    # python -m functions.seed_districts) ikisi de kapatılarak açılış hızlanır.
+    if CREATE_TABLES_ON_STARTUP:
+        Base.metadata.create_all(bind=engine)
+    if SEED_ON_STARTUP:
+        seed_districts()
 
@@ -0,0 +1,76 @@
+import json
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class BodySizeLimitMiddleware:
+    """
+    İstek gövdesini belleğe veya diske alınmadan önce sınırlar. Content-Length
+    başlığı limiti aşıyorsa istek hemen reddedilir; başlık yoksa (chunked)
+    okunan baytlar sayılır ve limit aşıldığı anda 413 yanıtı buradan
+    gönderilir. Uygulamaya istemci bağlantıyı kesmiş gibi davranılır ve
+    sonrasında ürettiği yanıt atılır; form ayrıştırmasının hatayı 400'e
+    çevirmesine fırsat kalmaz.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body_size:
+            await self._reject(send)
+            return
+
+        received = 0
+        response_started = False
+        exceeded = False
+        rejected = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, exceeded, rejected
+            if exceeded:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    exceeded = True
+                    # Uygulama yanıta başladıysa 413 gönderilemez; sadece okuma kesilir
+                    if not response_started:
+                        rejected = True
+                        await self._reject(send)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            if rejected:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            # Yanıt zaten gönderildi; bağlantı kopması sonrası oluşan hatalar önemsiz
+            if not rejected:
+                raise
+
+    async def _reject(self, send: Send) -> None:
+        body = json.dumps({"detail": f"İstek gövdesi {self.max_body_size} baytı aşamaz"}, ensure_ascii=False).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,94 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from services.compression import choose_encoding, compress, is_compressible, streaming_compressor, weak_etag
+
+
+class CompressionMiddleware:
+    """
+    İzin verilen içerik tiplerindeki ve eşik boyutunu aşan yanıtları istemcinin
+    kabul ettiği kodlamayla (br/gzip) sıkıştırır. Zaten Content-Encoding
+    taşıyan yanıtlara (önbellekteki hazır sıkıştırılmış gövdeler) dokunmaz;
+    akış (streaming) yanıtları parça parça sıkıştırılır.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = None
+        if scope["method"] != "HEAD":
+            encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        await self.app(scope, receive, _CompressionResponder(send, encoding).send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding):
+        self._send = send
+        self.encoding = encoding
+        self.start: Message = None
+        self.compressor = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Gövdenin ilk parçasını görmeden karar verilemez
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self.start is not None:
+            await self._first_body(message)
+        elif self.compressor is not None:
+            await self._stream(message)
+        else:
+            await self._send(message)
+
+    async def _first_body(self, message: Message) -> None:
+        start, self.start = self.start, None
+        headers = MutableHeaders(raw=start["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        # Akış yanıtlarının toplam boyutu baştan bilinmez, eşik kontrolü yapılmaz
+        size = None if more_body else len(body)
+        if start["status"] in (204, 304) or "content-encoding" in headers \
+                or not is_compressible(headers.get("content-type"), size):
+            await self._send(start)
+            await self._send(message)
+            return
+
+        if "accept-encoding" not in headers.get("vary", "").lower():
+            headers.add_vary_header("Accept-Encoding")
+        if self.encoding is None:
+            await self._send(start)
+            await self._send(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        if "etag" in headers:
+            headers["ETag"] = weak_etag(headers["etag"])
+
+        if not more_body:
+            body = compress(body, self.encoding)
+            headers["Content-Length"] = str(len(body))
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        del headers["Content-Length"]
+        self.compressor = streaming_compressor(self.encoding)
+        await self._send(start)
+        await self._stream(message)
+
+    async def _stream(self, message: Message) -> None:
+        more_body = message.get("more_body", False)
+        chunk = self.compressor.compress(message.get("body", b""))
+        if not more_body:
+            chunk += self.compressor.flush()
+        # Boş parçalar da iletilir ki istemci akışın sürdüğünü görsün
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from database import Base
 
 class Category(Base):
     __tablename__ = "categories"
+    __table_args__ = (
+        # Slug önek (LIKE 'slug-%') aramaları
+        Index("ix_categories_slug_pattern", "slug", postgresql_ops={"slug": "text_pattern_ops"}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, index=True)
@@ -1,6 +1,7 @@
-from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey, Text, Enum, JSON
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey, Text, Enum, JSON, Index, Float
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 import enum
 from database import Base
 from datetime import datetime
@@ -12,18 +13,29 @@ class PostStatus(str, enum.Enum):
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # GET /posts/ keyset pagination sırası
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        # Tam metin arama
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+        # Harita bbox sorguları: SQLite'ta btree yedeği, Postgres'te aşağıdaki GiST index'i
+        Index("ix_posts_latitude_longitude", "latitude", "longitude").ddl_if(dialect="sqlite"),
+        # Slug önek (LIKE 'slug-%') aramaları
+        Index("ix_posts_slug_pattern", "slug", postgresql_ops={"slug": "text_pattern_ops"}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
     slug = Column(String, unique=True, index=True)
-    content = Column(String, nullable=True)
+    # Ağır kolonlar; liste sorgularında yüklenmez, detayda undefer_group("body") ile istenir
+    content = deferred(Column(String, nullable=True), group="body")
     cover_image = Column(String, nullable=True)
     status = Column(Enum(PostStatus), default=PostStatus.PENDING)
     is_active = Column(Boolean, default=True)
     is_featured = Column(Boolean, default=False)
     featured_order = Column(Integer, index=True, nullable=True)
-    latitude = Column(String, nullable=True)
-    longitude = Column(String, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
     
     # İlişkiler
     category_id = Column(Integer, ForeignKey("categories.id"))
@@ -37,4 +49,19 @@ class Post(Base):
     
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    blocks = Column(JSON) 
\ No newline at end of file
+    blocks = deferred(Column(JSON), group="body")
+    # Yazma sırasında bloklardan hesaplanan özet alanları (services/post_summary)
+    summary = Column(String, nullable=True)
+    first_image = Column(String, nullable=True)
+    reading_time = Column(Integer, nullable=True)
+
+    # Başlık, içerik ve blok metninden üretilen arama vektörü (services/search_service)
+    # Sadece sorgu filtrelerinde kullanılır, hiçbir zaman okunmaz
+    search_vector = deferred(Column(TSVECTOR().with_variant(Text, "sqlite"), nullable=True))
+
+
+# Harita bbox sorguları (services/map_service) "point(longitude, latitude) <@ box"
+# biçiminde yazılır ki bu GiST index'i iki eksende birden kullanılsın
+Index(
+    "ix_posts_location", func.point(Post.longitude, Post.latitude), postgresql_using="gist"
+).ddl_if(dialect="postgresql")
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, LargeBinary
+from database import Base
+
+class PostSnapshot(Base):
+    """
+    Onaylı bir postun yayınlanmış hali: kategori, yazar ve ilçesi gömülü,
+    PostSchema ile serileştirilmiş son JSON gövdesi. Onay ve onaylı posta
+    yapılan her değişiklikte yeniden yazılır (services/post_snapshot);
+    herkese açık detay okumaları bu tablodan tek satır okur.
+    """
+    __tablename__ = "post_snapshots"
+
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    # posts.slug benzersiz; burada sadece arama için index
+    slug = Column(String, index=True, nullable=False)
+    version = Column(Integer, nullable=False, default=1)
+    body = Column(LargeBinary, nullable=False)
+    etag = Column(String(66), nullable=False)
+    last_modified = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
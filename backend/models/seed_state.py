@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+from database import Base
+
+class SeedState(Base):
+    """Seed edilen verinin son uygulanan özetini tutar."""
+    __tablename__ = "seed_state"
+
+    name = Column(String(64), primary_key=True)
+    content_hash = Column(String(64), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String
+from database import Base
+
+class StatCounter(Base):
+    """
+    Admin istatistikleri için artımlı tutulan sayaçlar. Post sayaçları
+    (dimension: posts/category/district/author) durum bazındadır; "posts"
+    genel toplamdır. Kullanıcı ve kategori sayaçlarında (dimension:
+    users/categories) status "all"dır. dimension_id 0, toplamı veya atanmamış
+    (ör. ilçesiz) kayıtları ifade eder.
+    """
+    __tablename__ = "stat_counters"
+
+    dimension = Column(String(16), primary_key=True)
+    dimension_id = Column(Integer, primary_key=True)
+    status = Column(String(16), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from services.principal_cache import Principal
+from dependencies import get_current_admin
+from services.cache import cache
+from database import engine, async_engine, pool_status, get_async_db
+from services.stats_service import read_stats
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"]
+)
+
+@router.get("/cache")
+def get_cache_stats(current_admin: Principal = Depends(get_current_admin)):
+    """Önbellek isabet/ıska sayılarını ad alanı bazında döndürür."""
+    return cache.stats()
+
+@router.post("/cache/clear")
+def clear_cache(current_admin: Principal = Depends(get_current_admin)):
+    cache.clear()
+    return {"message": "Cache cleared"}
+
+@router.get("/db-pool")
+def get_db_pool_stats(current_admin: Principal = Depends(get_current_admin)):
+    """Sync ve async engine havuzlarının anlık durumunu döndürür."""
+    return {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.pool),
+    }
+
+@router.get("/stats")
+async def get_stats(
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """
+    Dashboard için toplamlar ve post kırılımları (durum, kategori, ilçe, yazar).
+    Artımlı tutulan sayaçlardan tek sorguda okunur.
+    """
+    return await read_stats(db)
@@ -1,28 +1,33 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
-from typing import Optional
 from pydantic import BaseModel
 
-from database import get_db
+from database import get_async_db
 from models.user import User
-from schemas.user import UserCreate, User as UserSchema, PasswordReset, TokenResponse
+from schemas.user import UserCreate, User as UserSchema, PasswordReset, TokenResponse, RefreshRequest, LogoutRequest
 from functions.auth_functions import (
-    verify_password,
-    get_password_hash,
+    hash_password,
     create_access_token,
     authenticate_user,
     create_reset_token,
     verify_reset_token,
     verify_token,
-    get_user_by_email
+    get_user_by_email_async
 )
 from functions.oauth_functions import handle_google_login
-from dotenv import load_dotenv
-import os
-
-load_dotenv()
+from services.principal_cache import token_claims
+from config import ACCESS_TOKEN_EXPIRE_MINUTES
+from services.stats_service import apply_deltas, entity_delta
+from services.token_service import (
+    issue_refresh_token,
+    rotate_refresh_token,
+    revoke_refresh_token,
+    revoke_user_refresh_tokens,
+    revoke_access_token,
+    is_access_token_revoked,
+)
 
 router = APIRouter(
     prefix="/auth",
@@ -30,19 +35,18 @@ router = APIRouter(
 )
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
 
 class LoginRequest(BaseModel):
     email: str
     password: str
 
 @router.post("/register", response_model=UserSchema)
-def register(user: UserCreate, db: Session = Depends(get_db)):
-    db_user = db.query(User).filter(User.email == user.email).first()
+async def register(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    db_user = await get_user_by_email_async(db, user.email)
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await hash_password(user.password)
     db_user = User(
         email=user.email,
         first_name=user.first_name,
@@ -51,13 +55,14 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
         role="user"  # Varsayılan rol ataması
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await apply_deltas(db, entity_delta("users", 1))
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 @router.post("/login", response_model=TokenResponse)
-async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
-    user = authenticate_user(db, login_data.email, login_data.password)
+async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_async_db)):
+    user = await authenticate_user(db, login_data.email, login_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -65,14 +70,36 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    refresh_token, _ = await issue_refresh_token(db, user.id)
+    await db.commit()
+    return _token_response(user, refresh_token)
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(refresh_data: RefreshRequest, db: AsyncSession = Depends(get_async_db)):
+    """Parola ve bcrypt olmadan yeni access token verir; yenileme token'ı döndürülür."""
+    user, refresh_token = await rotate_refresh_token(db, refresh_data.refresh_token)
+    return _token_response(user, refresh_token)
+
+@router.post("/logout", status_code=204)
+async def logout(
+    logout_data: LogoutRequest,
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+):
+    revoke_access_token(verify_token(token))
+    if logout_data.refresh_token:
+        await revoke_refresh_token(db, logout_data.refresh_token)
+
+def _token_response(user: User, refresh_token: str) -> dict:
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data=token_claims(user), expires_delta=access_token_expires
     )
     
     return {
         "access_token": access_token,
         "token_type": "bearer",
+        "refresh_token": refresh_token,
         "user": {
             "id": user.id,
             "email": user.email,
@@ -86,8 +113,8 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
     }
 
 @router.post("/forgot-password")
-async def forgot_password(email: str, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == email).first()
+async def forgot_password(email: str, db: AsyncSession = Depends(get_async_db)):
+    user = await get_user_by_email_async(db, email)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -96,27 +123,29 @@ async def forgot_password(email: str, db: Session = Depends(get_db)):
     return {"message": "Password reset email sent"}
 
 @router.post("/reset-password")
-async def reset_password(reset_data: PasswordReset, db: Session = Depends(get_db)):
+async def reset_password(reset_data: PasswordReset, db: AsyncSession = Depends(get_async_db)):
     email = verify_reset_token(reset_data.token)
-    user = db.query(User).filter(User.email == email).first()
+    user = await get_user_by_email_async(db, email)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    user.hashed_password = get_password_hash(reset_data.new_password)
-    db.commit()
+    user.hashed_password = await hash_password(reset_data.new_password)
+    # Daha önce verilmiş (çalınmış olabilecek) yenileme token'ları da geçersiz olur
+    await revoke_user_refresh_tokens(db, user.id)
+    await db.commit()
     return {"message": "Password updated successfully"}
 
 @router.post("/google-login")
-async def google_login(token: str, db: Session = Depends(get_db)):
+async def google_login(token: str, db: AsyncSession = Depends(get_async_db)):
     return await handle_google_login(db, token)
 
 @router.get("/me", response_model=UserSchema)
-def get_me(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+async def get_me(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)):
     payload = verify_token(token)
     email = payload.get("sub")
-    if not email:
+    if not email or is_access_token_revoked(payload):
         raise HTTPException(status_code=401, detail="Geçersiz token")
-    user = get_user_by_email(db, email)
+    user = await get_user_by_email_async(db, email)
     if not user:
         raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
     return user 
\ No newline at end of file
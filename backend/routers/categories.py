@@ -1,12 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from database import get_db
+from database import get_db, get_async_db
 from models.category import Category
-from models.user import User
+from services.principal_cache import Principal
 from schemas.category import CategoryCreate, CategoryUpdate, Category as CategorySchema
 from dependencies import get_current_admin
-from services.slug_service import create_slug
+from services.slug_service import save_with_slug
+from services.stats_service import apply_deltas, entity_delta
+from services.cache import cache, cached_json_response
+from services.serializers import serialize
+from services.post_snapshot import published_post_ids, sync_snapshots
+from services.http_cache import version_etag, latest, is_not_modified, not_modified_response, conditional_response
+from config import CACHE_CONTROL
 
 router = APIRouter(
     prefix="/categories",
@@ -16,41 +24,56 @@ router = APIRouter(
 @router.post("/", response_model=CategorySchema)
 async def create_category(
     category: CategoryCreate,
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Principal = Depends(get_current_admin)
 ):
-    slug = create_slug(category.name, db)
-    db_category_by_slug = db.query(Category).filter(Category.slug == slug).first()
-    if db_category_by_slug:
-        raise HTTPException(status_code=400, detail="Category with this slug already exists")
-    
-    db_category_by_name = db.query(Category).filter(Category.name == category.name).first()
+    db_category_by_name = await db.scalar(select(Category).where(Category.name == category.name))
     if db_category_by_name:
         raise HTTPException(status_code=400, detail="Category with this name already exists")
 
-    db_category = Category(**category.model_dump(), slug=slug)
-    db.add(db_category)
-    db.commit()
-    db.refresh(db_category)
+    db_category = Category(**category.model_dump())
+    await save_with_slug(db, db_category, category.name)
+    await apply_deltas(db, entity_delta("categories", 1))
+    await db.commit()
+    await db.refresh(db_category)
+    await cache.invalidate("categories")
     return db_category
 
 @router.get("/homepage", response_model=List[CategorySchema])
-async def get_homepage_categories(db: Session = Depends(get_db)):
+async def get_homepage_categories(request: Request, db: AsyncSession = Depends(get_async_db)):
     """Anasayfada gösterilecek aktif kategorileri getirir."""
-    categories = db.query(Category).filter(
-        Category.is_active == True,
-        Category.show_on_homepage == True
-    ).all()
-    return categories
+    async def load():
+        categories = await db.scalars(select(Category).where(
+            Category.is_active == True,
+            Category.show_on_homepage == True
+        ))
+        return [CategorySchema.model_validate(category) for category in categories]
+
+    return await cached_json_response(
+        request, "categories:homepage", load, "categories",
+        tags=["categories"],
+        last_modified=lambda categories: latest(category.updated_at or category.created_at for category in categories)
+    )
 
 @router.get("/", response_model=List[CategorySchema])
 async def get_categories(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    categories = db.query(Category).offset(skip).limit(limit).all()
-    return categories
+    # Tablonun sürümü: satır sayısı ve en son değişiklik zamanı
+    count, last_change = (await db.execute(select(
+        func.count(Category.id), func.max(func.coalesce(Category.updated_at, Category.created_at))
+    ))).one()
+    etag = version_etag("categories", skip, limit, count, last_change)
+    last_modified = latest([last_change])
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified, CACHE_CONTROL["categories"])
+
+    categories = await db.scalars(select(Category).order_by(Category.id).offset(skip).limit(limit))
+    body = serialize(CategorySchema, categories.all(), many=True)
+    return conditional_response(request, body, "categories", etag=etag, last_modified=last_modified)
 
 @router.get("/count")
 def get_categories_count(
@@ -62,81 +85,95 @@ def get_categories_count(
 @router.get("/{category_id}", response_model=CategorySchema)
 async def get_category(
     category_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    category = db.query(Category).filter(Category.id == category_id).first()
+    category = await db.scalar(select(Category).where(Category.id == category_id))
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
-    return category
+
+    last_modified = latest([category.updated_at or category.created_at])
+    etag = version_etag("category", category.id, last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified, CACHE_CONTROL["categories"])
+    body = serialize(CategorySchema, category)
+    return conditional_response(request, body, "categories", etag=etag, last_modified=last_modified)
 
 @router.put("/{category_id}", response_model=CategorySchema)
 async def update_category(
     category_id: int,
     category_update: CategoryUpdate,
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Principal = Depends(get_current_admin)
 ):
-    db_category = db.query(Category).filter(Category.id == category_id).first()
+    db_category = await db.scalar(select(Category).where(Category.id == category_id))
     if not db_category:
         raise HTTPException(status_code=404, detail="Category not found")
     
     update_data = category_update.model_dump(exclude_unset=True)
 
     if 'name' in update_data and update_data['name'] != db_category.name:
-        new_slug = create_slug(update_data['name'], db)
-        existing_category = db.query(Category).filter(Category.slug == new_slug, Category.id != category_id).first()
-        if existing_category:
-            raise HTTPException(status_code=400, detail="A category with the new generated slug already exists.")
-        db_category.slug = new_slug
+        await save_with_slug(db, db_category, update_data['name'])
 
     for field, value in update_data.items():
         setattr(db_category, field, value)
+    # Postlara gömülü kategori kopyaları da yenilenir
+    await sync_snapshots(db, await db.scalars(published_post_ids(category_id=category_id)))
     
-    db.commit()
-    db.refresh(db_category)
+    await db.commit()
+    await db.refresh(db_category)
+    await cache.invalidate("categories", "posts", f"category:{category_id}")
     return db_category
 
 @router.delete("/{category_id}")
 async def delete_category(
     category_id: int,
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Principal = Depends(get_current_admin)
 ):
-    db_category = db.query(Category).filter(Category.id == category_id).first()
+    db_category = await db.scalar(select(Category).where(Category.id == category_id))
     if not db_category:
         raise HTTPException(status_code=404, detail="Category not found")
     
-    db.delete(db_category)
-    db.commit()
+    post_ids = (await db.scalars(published_post_ids(category_id=category_id))).all()
+    await apply_deltas(db, entity_delta("categories", -1))
+    await db.delete(db_category)
+    await sync_snapshots(db, post_ids)
+    await db.commit()
+    await cache.invalidate("categories", "posts", f"category:{category_id}")
     return {"message": "Category deleted successfully"}
 
 @router.patch("/{category_id}/toggle-homepage", response_model=CategorySchema)
 async def toggle_category_homepage_status(
     category_id: int,
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Principal = Depends(get_current_admin)
 ):
     """Kategorinin anasayfada gösterilip gösterilmeyeceğini değiştirir."""
-    db_category = db.query(Category).filter(Category.id == category_id).first()
+    db_category = await db.scalar(select(Category).where(Category.id == category_id))
     if not db_category:
         raise HTTPException(status_code=404, detail="Category not found")
 
     db_category.show_on_homepage = not db_category.show_on_homepage
-    db.commit()
-    db.refresh(db_category)
+    await sync_snapshots(db, await db.scalars(published_post_ids(category_id=category_id)))
+    await db.commit()
+    await db.refresh(db_category)
+    await cache.invalidate("categories", "posts", f"category:{category_id}")
     return db_category
 
 @router.patch("/{category_id}/toggle-status")
 async def toggle_category_status(
     category_id: int,
-    db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Principal = Depends(get_current_admin)
 ):
-    db_category = db.query(Category).filter(Category.id == category_id).first()
+    db_category = await db.scalar(select(Category).where(Category.id == category_id))
     if not db_category:
         raise HTTPException(status_code=404, detail="Category not found")
     
     db_category.is_active = not db_category.is_active
-    db.commit()
-    db.refresh(db_category)
+    await sync_snapshots(db, await db.scalars(published_post_ids(category_id=category_id)))
+    await db.commit()
+    await db.refresh(db_category)
+    await cache.invalidate("categories", "posts", f"category:{category_id}")
     return {"message": f"Category status changed to {'active' if db_category.is_active else 'inactive'}"} 
\ No newline at end of file
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from database import get_db
+from database import get_async_db
 from models.district import District, DistrictRegion
 from schemas.district import District as DistrictSchema
+from services.cache import cached_json_response
+from config import DISTRICTS_CACHE_TTL
 
 router = APIRouter(
     prefix="/districts",
@@ -12,23 +15,36 @@ router = APIRouter(
 
 @router.get("/", response_model=List[DistrictSchema])
 async def get_districts(
+    request: Request,
     region: DistrictRegion = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    query = db.query(District)
-    
-    if region:
-        query = query.filter(District.region == region)
-    
-    districts = query.all()
-    return districts
+    async def load():
+        query = select(District)
+        
+        if region:
+            query = query.where(District.region == region)
+        
+        return [DistrictSchema.model_validate(district) for district in await db.scalars(query)]
+
+    return await cached_json_response(
+        request, f"districts:{region.value if region else 'all'}", load, "districts",
+        tags=["districts"], ttl=DISTRICTS_CACHE_TTL
+    )
 
 @router.get("/{district_id}", response_model=DistrictSchema)
 async def get_district(
     district_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    district = db.query(District).filter(District.id == district_id).first()
-    if not district:
-        raise HTTPException(status_code=404, detail="İlçe bulunamadı")
-    return district 
\ No newline at end of file
+    async def load():
+        district = await db.get(District, district_id)
+        if not district:
+            raise HTTPException(status_code=404, detail="İlçe bulunamadı")
+        return DistrictSchema.model_validate(district)
+
+    return await cached_json_response(
+        request, f"districts:id:{district_id}", load, "districts",
+        tags=["districts"], ttl=DISTRICTS_CACHE_TTL
+    ) 
\ No newline at end of file
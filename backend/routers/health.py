@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db
+from services.health import readiness
+
+router = APIRouter(tags=["health"])
+
+@router.get("/health")
+async def health():
+    """Süreç ayakta mı (liveness). Hiçbir dış bağımlılığa gitmez."""
+    return {"status": "ok"}
+
+@router.get("/ready")
+async def ready(db: AsyncSession = Depends(get_async_db)):
+    """
+    Trafik almaya hazır mı (readiness): veritabanı erişimi ve tabloların
+    varlığı kontrol edilir. Hazır değilse 503 döner.
+    """
+    checks = await readiness(db)
+    is_ready = all(check["ok"] for check in checks.values())
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={"status": "ready" if is_ready else "not_ready", "checks": checks}
+    )
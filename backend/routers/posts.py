@@ -1,16 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Form, Request
-from sqlalchemy.orm import Session, joinedload
+from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Form, Request, Query
+from sqlalchemy import tuple_, select, update, case, or_
+from sqlalchemy.orm import Session, joinedload, contains_eager, load_only, undefer_group
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from database import get_db
+from database import get_db, get_async_db
 from models.post import Post, PostStatus
 from models.user import User, UserRole
+from services.principal_cache import Principal
 from models.category import Category
 from models.district import District
-from schemas.post import PostCreate, PostUpdate, Post as PostSchema, FeaturedPostSchema
-from schemas.map import MapPost
+from models.post_snapshot import PostSnapshot
+from schemas.post import PostUpdate, Post as PostSchema, FeaturedPostSchema, PostListItem, PostListPage, PostSearchResult, PostBulkAction, PostBulkRequest, PostBulkResponse, PostImportReport
+from schemas.map import MapPost, MapResponse
 from dependencies import get_current_active_user, get_current_admin, get_current_editor_or_admin
-from services.cloudinary_service import upload_image
-from services.slug_service import create_slug
+from services.cloudinary_service import upload_images, ImageUploadError
+from services.image_inspect import validate_image
+from services.slug_service import save_with_slug
+from services.cache import cache, cached_json_response
+from services.serializers import FastJSONResponse, dumps, serialize
+from services.http_cache import version_etag, latest, is_not_modified, not_modified_response, conditional_response
+from config import CACHE_CONTROL
+from services.pagination import encode_cursor, decode_cursor
+from services.map_service import parse_bbox, parse_coordinate, get_map_clusters
+from services.post_summary import refresh_summary
+from services.stats_service import apply_deltas, post_deltas, post_key
+from services.post_fields import list_options, parse_fields, project
+from services.post_snapshot import snapshot_response, sync_snapshots
+from services.post_transfer import PostImporter, export_posts, upload_lines
+from services.search_service import apply_search, search_rank, refresh_search_vector, post_body_text, make_snippet
 import json
 from pydantic import BaseModel
 
@@ -19,6 +37,24 @@ router = APIRouter(
     tags=["posts"]
 )
 
+# PostSchema ile döndürülen postların ilişkileri. AsyncSession lazy load
+# yapamadığı için bunlar sorguda birlikte yüklenmelidir.
+POST_RELATIONS = (
+    joinedload(Post.category),
+    joinedload(Post.author),
+    joinedload(Post.district)
+)
+# Tek post detayı: ilişkiler + model seviyesinde ertelenen content/blocks
+POST_DETAIL = (*POST_RELATIONS, undefer_group("body"))
+
+FIELDS_DESCRIPTION = "Virgülle ayrılmış alan listesi (ör. id,title,slug,category). content ve blocks sadece istenirse döner."
+
+async def _load_post(db: AsyncSession, post_id: int) -> Optional[Post]:
+    return await db.scalar(
+        select(Post).options(*POST_DETAIL).where(Post.id == post_id)
+        .execution_options(populate_existing=True)
+    )
+
 @router.post("/", response_model=PostSchema)
 async def create_post(
     request: Request,
@@ -30,67 +66,68 @@ async def create_post(
     longitude: Optional[str] = Form(None),
     cover_image: Optional[UploadFile] = File(None),
     blocks: str = Form(...),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_user)
 ):
-    category = db.query(Category).filter(Category.id == category_id).first()
+    category = await db.get(Category, category_id)
     if not category or not category.is_active:
         raise HTTPException(status_code=404, detail="Kategori bulunamadı veya pasif")
 
     # İlçe kontrolü
     if district_id:
-        district = db.query(District).filter(District.id == district_id).first()
+        district = await db.get(District, district_id)
         if not district:
             raise HTTPException(status_code=404, detail="İlçe bulunamadı")
 
-    # Başlıktan otomatik slug oluştur
-    slug = create_slug(title, db)
-    
-    # Slug'ın benzersiz olduğundan emin ol
-    base_slug = slug
-    counter = 1
-    while db.query(Post).filter(Post.slug == slug).first():
-        slug = f"{base_slug}-{counter}"
-        counter += 1
-
-    cover_image_url = None
-    if cover_image:
-        cover_image_url = await upload_image(cover_image)
+    latitude = parse_coordinate(latitude, 90)
+    longitude = parse_coordinate(longitude, 180)
 
     try:
-        blocks_data = json.loads(blocks)
+        blocks = json.loads(blocks)
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Geçersiz blocks formatı")
 
+    # Yüklenecek tüm resimleri topla: kapak, blok ve grid içindeki blok resimleri
     form_data = await request.form()
-    blocks_raw = form_data.get("blocks")
-    blocks = json.loads(blocks_raw)
-
-    # Blocks içindeki resimleri Cloudinary'ye yükle
+    files = {}
+    if cover_image:
+        files["cover_image"] = cover_image
+    image_blocks = {}
     for i, block in enumerate(blocks):
         if block.get("type") == "image":
-            file_key = f"block_image_{i}"
-            if file_key in form_data:
-                file: UploadFile = form_data[file_key]
-                if file:
-                    url = await upload_image(file)
-                    block["src"] = url
+            image_blocks[f"block_image_{i}"] = block
         elif block.get("type") == "grid":
-            # Grid içindeki blokları işle
             for j, grid_block in enumerate(block.get("blocks", [])):
                 if grid_block.get("type") == "image":
-                    file_key = f"grid_{i}_block_image_{j}"
-                    if file_key in form_data:
-                        file: UploadFile = form_data[file_key]
-                        if file:
-                            url = await upload_image(file)
-                            grid_block["src"] = url
-                            if "content" in grid_block:
-                                del grid_block["content"]
+                    image_blocks[f"grid_{i}_block_image_{j}"] = grid_block
+    for file_key in image_blocks:
+        file = form_data.get(file_key)
+        if file:
+            files[file_key] = file
+
+    # Boyut ve tür kontrolleri yalnızca dosya başlığından yapılır
+    for file_key, file in files.items():
+        validate_image(file_key, file)
+
+    # Resimleri Cloudinary'ye eşzamanlı yükle
+    try:
+        urls = await upload_images(files)
+    except ImageUploadError as e:
+        raise HTTPException(
+            status_code=502,
+            detail={"message": "Bazı resimler yüklenemedi", "failed": e.failed}
+        )
+
+    cover_image_url = urls.pop("cover_image", None)
+    for file_key, url in urls.items():
+        block = image_blocks[file_key]
+        block["src"] = url
+        # Grid içindeki resim bloklarında geçici içerik alanı tutulmaz
+        if file_key.startswith("grid_") and "content" in block:
+            del block["content"]
 
     db_post = Post(
         title=title,
-        slug=slug,
         content=content,
         cover_image=cover_image_url,
         category_id=category_id,
@@ -101,123 +138,233 @@ async def create_post(
         blocks=blocks,
         status=PostStatus.APPROVED if current_user.role == "admin" else PostStatus.PENDING
     )
+    refresh_search_vector(db, db_post)
+    refresh_summary(db_post)
 
     try:
-        db.add(db_post)
-        db.commit()
-        db.refresh(db_post)
-        return db_post
+        # Başlıktan benzersiz slug oluştur
+        await save_with_slug(db, db_post, title)
+        await apply_deltas(db, post_deltas(after=[post_key(db_post)]))
+        await sync_snapshots(db, [db_post.id])
+        await db.commit()
+        await cache.invalidate("posts")
+        return await _load_post(db, db_post.id)
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Post oluşturulamadı: {str(e)}")
 
 
-@router.get("/", response_model=List[PostSchema])
+@router.get("/", response_model=PostListPage)
 async def get_posts(
     category_slug: Optional[str] = None,
     district_slug: Optional[str] = None,
     search: Optional[str] = None,
     status: PostStatus = None,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    query = db.query(Post)
+    selected = parse_fields(fields)
+    query = select(Post).options(*list_options(selected, required=(Post.created_at,)))
     query = query.filter(Post.status == PostStatus.APPROVED)
 
     if category_slug:
-        query = query.join(Post.category).filter(Category.slug == category_slug)
+        query = query.filter(Post.category.has(Category.slug == category_slug))
     if district_slug:
-        query = query.join(Post.district).filter(District.slug == district_slug)
+        query = query.filter(Post.district.has(District.slug == district_slug))
     if search:
-        search = f"%{search}%"
-        query = query.filter(
-            (Post.title.ilike(search)) |
-            (Post.content.ilike(search))
-        )
-    posts = query
-    return posts
+        query = apply_search(db, query, search)
+
+    # Keyset pagination: (created_at, id) sırasına göre bir önceki sayfanın devamı
+    position = decode_cursor(cursor)
+    if position:
+        created_at, post_id = position
+        query = query.filter(tuple_(Post.created_at, Post.id) < tuple_(created_at, post_id))
+
+    # Bir fazla satır çekip sonraki sayfa olup olmadığını anlıyoruz
+    posts = (await db.scalars(query.order_by(Post.created_at.desc(), Post.id.desc()).limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(posts) > limit:
+        posts = posts[:limit]
+        next_cursor = encode_cursor(posts[-1].created_at, posts[-1].id)
+
+    if selected is not None:
+        # Seçilmiş alanlar PostListItem şemasına uymaz
+        return FastJSONResponse(dumps({"items": project(posts, selected), "next_cursor": next_cursor}))
+    return FastJSONResponse(serialize(PostListPage, {"items": posts, "next_cursor": next_cursor}))
+
+@router.get("/search", response_model=List[PostSearchResult])
+async def search_posts(
+    q: str = Query(..., min_length=2),
+    skip: int = 0,
+    limit: int = Query(20, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Başlık, içerik ve blok metni üzerinde sıralı tam metin arama yapar.
+    """
+    rank = search_rank(db, q).label("rank")
+    query = select(Post, rank).options(joinedload(Post.category), undefer_group("body")).filter(
+        Post.status == PostStatus.APPROVED,
+        Post.is_active == True
+    )
+    query = apply_search(db, query, q)
+    rows = (await db.execute(query.order_by(rank.desc(), Post.id.desc()).offset(skip).limit(limit))).all()
+
+    return [
+        {
+            "id": post.id,
+            "title": post.title,
+            "slug": post.slug,
+            "cover_image": post.cover_image,
+            "category": post.category,
+            "rank": score,
+            "snippet": make_snippet(post_body_text(post.content, post.blocks) or post.title, q)
+        }
+        for post, score in rows
+    ]
 
 @router.get("/featured", response_model=List[FeaturedPostSchema])
 async def get_featured_posts(
+    request: Request,
     skip: int = 0,
     limit: int = 10,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    posts = db.query(Post).options(joinedload(Post.category)).filter(
-        Post.is_featured == True,
-        Post.status == PostStatus.APPROVED,
-        Post.is_active == True
-    ).order_by(Post.featured_order.asc()).offset(skip).limit(limit).all()
-
-    for post in posts:
-        summary = ""
-        if post.blocks:
-            # Sadece ilk metin bloğunu özet olarak alalım
-            text_block = next((block for block in post.blocks if block.get('type') == 'text' and block.get('content')), None)
-            if text_block:
-                content = text_block['content']
-                summary = (content[:150] + '...') if len(content) > 150 else content
-            else: # Metin bloğu yoksa ilk 150 karakteri al
-                summary = (post.content[:150] + '...') if post.content and len(post.content) > 150 else post.content
-        
-        post.summary = summary
-
-    return posts
+    async def load():
+        posts = await db.scalars(select(Post).options(
+            load_only(Post.id, Post.title, Post.slug, Post.cover_image, Post.summary, Post.first_image, Post.reading_time),
+            joinedload(Post.category)
+        ).filter(
+            Post.is_featured == True,
+            Post.status == PostStatus.APPROVED,
+            Post.is_active == True
+        ).order_by(Post.featured_order.asc()).offset(skip).limit(limit))
+        return [FeaturedPostSchema.model_validate(post) for post in posts]
+
+    return await cached_json_response(request, f"posts:featured:{skip}:{limit}", load, "posts", tags=["posts"])
 
 @router.get("/map-posts", response_model=List[MapPost])
-def get_map_posts(db: Session = Depends(get_db)):
+async def get_map_posts(request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     Haritada gösterilecek postları getirir.
     Sadece aktif ve konum bilgisi olan postları döndürür.
     """
-    posts = db.query(Post).join(Post.category).filter(
-        Post.is_active == True,
-        Post.latitude.isnot(None),
-        Post.longitude.isnot(None)
-    ).all()
+    async def load():
+        posts = await db.scalars(select(Post).join(Post.category).options(
+            load_only(Post.id, Post.title, Post.summary, Post.cover_image, Post.latitude, Post.longitude, Post.category_id),
+            contains_eager(Post.category).load_only(Category.name, Category.color)
+        ).filter(
+            Post.is_active == True,
+            Post.latitude.isnot(None),
+            Post.longitude.isnot(None)
+        ))
     
-    # Her post için kategori adını ekle
-    result = []
-    for post in posts:
-        post_dict = {
-            "id": post.id,
-            "title": post.title,
-            "content": post.content,
-            "cover_image": post.cover_image,
-            "latitude": post.latitude,
-            "longitude": post.longitude,
-            "category_id": post.category_id,
-            "category_name": post.category.name if post.category else None,
-            "category_color": post.category.color if post.category else None
-        }
-        result.append(post_dict)
+        # Her post için kategori adını ekle
+        result = []
+        for post in posts:
+            post_dict = {
+                "id": post.id,
+                "title": post.title,
+                "summary": post.summary,
+                "cover_image": post.cover_image,
+                "latitude": post.latitude,
+                "longitude": post.longitude,
+                "category_id": post.category_id,
+                "category_name": post.category.name if post.category else None,
+                "category_color": post.category.color if post.category else None
+            }
+            result.append(post_dict)
     
-    return result
+        return result
+
+    return await cached_json_response(request, "posts:map-posts", load, "posts", tags=["posts"])
+
+@router.get("/map", response_model=MapResponse)
+async def get_map(
+    bbox: str = Query(..., description="west,south,east,north"),
+    zoom: int = Query(..., ge=0, le=22),
+    category_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Harita görünümündeki postları getirir. Düşük zoom seviyelerinde sunucu
+    tarafında kümelenmiş sayıları, yüksek zoom'da hafif nokta kayıtlarını döndürür.
+    """
+    return await get_map_clusters(db, parse_bbox(bbox), zoom, category_id)
+
+@router.get("/export")
+async def export_all_posts(
+    status: PostStatus = None,
+    current_user: Principal = Depends(get_current_admin)
+):
+    """
+    Tüm postları NDJSON olarak akıtır (yedekleme, taşıma, yeniden indeksleme).
+    """
+    return StreamingResponse(
+        export_posts(status),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="posts.ndjson"'}
+    )
+
+@router.post("/import", response_model=PostImportReport)
+async def import_posts(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_admin)
+):
+    """
+    /posts/export formatındaki NDJSON dosyasını batch'ler halinde içe aktarır.
+    Yazarı eşlenemeyen postlar isteği yapan admine atanır. İstek boyutu
+    UPLOAD_MAX_REQUEST_SIZE ile sınırlı; büyük dosyalar için functions.transfer_posts.
+    """
+    report = await PostImporter(db, current_user.id).run(upload_lines(file))
+    if report.inserted:
+        await cache.invalidate("posts")
+    return report
 
 @router.get("/{post_id}", response_model=PostSchema)
 async def get_post(
     post_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
-    
+    # Yayınlanmış snapshot varsa tek satır okuma yeterli
+    snapshot = await db.get(PostSnapshot, post_id)
+    if snapshot:
+        return await snapshot_response(request, snapshot)
+
+    # Önce sadece sürüm bilgilerini çekip istemcinin kopyası güncel mi bakıyoruz
+    version = (await db.execute(select(
+        Post.status, Post.updated_at, Post.district_id, Category.updated_at, User.updated_at
+    ).join(Post.category).join(Post.author).where(Post.id == post_id))).first()
     # Sadece onaylı yazıları göster
-    if post.status != PostStatus.APPROVED:
+    if not version or version[0] != PostStatus.APPROVED:
         raise HTTPException(status_code=404, detail="Post not found")
-    
-    return post
 
-@router.get("/admin/list", response_model=List[PostSchema])
+    etag = version_etag("post", post_id, *version[1:])
+    last_modified = latest([version[1], version[3], version[4]])
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified, CACHE_CONTROL["posts"])
+
+    post = await _load_post(db, post_id)
+    body = serialize(PostSchema, post)
+    return conditional_response(request, body, "posts", etag=etag, last_modified=last_modified)
+
+@router.get("/admin/list", response_model=List[PostListItem])
 async def get_all_posts(
     skip: int = 0,
     limit: int = 10,
     category_id: int = None,
     status: PostStatus = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_editor_or_admin)
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_editor_or_admin)
 ):
-    query = db.query(Post)
+    selected = parse_fields(fields)
+    query = select(Post).options(*list_options(selected))
     
     if status:
         query = query.filter(Post.status == status)
@@ -225,13 +372,15 @@ async def get_all_posts(
     if category_id:
         query = query.filter(Post.category_id == category_id)
     
-    posts = query.offset(skip).limit(limit).all()
-    return posts
+    posts = (await db.scalars(query.offset(skip).limit(limit))).all()
+    if selected is not None:
+        return FastJSONResponse(dumps(project(posts, selected)))
+    return FastJSONResponse(serialize(PostListItem, posts, many=True))
 
 @router.get("/admin/count")
 def get_posts_count(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_editor_or_admin)
+    current_user: Principal = Depends(get_current_editor_or_admin)
 ):
     count = db.query(Post).count()
     return {"count": count}
@@ -240,10 +389,11 @@ def get_posts_count(
 async def update_post(
     post_id: int,
     post_update: PostUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_user)
 ):
-    db_post = db.query(Post).filter(Post.id == post_id).first()
+    # Özet ve arama vektörü content/blocks'tan hesaplandığı için ikisi de yüklenir
+    db_post = await db.get(Post, post_id, options=[undefer_group("body")])
     if not db_post:
         raise HTTPException(status_code=404, detail="Post not found")
     
@@ -253,7 +403,7 @@ async def update_post(
     
     # Kategori kontrolü
     if post_update.category_id:
-        category = db.query(Category).filter(Category.id == post_update.category_id).first()
+        category = await db.get(Category, post_update.category_id)
         if not category:
             raise HTTPException(status_code=404, detail="Category not found")
         if not category.is_active:
@@ -261,25 +411,34 @@ async def update_post(
     
     # Slug kontrolü
     if post_update.slug:
-        existing_post = db.query(Post).filter(Post.slug == post_update.slug, Post.id != post_id).first()
+        existing_post = await db.scalar(select(Post.id).where(Post.slug == post_update.slug, Post.id != post_id))
         if existing_post:
             raise HTTPException(status_code=400, detail="Post with this slug already exists")
     
+    before = post_key(db_post)
     update_data = post_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_post, field, value)
+    await apply_deltas(db, post_deltas([before], [post_key(db_post)]))
+
+    # Sadece aranabilir alanlar değiştiyse arama vektörünü güncelle
+    if update_data.keys() & {"title", "content", "blocks"}:
+        refresh_search_vector(db, db_post)
+    if update_data.keys() & {"content", "blocks"}:
+        refresh_summary(db_post)
+    await sync_snapshots(db, [post_id])
     
-    db.commit()
-    db.refresh(db_post)
-    return db_post
+    await db.commit()
+    await cache.invalidate("posts", f"post:{post_id}")
+    return await _load_post(db, post_id)
 
 @router.delete("/{post_id}")
 async def delete_post(
     post_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_user)
 ):
-    db_post = db.query(Post).filter(Post.id == post_id).first()
+    db_post = await db.get(Post, post_id)
     if not db_post:
         raise HTTPException(status_code=404, detail="Post not found")
     
@@ -287,17 +446,20 @@ async def delete_post(
     if db_post.author_id != current_user.id and current_user.role not in [UserRole.EDITOR, UserRole.ADMIN]:
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    db.delete(db_post)
-    db.commit()
+    await apply_deltas(db, post_deltas(before=[post_key(db_post)]))
+    await db.delete(db_post)
+    await sync_snapshots(db, [post_id])
+    await db.commit()
+    await cache.invalidate("posts", f"post:{post_id}")
     return {"message": "Post deleted successfully"}
 
 @router.patch("/{post_id}/toggle-status")
 async def toggle_post_status(
     post_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_user)
 ):
-    db_post = db.query(Post).filter(Post.id == post_id).first()
+    db_post = await db.get(Post, post_id)
     if not db_post:
         raise HTTPException(status_code=404, detail="Post not found")
     
@@ -306,61 +468,149 @@ async def toggle_post_status(
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
     db_post.is_active = not db_post.is_active
-    db.commit()
-    db.refresh(db_post)
+    await sync_snapshots(db, [post_id])
+    await db.commit()
+    await db.refresh(db_post)
+    await cache.invalidate("posts", f"post:{post_id}")
     return {"message": f"Post status changed to {'active' if db_post.is_active else 'inactive'}"}
 
 @router.patch("/{post_id}/approve")
 async def approve_post(
     post_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_admin)
 ):
-    db_post = db.query(Post).filter(Post.id == post_id).first()
+    db_post = await db.get(Post, post_id)
     if not db_post:
         raise HTTPException(status_code=404, detail="Post not found")
     
+    before = post_key(db_post)
     db_post.status = PostStatus.APPROVED
-    db.commit()
-    db.refresh(db_post)
+    await apply_deltas(db, post_deltas([before], [post_key(db_post)]))
+    await sync_snapshots(db, [post_id])
+    await db.commit()
+    await db.refresh(db_post)
+    await cache.invalidate("posts", f"post:{post_id}")
     return {"message": "Post approved successfully"}
 
 @router.patch("/{post_id}/reject")
 async def reject_post(
     post_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_admin)
 ):
-    db_post = db.query(Post).filter(Post.id == post_id).first()
+    db_post = await db.get(Post, post_id)
     if not db_post:
         raise HTTPException(status_code=404, detail="Post not found")
     
+    before = post_key(db_post)
     db_post.status = PostStatus.REJECTED
-    db.commit()
-    db.refresh(db_post)
+    await apply_deltas(db, post_deltas([before], [post_key(db_post)]))
+    await sync_snapshots(db, [post_id])
+    await db.commit()
+    await db.refresh(db_post)
+    await cache.invalidate("posts", f"post:{post_id}")
     return {"message": "Post rejected successfully"}
 
 @router.patch("/{post_id}/toggle-featured")
 async def toggle_featured_post(
     post_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_editor_or_admin)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_editor_or_admin)
 ):
-    db_post = db.query(Post).filter(Post.id == post_id).first()
+    db_post = await db.get(Post, post_id)
     if not db_post:
         raise HTTPException(status_code=404, detail="Post not found")
     
     db_post.is_featured = not db_post.is_featured
-    db.commit()
-    db.refresh(db_post)
+    await sync_snapshots(db, [post_id])
+    await db.commit()
+    await db.refresh(db_post)
+    await cache.invalidate("posts", f"post:{post_id}")
     return {"message": f"Post featured status changed to {'featured' if db_post.is_featured else 'not featured'}"}
 
+@router.post("/bulk", response_model=PostBulkResponse)
+async def bulk_update_posts(
+    payload: PostBulkRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_active_user)
+):
+    """
+    Birden çok posta aynı moderasyon işlemini tek UPDATE ile uygular ve
+    her id için sonucu döndürür.
+    """
+    is_moderator = current_user.role in [UserRole.EDITOR, UserRole.ADMIN]
+    # Tekil endpoint'lerle aynı yetkiler
+    if payload.action in (PostBulkAction.APPROVE, PostBulkAction.REJECT) and current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    if payload.action == PostBulkAction.TOGGLE_FEATURED and not is_moderator:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+
+    values = {
+        PostBulkAction.APPROVE: {"status": PostStatus.APPROVED},
+        PostBulkAction.REJECT: {"status": PostStatus.REJECTED},
+        PostBulkAction.TOGGLE_STATUS: {"is_active": ~Post.is_active},
+        PostBulkAction.TOGGLE_FEATURED: {"is_featured": ~Post.is_featured},
+    }[payload.action]
+
+    ids = list(dict.fromkeys(payload.ids))
+    query = select(Post.id, Post.author_id, Post.status, Post.category_id, Post.district_id).where(Post.id.in_(ids))
+    if "status" in values:
+        # Sayaç farkları eski durumlara göre hesaplanacağı için satırları kilitle
+        query = query.with_for_update()
+    posts = {row.id: row for row in (await db.execute(query)).all()}
+
+    results = {}
+    allowed = []
+    for post_id in ids:
+        if post_id not in posts:
+            results[post_id] = "not_found"
+        elif payload.action == PostBulkAction.TOGGLE_STATUS and not is_moderator and posts[post_id].author_id != current_user.id:
+            results[post_id] = "forbidden"
+        else:
+            allowed.append(post_id)
+
+    updated = []
+    if allowed:
+        updated = (await db.scalars(
+            update(Post).where(Post.id.in_(allowed)).values(**values)
+            .returning(Post.id).execution_options(synchronize_session=False)
+        )).all()
+        if "status" in values:
+            before = [post_key(posts[post_id]) for post_id in updated]
+            await apply_deltas(db, post_deltas(before, [key._replace(status=values["status"].value) for key in before]))
+        await sync_snapshots(db, updated)
+        await db.commit()
+        await cache.invalidate("posts", *(f"post:{post_id}" for post_id in updated))
+
+    # Satır arada silindiyse UPDATE onu döndürmez
+    updated_ids = set(updated)
+    for post_id in allowed:
+        results[post_id] = "updated" if post_id in updated_ids else "not_found"
+
+    return {
+        "action": payload.action,
+        "updated": len(updated_ids),
+        "results": [{"id": post_id, "result": results[post_id]} for post_id in ids]
+    }
+
 @router.get("/slug/{slug}", response_model=PostSchema)
-def get_post_by_slug(slug: str, db: Session = Depends(get_db)):
-    post = db.query(Post).filter(Post.slug == slug).first()
-    if not post:
-        raise HTTPException(status_code=404, detail="Post bulunamadı")
-    return post
+async def get_post_by_slug(slug: str, request: Request, db: AsyncSession = Depends(get_async_db)):
+    snapshot = await db.scalar(select(PostSnapshot).where(PostSnapshot.slug == slug).limit(1))
+    if snapshot:
+        return await snapshot_response(request, snapshot)
+
+    async def load():
+        post = await db.scalar(select(Post).options(*POST_DETAIL).where(Post.slug == slug))
+        if not post:
+            raise HTTPException(status_code=404, detail="Post bulunamadı")
+        return PostSchema.model_validate(post)
+
+    return await cached_json_response(
+        request, f"posts:slug:{slug}", load, "posts",
+        tags=lambda post: [f"post:{post.id}", f"category:{post.category_id}", f"author:{post.author_id}"],
+        last_modified=lambda post: latest([post.updated_at, post.category.updated_at, post.author.updated_at])
+    )
 
 class UpdateFeaturedOrder(BaseModel):
     post_ids: List[int]
@@ -368,21 +618,31 @@ class UpdateFeaturedOrder(BaseModel):
 @router.post("/featured/order", status_code=status.HTTP_200_OK)
 async def set_featured_order(
     payload: UpdateFeaturedOrder,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_admin)
 ):
-    # Reset featured status and order for all posts that are currently featured
-    db.query(Post).filter(Post.is_featured == True).update({
-        "is_featured": False,
-        "featured_order": None
-    }, synchronize_session=False)
-
-    # Set new featured status and order for the provided post IDs
-    for index, post_id in enumerate(payload.post_ids):
-        db.query(Post).filter(Post.id == post_id).update({
-            "is_featured": True,
-            "featured_order": index
-        }, synchronize_session=False)
-    
-    db.commit()
+    post_ids = payload.post_ids
+    if len(set(post_ids)) != len(post_ids):
+        raise HTTPException(status_code=400, detail="Aynı post birden fazla kez verilemez")
+    existing = set(await db.scalars(select(Post.id).where(Post.id.in_(post_ids)))) if post_ids else set()
+    unknown = [post_id for post_id in post_ids if post_id not in existing]
+    if unknown:
+        raise HTTPException(status_code=404, detail={"message": "Post bulunamadı", "ids": unknown})
+
+    # Yeni sıra ve listede olmayanların temizlenmesi tek UPDATE'te yapılır;
+    # eşzamanlı okuyucular hiçbir an boş bir öne çıkanlar listesi görmez.
+    order = {post_id: index for index, post_id in enumerate(post_ids)}
+    changed = await db.scalars(
+        update(Post)
+        .where(or_(Post.is_featured == True, Post.id.in_(post_ids)))
+        .values(
+            is_featured=Post.id.in_(post_ids),
+            featured_order=case(order, value=Post.id, else_=None) if order else None
+        )
+        .returning(Post.id)
+        .execution_options(synchronize_session=False)
+    )
+    await sync_snapshots(db, changed.all())
+    await db.commit()
+    await cache.invalidate("posts")
     return {"message": "Featured posts order has been updated successfully."}
\ No newline at end of file
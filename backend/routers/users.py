@@ -4,7 +4,12 @@ from typing import List
 
 from database import get_db
 from models.user import User
-from schemas.user import User as UserSchema
+from services.cache import cache
+from services.principal_cache import Principal, principal_cache
+from services.post_snapshot import published_post_ids, sync_snapshots_sync
+from services.token_service import revoke_user_refresh_tokens_sync
+from services.stats_service import apply_deltas_sync, entity_delta, orphaned_author_deltas
+from schemas.user import User as UserSchema, UserRoleUpdate
 from dependencies import get_current_admin
 
 router = APIRouter(
@@ -12,12 +17,16 @@ router = APIRouter(
     tags=["users"]
 )
 
+def _invalidate_author_posts(user_id: int) -> None:
+    # Önbellekteki post gövdelerinde yazarın adı, rolü ve durumu gömülü
+    cache.invalidate_sync("posts", f"author:{user_id}")
+
 @router.get("/", response_model=List[UserSchema])
 def get_users(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin)
+    current_admin: Principal = Depends(get_current_admin)
 ):
     users = db.query(User).offset(skip).limit(limit).all()
     return users
@@ -25,7 +34,7 @@ def get_users(
 @router.get("/count")
 def get_users_count(
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin)
+    current_admin: Principal = Depends(get_current_admin)
 ):
     count = db.query(User).count()
     return {"count": count}
@@ -34,11 +43,54 @@ def get_users_count(
 def delete_user(
     user_id: int,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(get_current_admin)
+    current_admin: Principal = Depends(get_current_admin)
 ):
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+    post_ids = db.scalars(published_post_ids(author_id=user_id)).all()
+    apply_deltas_sync(db, {**orphaned_author_deltas(db, user_id), **entity_delta("users", -1)})
     db.delete(user)
+    # Yazarı silinen postlar şemaya uymadığı için snapshot'ları kaldırılır
+    sync_snapshots_sync(db, post_ids)
+    db.commit()
+    principal_cache.invalidate_user(user_id)
+    _invalidate_author_posts(user_id)
+    return
+
+@router.patch("/{user_id}/role", response_model=UserSchema)
+def update_user_role(
+    user_id: int,
+    role_update: UserRoleUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    user.role = role_update.role
+    sync_snapshots_sync(db, db.scalars(published_post_ids(author_id=user_id)).all())
+    db.commit()
+    db.refresh(user)
+    principal_cache.invalidate_user(user_id)
+    _invalidate_author_posts(user_id)
+    return user
+
+@router.patch("/{user_id}/toggle-status", response_model=UserSchema)
+def toggle_user_status(
+    user_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    user.is_active = not user.is_active
+    if not user.is_active:
+        revoke_user_refresh_tokens_sync(db, user_id)
+    sync_snapshots_sync(db, db.scalars(published_post_ids(author_id=user_id)).all())
     db.commit()
-    return 
\ No newline at end of file
+    db.refresh(user)
+    principal_cache.invalidate_user(user_id)
+    _invalidate_author_posts(user_id)
+    return user 
\ No newline at end of file
@@ -1,16 +1,38 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List
 
 class MapPost(BaseModel):
     id: int
     title: str
-    content: Optional[str] = None
+    summary: Optional[str] = None
     cover_image: Optional[str] = None
-    latitude: str
-    longitude: str
+    latitude: float
+    longitude: float
     category_id: int
     category_name: str
     category_color: Optional[str] = None
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True 
+
+class MapPoint(BaseModel):
+    id: int
+    title: str
+    slug: str
+    summary: Optional[str] = None
+    cover_image: Optional[str] = None
+    latitude: float
+    longitude: float
+    category_id: int
+    category_color: Optional[str] = None
+
+class MapCluster(BaseModel):
+    count: int
+    latitude: float
+    longitude: float
+
+class MapResponse(BaseModel):
+    mode: str
+    clusters: List[MapCluster]
+    points: List[MapPoint]
+    truncated: bool = False
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
+import enum
 from .category import Category
 from .user import User
 from models.post import PostStatus
@@ -13,8 +14,8 @@ class PostBase(BaseModel):
     cover_image: Optional[str] = None
     category_id: int
     district_id: Optional[int] = None
-    latitude: Optional[str] = None
-    longitude: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     blocks: List[Dict[str, Any]]
 
 class PostCreate(PostBase):
@@ -27,8 +28,8 @@ class PostUpdate(BaseModel):
     cover_image: Optional[str] = None
     category_id: Optional[int] = None
     district_id: Optional[int] = None
-    latitude: Optional[str] = None
-    longitude: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     status: Optional[PostStatus] = None
     is_active: Optional[bool] = None
     is_featured: Optional[bool] = None
@@ -44,6 +45,9 @@ class Post(PostBase):
     author_id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
+    summary: Optional[str] = None
+    first_image: Optional[str] = None
+    reading_time: Optional[int] = None
     
     # İlişkiler
     category: Category
@@ -54,10 +58,70 @@ class Post(PostBase):
     class Config:
         from_attributes = True
 
+class PostSearchResult(BaseModel):
+    id: int
+    title: str
+    slug: str
+    cover_image: Optional[str] = None
+    category: Category
+    rank: float
+    snippet: str
+
+    class Config:
+        from_attributes = True
+
 class CategoryShort(BaseModel):
+    id: int
     name: str
+    slug: str
     color: Optional[str] = None
 
+    class Config:
+        from_attributes = True
+
+class AuthorShort(BaseModel):
+    id: int
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+class PostListItem(BaseModel):
+    """
+    Liste uçları için hafif post. content ve blocks yalnızca fields= ile
+    istenirse döner.
+    """
+    id: int
+    title: str
+    slug: str
+    cover_image: Optional[str] = None
+    summary: Optional[str] = None
+    first_image: Optional[str] = None
+    reading_time: Optional[int] = None
+    status: PostStatus
+    is_active: bool
+    is_featured: bool
+    featured_order: Optional[int] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    category_id: Optional[int] = None
+    district_id: Optional[int] = None
+    author_id: Optional[int] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    category: Optional[CategoryShort] = None
+    author: Optional[AuthorShort] = None
+    district: Optional[District] = None
+
+    class Config:
+        from_attributes = True
+
+class PostListPage(BaseModel):
+    items: List[PostListItem]
+    next_cursor: Optional[str] = None
+
 class FeaturedPostSchema(BaseModel):
     id: int
     title: str
@@ -65,6 +129,61 @@ class FeaturedPostSchema(BaseModel):
     cover_image: Optional[str]
     category: Category
     summary: Optional[str]
+    first_image: Optional[str] = None
+    reading_time: Optional[int] = None
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True 
+
+class PostBulkAction(str, enum.Enum):
+    APPROVE = "approve"
+    REJECT = "reject"
+    TOGGLE_STATUS = "toggle-status"
+    TOGGLE_FEATURED = "toggle-featured"
+
+class PostBulkRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=500)
+    action: PostBulkAction
+
+class PostBulkResult(BaseModel):
+    id: int
+    result: Literal["updated", "not_found", "forbidden"]
+
+class PostBulkResponse(BaseModel):
+    action: PostBulkAction
+    updated: int
+    results: List[PostBulkResult]
+
+class PostTransferRecord(BaseModel):
+    """
+    NDJSON dışa/içe aktarmada bir satır. İlişkiler id yerine slug/e-posta ile
+    taşınır ki kayıtlar başka bir veritabanına aktarılabilsin.
+    """
+    id: Optional[int] = None
+    title: str = Field(..., min_length=1)
+    slug: Optional[str] = None
+    content: Optional[str] = None
+    cover_image: Optional[str] = None
+    status: PostStatus = PostStatus.PENDING
+    is_active: bool = True
+    is_featured: bool = False
+    featured_order: Optional[int] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    category_slug: Optional[str] = None
+    district_slug: Optional[str] = None
+    author_email: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    blocks: Optional[List[Dict[str, Any]]] = None
+
+class PostImportError(BaseModel):
+    line: int
+    error: str
+
+class PostImportReport(BaseModel):
+    processed: int
+    inserted: int
+    failed: int
+    renamed_slugs: int
+    errors: List[PostImportError]
@@ -18,6 +18,9 @@ class UserUpdate(BaseModel):
     password: Optional[str] = None
     role: Optional[UserRole] = None
 
+class UserRoleUpdate(BaseModel):
+    role: UserRole
+
 class User(UserBase):
     id: int
     role: UserRole
@@ -35,4 +38,11 @@ class PasswordReset(BaseModel):
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str
-    user: User 
\ No newline at end of file
+    refresh_token: Optional[str] = None
+    user: User
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+class LogoutRequest(BaseModel):
+    refresh_token: Optional[str] = None 
\ No newline at end of file
@@ -0,0 +1,301 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from fastapi import Request, Response
+from starlette.concurrency import run_in_threadpool
+from config import CACHE_BACKEND, CACHE_REDIS_URL, CACHE_MAX_ENTRIES, CACHE_DEFAULT_TTL
+from services.http_cache import body_etag, conditional_response, is_not_modified
+from services.compression import choose_encoding, compress, is_compressible
+from services.serializers import dumps
+
+
+class CacheBackend:
+    """
+    Önbellek deposu arayüzü. Değerler her zaman serileştirilmiş bytes'tır;
+    etiketler (tag) bir yazma işleminden etkilenen anahtarları toplu silmek içindir.
+    blocking=True olan backend'ler ağ üzerinden konuşur; async kod onları
+    thread pool'da çağırır.
+    """
+
+    blocking = False
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: int, tags: Iterable[str] = ()) -> None:
+        raise NotImplementedError
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def size(self) -> Optional[int]:
+        return None
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Süreç içi TTL + LRU önbellek. max_entries aşıldığında en uzun süredir
+    kullanılmayan anahtar atılır.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, set] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int, tags: Iterable[str] = ()) -> None:
+        tags = tuple(tags)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                for key in self._tags.pop(tag, set()):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis protokolü konuşan paylaşımlı önbellek. get/set/delete/sadd/smembers/expire
+    komutlarını destekleyen her istemci (redis-py, fakeredis vb.) kullanılabilir.
+    Boyut sınırı ve LRU tahliyesi Redis'in maxmemory-policy=allkeys-lru ayarıyla yapılır.
+    """
+
+    blocking = True
+
+    def __init__(self, client, prefix: str = "istancool:cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: int, tags: Iterable[str] = ()) -> None:
+        pipe = self.client.pipeline()
+        pipe.set(self.prefix + key, value, ex=ttl)
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            pipe.sadd(tag_key, key)
+            pipe.expire(tag_key, ttl)
+        pipe.execute()
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            keys = [self.prefix + member.decode() for member in self.client.smembers(tag_key)]
+            self.client.delete(tag_key, *keys)
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+
+class ResponseCache:
+    """
+    Read-through önbellek. Anahtar başındaki ad alanına (ör. "posts") göre
+    isabet/ıska sayılarını tutar.
+    """
+
+    def __init__(self, backend: CacheBackend, default_ttl: int = CACHE_DEFAULT_TTL):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = await self._call(self.backend.get, key)
+        self._count(key, "hits" if value is not None else "misses")
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None, tags: Iterable[str] = ()) -> None:
+        await self._call(self.backend.set, key, value, ttl or self.default_ttl, tuple(tags))
+
+    async def invalidate(self, *tags: str) -> None:
+        await self._call(self.backend.invalidate_tags, tags)
+
+    def invalidate_sync(self, *tags: str) -> None:
+        """
+        Sync handler'lar ve CLI komutları için; event loop dışında çalışır.
+        """
+        self.backend.invalidate_tags(tags)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            namespaces = {name: dict(counter) for name, counter in self._counters.items()}
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": self.backend.size(),
+            "hits": sum(counter["hits"] for counter in namespaces.values()),
+            "misses": sum(counter["misses"] for counter in namespaces.values()),
+            "namespaces": namespaces,
+        }
+
+    async def _call(self, method: Callable, *args):
+        # Redis çağrıları event loop'u ağ gidiş-dönüşü boyunca bloklamasın
+        if self.backend.blocking:
+            return await run_in_threadpool(method, *args)
+        return method(*args)
+
+    def _count(self, key: str, field: str) -> None:
+        namespace = key.split(":", 1)[0]
+        with self._lock:
+            counter = self._counters.setdefault(namespace, {"hits": 0, "misses": 0})
+            counter[field] += 1
+
+
+def build_cache_backend(name: str = CACHE_BACKEND) -> CacheBackend:
+    if name == "memory":
+        return MemoryCacheBackend()
+    if name == "redis":
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND=redis için 'redis' paketini yükleyin")
+        return RedisCacheBackend(redis.Redis.from_url(CACHE_REDIS_URL))
+    raise ValueError(f"Bilinmeyen CACHE_BACKEND: {name}")
+
+
+cache = ResponseCache(build_cache_backend())
+
+
+def to_json_bytes(data: Any) -> bytes:
+    return dumps(data)
+
+
+def pack_entry(body: bytes, etag: str, last_modified: Optional[datetime], tags: Iterable[str] = ()) -> bytes:
+    """
+    Gövdeyi doğrulayıcılarıyla birlikte tek değer olarak saklar:
+    ilk satır meta JSON'u, kalanı gövde. Etiketler, sonradan eklenecek
+    sıkıştırılmış varyantlar da aynı etiketlerle silinsin diye saklanır.
+    """
+    meta = {"etag": etag, "last_modified": last_modified.isoformat() if last_modified else None, "tags": list(tags)}
+    return json.dumps(meta).encode() + b"\n" + body
+
+
+def unpack_entry(value: bytes) -> Tuple[bytes, str, Optional[datetime], List[str]]:
+    meta, body = value.split(b"\n", 1)
+    meta = json.loads(meta)
+    last_modified = datetime.fromisoformat(meta["last_modified"]) if meta["last_modified"] else None
+    return body, meta["etag"], last_modified, meta.get("tags", [])
+
+
+async def compressed_variant(key: str, encoding: str, body: bytes, etag: str, ttl: Optional[int], tags: Iterable[str]) -> bytes:
+    """
+    Önbellekteki gövdenin sıkıştırılmış halini döndürür; yoksa bir kez
+    sıkıştırıp gövdenin yanına ({key}:{encoding}) kaydeder. Varyant, üretildiği
+    gövdenin ETag'ini taşır; gövde değiştiyse yeniden üretilir.
+    """
+    variant_key = f"{key}:{encoding}"
+    # İsabet/ıska sayaçları sadece asıl gövde için tutuluyor
+    value = await cache._call(cache.backend.get, variant_key)
+    if value is not None:
+        variant_etag, compressed = value.split(b"\n", 1)
+        if variant_etag.decode() == etag:
+            return compressed
+    compressed = compress(body, encoding)
+    await cache.set(variant_key, etag.encode() + b"\n" + compressed, ttl, tags)
+    return compressed
+
+
+async def cached_json_response(
+    request: Request,
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    route: str,
+    tags: Union[Iterable[str], Callable[[Any], Iterable[str]]] = (),
+    last_modified: Optional[Callable[[Any], Optional[datetime]]] = None,
+    ttl: Optional[int] = None
+) -> Response:
+    """
+    await loader() sonucunu JSON olarak ETag/Last-Modified ile birlikte önbelleğe alır.
+    İsabette gövde yeniden serileştirilmez; istemcinin kopyası güncelse 304 döner.
+    Etiketler yüklenen veriye bağlıysa tags, veriyi alan bir fonksiyon olabilir.
+    İstemci kabul ediyorsa gövdenin önbellekte saklanan sıkıştırılmış varyantı döner.
+    """
+    value = await cache.get(key)
+    if value is None:
+        data = await loader()
+        body = to_json_bytes(data)
+        entry_tags = list(tags(data) if callable(tags) else tags)
+        value = pack_entry(body, body_etag(body), last_modified(data) if last_modified else None, entry_tags)
+        await cache.set(key, value, ttl, entry_tags)
+    body, etag, modified, entry_tags = unpack_entry(value)
+
+    return await encoded_response(request, key, body, route, etag, modified, ttl, entry_tags)
+
+
+async def encoded_response(
+    request: Request,
+    key: str,
+    body: bytes,
+    route: str,
+    etag: str,
+    last_modified: Optional[datetime],
+    ttl: Optional[int] = None,
+    tags: Iterable[str] = ()
+) -> Response:
+    """
+    Hazır JSON gövdesini koşullu yanıt olarak döndürür. İstemci kabul ediyorsa
+    gövdenin key altında saklanan sıkıştırılmış varyantı kullanılır.
+    """
+    compressible = is_compressible("application/json", len(body))
+    encoding = choose_encoding(request.headers.get("accept-encoding")) if compressible else None
+    if encoding and not is_not_modified(request, etag, last_modified):
+        body = await compressed_variant(key, encoding, body, etag, ttl, tags)
+    else:
+        encoding = None
+    return conditional_response(
+        request, body, route, etag=etag, last_modified=last_modified, content_encoding=encoding, vary=compressible
+    )
@@ -1,40 +1,132 @@
-import cloudinary
-import cloudinary.uploader
+import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterable, Optional
 from fastapi import UploadFile
-from config import CLOUDINARY_CLOUD_NAME, CLOUDINARY_API_KEY, CLOUDINARY_API_SECRET
+from config import CLOUDINARY_CLOUD_NAME, CLOUDINARY_API_KEY, CLOUDINARY_API_SECRET, UPLOAD_CONCURRENCY, UPLOAD_TIMEOUT, UPLOAD_CHUNK_SIZE
 
-# Cloudinary yapılandırması
-cloudinary.config(
-    cloud_name=CLOUDINARY_CLOUD_NAME,
-    api_key=CLOUDINARY_API_KEY,
-    api_secret=CLOUDINARY_API_SECRET
-)
 
-async def upload_image(file: UploadFile, folder: str = "blog_images") -> str:
+@lru_cache(maxsize=None)
+def get_uploader():
     """
-    Resmi Cloudinary'ye yükler ve URL'ini döndürür
+    Cloudinary SDK'sını ilk yüklemede içe aktarır ve yapılandırır; worker
+    açılışı SDK'nın import maliyetini ödemez.
+    """
+    import cloudinary
+    import cloudinary.uploader
+
+    # Cloudinary yapılandırması
+    cloudinary.config(
+        cloud_name=CLOUDINARY_CLOUD_NAME,
+        api_key=CLOUDINARY_API_KEY,
+        api_secret=CLOUDINARY_API_SECRET
+    )
+    return cloudinary.uploader
+
+# cloudinary SDK'sı bloklayan HTTP çağrıları yapar; yüklemeler event loop'u
+# dondurmasın diye sınırlı sayıda thread'de çalıştırılır.
+_upload_executor = ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY, thread_name_prefix="cloudinary-upload")
+
+# Aynı anda çalışan iş sayısı thread sayısını aşmaz; böylece bir iş executor
+# kuyruğunda beklemez ve zaman aşımı sadece yüklemenin kendisini kapsar.
+# Semaphore ilk beklemede event loop'a bağlandığı için loop başına tutulur.
+_upload_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+class ImageUploadError(Exception):
+    """
+    Toplu yüklemede bir veya daha fazla resim başarısız olduğunda fırlatılır.
+    failed: alan adı -> hata mesajı. Başarılı yüklemeler fırlatılmadan önce
+    Cloudinary'den silinir.
+    """
+
+    def __init__(self, failed: Dict[str, str]):
+        super().__init__(f"{len(failed)} resim yüklenemedi: {', '.join(failed)}")
+        self.failed = failed
+
+
+def _upload(stream: BinaryIO, folder: str, timeout: Optional[float]) -> dict:
+    # upload_large dosyayı UPLOAD_CHUNK_SIZE'lık parçalar halinde okuyup gönderir;
+    # dosyanın tamamı belleğe alınmaz. timeout her HTTP isteğine uygulanır ve
+    # aşıldığında thread'deki çağrı da sonlanır.
+    return get_uploader().upload_large(
+        stream,
+        chunk_size=UPLOAD_CHUNK_SIZE,
+        folder=folder,
+        resource_type="auto",
+        timeout=timeout,
+        transformation=[
+            {
+                "width": 1200,  # Maksimum genişlik
+                "height": 800,  # Maksimum yükseklik
+                "crop": "limit",  # Oranı koru ve limitleri aşma
+                "quality": "auto",  # Otomatik kalite optimizasyonu
+                "fetch_format": "auto"  # Otomatik format optimizasyonu
+            }
+        ]
+    )
+
+
+def _destroy(asset: dict, timeout: Optional[float]) -> None:
+    get_uploader().destroy(asset["public_id"], resource_type=asset["resource_type"], timeout=timeout)
+
+
+async def _run_upload_job(function, *args):
+    """
+    Bloklayan SDK çağrısını boş bir yükleme thread'i bulunca çalıştırır.
     """
+    loop = asyncio.get_running_loop()
+    slots = _upload_slots.setdefault(loop, asyncio.Semaphore(UPLOAD_CONCURRENCY))
+    async with slots:
+        return await loop.run_in_executor(_upload_executor, function, *args)
+
+
+async def _upload_asset(file: UploadFile, folder: str, timeout: Optional[float]) -> dict:
     try:
-        # Dosyayı oku
-        file_content = await file.read()
-        
-        # Cloudinary'ye yükle
-        result = cloudinary.uploader.upload(
-            file_content,
-            folder=folder,
-            resource_type="auto",
-            transformation=[
-                {
-                    "width": 1200,  # Maksimum genişlik
-                    "height": 800,  # Maksimum yükseklik
-                    "crop": "limit",  # Oranı koru ve limitleri aşma
-                    "quality": "auto",  # Otomatik kalite optimizasyonu
-                    "fetch_format": "auto"  # Otomatik format optimizasyonu
-                }
-            ]
-        )
-        
-        # Güvenli URL'i döndür
-        return result["secure_url"]
+        # Dosya UploadFile'ın diskteki tamponundan akış olarak okunur
+        await file.seek(0)
+        return await _run_upload_job(_upload, file.file, folder, timeout)
     except Exception as e:
-        raise Exception(f"Resim yükleme hatası: {str(e)}") 
\ No newline at end of file
+        raise Exception(f"Resim yükleme hatası: {str(e)}")
+
+
+async def upload_image(file: UploadFile, folder: str = "blog_images", timeout: Optional[float] = UPLOAD_TIMEOUT) -> str:
+    """
+    Resmi Cloudinary'ye yükler ve URL'ini döndürür
+    """
+    asset = await _upload_asset(file, folder, timeout)
+    # Güvenli URL'i döndür
+    return asset["secure_url"]
+
+
+async def delete_assets(assets: Iterable[dict], timeout: Optional[float] = UPLOAD_TIMEOUT) -> None:
+    """
+    Yüklenmiş resimleri Cloudinary'den siler. Silme hataları yutulur; asıl
+    hata yüklemenin kendisidir.
+    """
+    await asyncio.gather(*(_run_upload_job(_destroy, asset, timeout) for asset in assets), return_exceptions=True)
+
+
+async def upload_images(files: Dict[str, UploadFile], folder: str = "blog_images") -> Dict[str, str]:
+    """
+    Resimleri eşzamanlı yükler ve alan adı -> URL sözlüğü döndürür. Herhangi
+    biri başarısız olursa yüklenenler silinir ve ImageUploadError fırlatılır.
+    """
+    names = list(files)
+    results = await asyncio.gather(
+        *(_upload_asset(files[name], folder, UPLOAD_TIMEOUT) for name in names),
+        return_exceptions=True
+    )
+
+    uploaded, failed = {}, {}
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            failed[name] = str(result)
+        else:
+            uploaded[name] = result
+    if failed:
+        # Post oluşturulmayacağı için yüklenenler Cloudinary'de sahipsiz kalmasın
+        await delete_assets(uploaded.values())
+        raise ImageUploadError(failed)
+    return {name: asset["secure_url"] for name, asset in uploaded.items()}
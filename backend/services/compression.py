@@ -0,0 +1,85 @@
+import gzip
+import zlib
+from typing import Optional
+from config import COMPRESSION_MIN_SIZE, COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY, COMPRESSION_CONTENT_TYPES
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Tercih sırası: brotli daha küçük çıktı verir
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli else ("gzip",)
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Accept-Encoding başlığına göre desteklenen en iyi kodlamayı seçer.
+    q=0 ile reddedilen kodlamalar seçilmez.
+    """
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip()] = quality
+    candidates = [
+        encoding for encoding in SUPPORTED_ENCODINGS
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda encoding: accepted.get(encoding, accepted.get("*", 0.0)))
+
+
+def is_compressible(content_type: Optional[str], size: Optional[int] = None) -> bool:
+    if size is not None and size < COMPRESSION_MIN_SIZE:
+        return False
+    if not content_type:
+        return False
+    content_type = content_type.lower()
+    return any(content_type.startswith(allowed) for allowed in COMPRESSION_CONTENT_TYPES)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0)
+    raise ValueError(f"Desteklenmeyen kodlama: {encoding}")
+
+
+def streaming_compressor(encoding: str):
+    """Parça parça gelen gövdeler için compress(chunk)/flush() arayüzlü nesne."""
+    if encoding == "br":
+        return _BrotliStream()
+    # wbits=31: gzip başlığı ve CRC ile
+    return zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+
+class _BrotliStream:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+def weak_etag(etag: Optional[str]) -> Optional[str]:
+    """
+    Sıkıştırılmış gösterim bayt bayt aynı olmadığı için ETag zayıf (W/)
+    yapılır; If-None-Match karşılaştırması zayıf eşleşmeyi kabul eder.
+    """
+    if not etag or etag.startswith("W/"):
+        return etag
+    return f"W/{etag}"
@@ -0,0 +1,39 @@
+import time
+from typing import List
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import Base
+
+# Şema bir kez doğrulandıktan sonra her /ready isteğinde katalog sorgusu yapılmaz
+_schema_verified = False
+
+
+async def check_database(db: AsyncSession) -> float:
+    """Veritabanına basit bir sorgu atar ve süresini (ms) döndürür."""
+    started = time.perf_counter()
+    await db.execute(text("SELECT 1"))
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+async def missing_tables(db: AsyncSession) -> List[str]:
+    """Modellerde tanımlı olup veritabanında bulunmayan tabloları döndürür."""
+    global _schema_verified
+    if _schema_verified:
+        return []
+    connection = await db.connection()
+    existing = set(await connection.run_sync(lambda sync_connection: inspect(sync_connection).get_table_names()))
+    missing = sorted(set(Base.metadata.tables) - existing)
+    _schema_verified = not missing
+    return missing
+
+
+async def readiness(db: AsyncSession) -> dict:
+    checks = {}
+    try:
+        checks["database"] = {"ok": True, "latency_ms": await check_database(db)}
+    except Exception as e:
+        checks["database"] = {"ok": False, "error": str(e)}
+        return checks
+    missing = await missing_tables(db)
+    checks["schema"] = {"ok": not missing, "missing_tables": missing}
+    return checks
@@ -0,0 +1,103 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional
+from fastapi import Request, Response
+from config import CACHE_CONTROL
+from services.compression import weak_etag
+
+
+def body_etag(body: bytes) -> str:
+    """Gövdenin içeriğinden güçlü (strong) ETag üretir."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def version_etag(*parts) -> str:
+    """
+    Kaynağın sürüm bilgilerinden (id, updated_at ...) güçlü ETag üretir.
+    Gövdeyi serileştirmeden 304 kararı verebilmek için kullanılır.
+    """
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return f'"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def latest(values: Iterable[Optional[datetime]]) -> Optional[datetime]:
+    """Verilen zamanların en yenisini (UTC) döndürür."""
+    values = [as_utc(value) for value in values if value is not None]
+    return max(values) if values else None
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # posts tablosundaki zamanlar timezone'suz UTC olarak saklanıyor
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def validator_headers(etag: Optional[str], last_modified: Optional[datetime], cache_control: Optional[str]) -> dict:
+    headers = {}
+    if etag:
+        headers["ETag"] = etag
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(as_utc(last_modified), usegmt=True)
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return headers
+
+
+def is_not_modified(request: Request, etag: Optional[str], last_modified: Optional[datetime]) -> bool:
+    """
+    If-None-Match / If-Modified-Since başlıklarını değerlendirir.
+    If-None-Match varsa If-Modified-Since yok sayılır (RFC 9110).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if not etag:
+            return False
+        candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+        return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return as_utc(last_modified).replace(microsecond=0) <= as_utc(since)
+    return False
+
+
+def not_modified_response(etag: Optional[str], last_modified: Optional[datetime], cache_control: Optional[str], vary: bool = False) -> Response:
+    headers = validator_headers(etag, last_modified, cache_control)
+    if vary:
+        headers["Vary"] = "Accept-Encoding"
+    return Response(status_code=304, headers=headers)
+
+
+def conditional_response(
+    request: Request,
+    body: bytes,
+    route: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[datetime] = None,
+    content_encoding: Optional[str] = None,
+    vary: bool = False,
+) -> Response:
+    """
+    Hazır JSON gövdesini doğrulayıcı başlıklarla döndürür; istemcinin kopyası
+    güncelse 304 döner. content_encoding verilirse body zaten o kodlamayla
+    sıkıştırılmıştır (etag sıkıştırılmamış gövdeye aittir ve zayıflatılır).
+    """
+    etag = etag or body_etag(body)
+    cache_control = CACHE_CONTROL.get(route)
+    vary = vary or content_encoding is not None
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified, cache_control, vary)
+    headers = validator_headers(weak_etag(etag) if content_encoding else etag, last_modified, cache_control)
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+    if vary:
+        headers["Vary"] = "Accept-Encoding"
+    return Response(content=body, media_type="application/json", headers=headers)
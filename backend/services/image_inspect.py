@@ -0,0 +1,106 @@
+import struct
+from dataclasses import dataclass
+from typing import BinaryIO, Optional
+from fastapi import HTTPException, UploadFile
+from config import UPLOAD_MAX_FILE_SIZE, UPLOAD_MAX_IMAGE_DIMENSION
+
+# Yalnızca dosya başlığı okunur; JPEG'de boyut bilgisi SOF segmentinde olduğu
+# için segmentler atlanarak (seek) ilerlenir, gövde okunmaz.
+HEADER_SIZE = 32
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+@dataclass
+class ImageInfo:
+    mime: str
+    width: int
+    height: int
+
+
+def inspect_image(stream: BinaryIO) -> Optional[ImageInfo]:
+    """
+    Dosyanın sihirli baytlarından türünü ve boyutlarını çıkarır. Desteklenmeyen
+    veya bozuk dosyalarda None döner. Akış başa sarılarak bırakılır.
+    """
+    stream.seek(0)
+    try:
+        head = stream.read(HEADER_SIZE)
+        if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+            width, height = struct.unpack(">II", head[16:24])
+            return ImageInfo("image/png", width, height)
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            width, height = struct.unpack("<HH", head[6:10])
+            return ImageInfo("image/gif", width, height)
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            return _inspect_webp(head)
+        if head[:2] == b"\xff\xd8":
+            return _inspect_jpeg(stream)
+        return None
+    except (struct.error, IndexError):
+        return None
+    finally:
+        stream.seek(0)
+
+
+def _inspect_webp(head: bytes) -> Optional[ImageInfo]:
+    chunk = head[12:16]
+    if chunk == b"VP8 ":
+        width, height = struct.unpack("<HH", head[26:30])
+        return ImageInfo("image/webp", width & 0x3FFF, height & 0x3FFF)
+    if chunk == b"VP8L":
+        bits = struct.unpack("<I", head[21:25])[0]
+        return ImageInfo("image/webp", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+    if chunk == b"VP8X":
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return ImageInfo("image/webp", width, height)
+    return None
+
+
+def _inspect_jpeg(stream: BinaryIO) -> Optional[ImageInfo]:
+    stream.seek(2)
+    while True:
+        marker = stream.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        # Dolgu baytlarını atla
+        while marker[1] == 0xFF:
+            marker = marker[1:] + stream.read(1)
+        if marker[1] in (0xD8, 0x01) or 0xD0 <= marker[1] <= 0xD7:
+            continue
+        length = struct.unpack(">H", stream.read(2))[0]
+        if marker[1] in JPEG_SOF_MARKERS:
+            height, width = struct.unpack(">xHH", stream.read(5))
+            return ImageInfo("image/jpeg", width, height)
+        if marker[1] == 0xD9 or length < 2:
+            return None
+        stream.seek(length - 2, 1)
+
+
+def file_size(file: UploadFile) -> int:
+    if file.size is not None:
+        return file.size
+    position = file.file.tell()
+    file.file.seek(0, 2)
+    size = file.file.tell()
+    file.file.seek(position)
+    return size
+
+
+def validate_image(field: str, file: UploadFile) -> ImageInfo:
+    """
+    Yüklenen dosyanın boyut, tür ve piksel sınırlarını kontrol eder.
+    """
+    if file_size(file) > UPLOAD_MAX_FILE_SIZE:
+        raise HTTPException(status_code=413, detail=f"{field}: dosya {UPLOAD_MAX_FILE_SIZE} baytı aşamaz")
+    info = inspect_image(file.file)
+    if info is None:
+        raise HTTPException(status_code=415, detail=f"{field}: yalnızca PNG, JPEG, GIF ve WebP yüklenebilir")
+    if not info.width or not info.height:
+        raise HTTPException(status_code=422, detail=f"{field}: resim boyutları okunamadı")
+    if max(info.width, info.height) > UPLOAD_MAX_IMAGE_DIMENSION:
+        raise HTTPException(
+            status_code=422,
+            detail=f"{field}: resim en fazla {UPLOAD_MAX_IMAGE_DIMENSION} piksel olabilir"
+        )
+    return info
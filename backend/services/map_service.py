@@ -0,0 +1,116 @@
+from typing import Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import Float, and_, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, load_only
+from models.post import Post, PostStatus
+from models.category import Category
+from config import MAP_CLUSTER_MAX_ZOOM, MAP_CLUSTER_RADIUS_PX, MAP_MAX_POINTS
+
+# Web haritalarında bir karo (tile) 256 piksel genişliğindedir
+TILE_SIZE_PX = 256
+
+BBox = Tuple[float, float, float, float]
+
+def parse_bbox(bbox: str) -> BBox:
+    """
+    "batı,güney,doğu,kuzey" biçimindeki bbox parametresini çözer.
+    """
+    try:
+        west, south, east, north = (float(value) for value in bbox.split(","))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="bbox 'west,south,east,north' formatında olmalı")
+    if not (-180 <= west <= east <= 180 and -90 <= south <= north <= 90):
+        raise HTTPException(status_code=400, detail="Geçersiz bbox")
+    return west, south, east, north
+
+def parse_coordinate(value: Optional[str], limit: float) -> Optional[float]:
+    """
+    Formdan gelen koordinatı sayıya çevirir; boş değer None olur.
+    """
+    if value is None or not value.strip():
+        return None
+    try:
+        coordinate = float(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Geçersiz koordinat")
+    if not -limit <= coordinate <= limit:
+        raise HTTPException(status_code=400, detail="Geçersiz koordinat")
+    return coordinate
+
+def cluster_cell_size(zoom: int) -> float:
+    """
+    Verilen zoom seviyesinde küme yarıçapına karşılık gelen ızgara hücresi (derece).
+    """
+    return 360.0 / (2 ** zoom) * MAP_CLUSTER_RADIUS_PX / TILE_SIZE_PX
+
+def bbox_condition(dialect: str, bbox: BBox):
+    """
+    bbox filtresi. Postgres'te ix_posts_location GiST index'inin ifadesiyle
+    birebir aynı yazılır; diğer veritabanlarında iki aralık koşulu kullanılır.
+    """
+    west, south, east, north = bbox
+    if dialect == "postgresql":
+        corner = lambda x, y: func.point(literal(x, Float), literal(y, Float))
+        return func.point(Post.longitude, Post.latitude).op("<@")(func.box(corner(west, south), corner(east, north)))
+    return and_(Post.latitude.between(south, north), Post.longitude.between(west, east))
+
+def _bbox_filter(query, dialect: str, bbox: BBox, category_id: Optional[int]):
+    query = query.filter(
+        Post.status == PostStatus.APPROVED,
+        Post.is_active == True,
+        bbox_condition(dialect, bbox)
+    )
+    if category_id:
+        query = query.filter(Post.category_id == category_id)
+    return query
+
+async def get_map_clusters(db: AsyncSession, bbox: BBox, zoom: int, category_id: Optional[int] = None) -> dict:
+    """
+    Düşük zoom'da postları ızgara hücrelerine göre tek bir GROUP BY sorgusuyla
+    kümeler; yüksek zoom'da bbox içindeki noktaları hafif kayıtlar olarak döndürür.
+    """
+    dialect = db.get_bind().dialect.name
+    if zoom > MAP_CLUSTER_MAX_ZOOM:
+        query = _bbox_filter(select(Post), dialect, bbox, category_id).join(Post.category).options(
+            load_only(Post.id, Post.title, Post.slug, Post.summary, Post.cover_image, Post.latitude, Post.longitude, Post.category_id),
+            contains_eager(Post.category).load_only(Category.color)
+        ).order_by(Post.id).limit(MAP_MAX_POINTS + 1)
+        posts = (await db.scalars(query)).all()
+        return {
+            "mode": "points",
+            "clusters": [],
+            "points": [
+                {
+                    "id": post.id,
+                    "title": post.title,
+                    "slug": post.slug,
+                    "summary": post.summary,
+                    "cover_image": post.cover_image,
+                    "latitude": post.latitude,
+                    "longitude": post.longitude,
+                    "category_id": post.category_id,
+                    "category_color": post.category.color
+                }
+                for post in posts[:MAP_MAX_POINTS]
+            ],
+            "truncated": len(posts) > MAP_MAX_POINTS
+        }
+
+    cell = cluster_cell_size(zoom)
+    cell_x = func.floor(Post.longitude / cell)
+    cell_y = func.floor(Post.latitude / cell)
+    query = _bbox_filter(
+        select(func.count(Post.id), func.avg(Post.latitude), func.avg(Post.longitude)),
+        dialect, bbox, category_id
+    ).group_by(cell_x, cell_y)
+    rows = (await db.execute(query)).all()
+    return {
+        "mode": "clusters",
+        "clusters": [
+            {"count": count, "latitude": latitude, "longitude": longitude}
+            for count, latitude, longitude in rows
+        ],
+        "points": [],
+        "truncated": False
+    }
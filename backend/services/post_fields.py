@@ -0,0 +1,74 @@
+from typing import Any, Dict, Iterable, List, Optional, Set
+from fastapi import HTTPException
+from sqlalchemy.orm import joinedload, load_only
+from models.post import Post
+from models.category import Category
+from models.user import User
+from schemas.post import PostListItem, CategoryShort, AuthorShort
+from schemas.district import District as DistrictSchema
+
+# Sadece fields= ile istendiğinde yüklenen ağır kolonlar
+HEAVY_FIELDS = {"content", "blocks"}
+
+RELATION_FIELDS = {
+    "category": (Post.category, CategoryShort, (Category.id, Category.name, Category.slug, Category.color)),
+    "author": (Post.author, AuthorShort, (User.id, User.first_name, User.last_name)),
+    "district": (Post.district, DistrictSchema, None),
+}
+
+LIST_FIELDS = set(PostListItem.model_fields) | HEAVY_FIELDS
+
+
+def parse_fields(raw: Optional[str]) -> Optional[Set[str]]:
+    """
+    "id,title,category" biçimindeki fields= parametresini doğrular.
+    Parametre yoksa None döner (varsayılan liste şeması).
+    """
+    if not raw:
+        return None
+    fields = {field.strip() for field in raw.split(",") if field.strip()}
+    unknown = fields - LIST_FIELDS
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail={"message": "Bilinmeyen alanlar", "fields": sorted(unknown), "allowed": sorted(LIST_FIELDS)}
+        )
+    return fields | {"id"}
+
+
+def _relation_option(name: str):
+    relationship, _, columns = RELATION_FIELDS[name]
+    option = joinedload(relationship)
+    return option.load_only(*columns) if columns else option
+
+
+def list_options(fields: Optional[Set[str]], required: Iterable = ()) -> List:
+    """
+    Liste sorgusu için yükleme seçenekleri. fields verilmişse yalnızca istenen
+    kolonlar ve ilişkiler yüklenir; required, sorgunun kendisi için gereken
+    kolonlardır (ör. cursor için created_at).
+    """
+    if fields is None:
+        return [_relation_option(name) for name in RELATION_FIELDS]
+
+    columns = [getattr(Post, field) for field in fields if field not in RELATION_FIELDS]
+    options = [load_only(*columns, *required)]
+    options.extend(_relation_option(name) for name in RELATION_FIELDS if name in fields)
+    return options
+
+
+def project(posts: Iterable[Post], fields: Set[str]) -> List[Dict[str, Any]]:
+    """
+    Postları seçilen alanlara indirger. Sadece yüklenmiş özniteliklere erişir;
+    AsyncSession'da yüklenmemiş bir kolona dokunmak lazy load hatası verir.
+    """
+    items: List[Dict[str, Any]] = []
+    for post in posts:
+        item = {}
+        for field in fields:
+            value = getattr(post, field)
+            if field in RELATION_FIELDS and value is not None:
+                value = RELATION_FIELDS[field][1].model_validate(value)
+            item[field] = value
+        items.append(item)
+    return items
@@ -0,0 +1,143 @@
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+from fastapi import Request, Response
+from pydantic import ValidationError
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, undefer_group
+from models.post import Post, PostStatus
+from models.post_snapshot import PostSnapshot
+from schemas.post import Post as PostSchema
+from services.cache import encoded_response
+from services.http_cache import body_etag, latest
+from services.serializers import serialize
+
+SNAPSHOT_BATCH_SIZE = 200
+
+
+def _chunks(ids: Iterable[int]):
+    ids = list(dict.fromkeys(ids))
+    for start in range(0, len(ids), SNAPSHOT_BATCH_SIZE):
+        yield ids[start:start + SNAPSHOT_BATCH_SIZE]
+
+
+def _published_posts(ids: List[int]):
+    return select(Post).options(
+        joinedload(Post.category), joinedload(Post.author), joinedload(Post.district), undefer_group("body")
+    ).where(Post.id.in_(ids), Post.status == PostStatus.APPROVED).execution_options(populate_existing=True)
+
+
+def snapshot_row(post: Post) -> Optional[dict]:
+    """
+    Postun yayınlanacak gövdesini ve doğrulayıcılarını üretir. Yazarı silinmiş
+    gibi şemaya uymayan postlar için None döner; onlar canlı sorgudan okunur.
+    """
+    try:
+        body = serialize(PostSchema, post)
+    except ValidationError:
+        return None
+    return {
+        "post_id": post.id,
+        "slug": post.slug,
+        "version": 1,
+        "body": body,
+        "etag": body_etag(body),
+        "last_modified": latest([post.updated_at, post.category.updated_at, post.author.updated_at]),
+        "updated_at": datetime.now(timezone.utc),
+    }
+
+
+def _upsert(dialect: str, rows: List[dict]):
+    insert = pg_insert if dialect == "postgresql" else sqlite_insert
+    stmt = insert(PostSnapshot).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[PostSnapshot.post_id],
+        set_={
+            "slug": stmt.excluded.slug,
+            "body": stmt.excluded.body,
+            "etag": stmt.excluded.etag,
+            "last_modified": stmt.excluded.last_modified,
+            "updated_at": stmt.excluded.updated_at,
+            "version": PostSnapshot.version + 1,
+        },
+        # Gövde değişmediyse sürüm artmaz
+        where=PostSnapshot.etag != stmt.excluded.etag
+    )
+
+
+def _statements(dialect: str, ids: List[int], posts: Iterable[Post]):
+    rows = [row for row in map(snapshot_row, posts) if row]
+    if rows:
+        yield _upsert(dialect, rows)
+    unpublished = set(ids) - {row["post_id"] for row in rows}
+    if unpublished:
+        yield delete(PostSnapshot).where(PostSnapshot.post_id.in_(unpublished))
+
+
+async def sync_snapshots(db: AsyncSession, post_ids: Iterable[int]) -> None:
+    """
+    Verilen postların snapshot'larını günceller: onaylı olanlar yeniden
+    yazılır, onaysız veya silinmiş olanlarınki kaldırılır. Değişiklikle aynı
+    transaction'da, commit'ten önce çağrılmalıdır.
+    """
+    # Oturumlar autoflush=False; bekleyen değişiklikler okunmadan önce yazılmalı
+    await db.flush()
+    dialect = db.get_bind().dialect.name
+    for ids in _chunks(post_ids):
+        posts = (await db.scalars(_published_posts(ids))).unique().all()
+        for statement in _statements(dialect, ids, posts):
+            await db.execute(statement)
+
+
+def sync_snapshots_sync(db: Session, post_ids: Iterable[int]) -> None:
+    db.flush()
+    dialect = db.get_bind().dialect.name
+    for ids in _chunks(post_ids):
+        posts = db.scalars(_published_posts(ids)).unique().all()
+        for statement in _statements(dialect, ids, posts):
+            db.execute(statement)
+
+
+def published_post_ids(category_id: Optional[int] = None, author_id: Optional[int] = None,
+                       district_ids: Optional[Iterable[int]] = None):
+    """
+    Kategori, yazar veya ilçe değişince gömülü kopyaları yenilenecek postların id sorgusu.
+    """
+    query = select(PostSnapshot.post_id).join(Post, Post.id == PostSnapshot.post_id)
+    if category_id is not None:
+        query = query.where(Post.category_id == category_id)
+    if author_id is not None:
+        query = query.where(Post.author_id == author_id)
+    if district_ids is not None:
+        query = query.where(Post.district_id.in_(list(district_ids)))
+    return query
+
+
+def rebuild_snapshots(db: Session) -> int:
+    """
+    Tüm onaylı postların snapshot'larını yeniden yazar ve artık yayında
+    olmayanlarınkini siler (ilk kurulum veya tutarsızlık şüphesinde).
+    """
+    ids = db.scalars(select(Post.id).where(Post.status == PostStatus.APPROVED).order_by(Post.id)).all()
+    for chunk in _chunks(ids):
+        sync_snapshots_sync(db, chunk)
+        db.commit()
+    db.execute(delete(PostSnapshot).where(PostSnapshot.post_id.not_in(
+        select(Post.id).where(Post.status == PostStatus.APPROVED)
+    )))
+    db.commit()
+    return len(ids)
+
+
+async def snapshot_response(request: Request, snapshot: PostSnapshot) -> Response:
+    """
+    Saklanan gövdeyi yeniden serileştirmeden koşullu yanıt olarak döndürür.
+    """
+    response = await encoded_response(
+        request, f"posts:snapshot:{snapshot.post_id}", snapshot.body, "posts",
+        snapshot.etag, snapshot.last_modified, tags=[f"post:{snapshot.post_id}"]
+    )
+    response.headers["X-Snapshot-Version"] = str(snapshot.version)
+    return response
@@ -0,0 +1,62 @@
+import math
+from typing import Any, Dict, List, Optional
+from models.post import Post
+from services.search_service import extract_block_text, post_body_text
+
+SUMMARY_LENGTH = 150
+WORDS_PER_MINUTE = 200
+
+SUMMARY_BLOCK_TYPES = {"paragraph", "text"}
+
+
+def _truncate(text: Optional[str]) -> Optional[str]:
+    if not text:
+        return text
+    return (text[:SUMMARY_LENGTH] + '...') if len(text) > SUMMARY_LENGTH else text
+
+
+def build_summary(content: Optional[str], blocks: Optional[List[Dict[str, Any]]]) -> Optional[str]:
+    """
+    İlk metin bloğundan, yoksa post içeriğinden kısa bir özet çıkarır.
+    """
+    text_block = next(
+        (block for block in blocks or []
+         if isinstance(block, dict) and block.get('type') in SUMMARY_BLOCK_TYPES and block.get('content')),
+        None
+    )
+    if text_block:
+        return _truncate(text_block['content'])
+    return _truncate(content) or _truncate(extract_block_text(blocks)) or None
+
+
+def find_first_image(blocks: Optional[List[Dict[str, Any]]]) -> Optional[str]:
+    """
+    Bloklar (grid içindekiler dahil) arasındaki ilk yüklenmiş resmin URL'ini bulur.
+    """
+    for block in blocks or []:
+        if not isinstance(block, dict):
+            continue
+        if block.get('type') == 'image' and block.get('src'):
+            return block['src']
+        if block.get('type') == 'grid':
+            image = find_first_image(block.get('blocks'))
+            if image:
+                return image
+    return None
+
+
+def estimate_reading_time(content: Optional[str], blocks: Optional[List[Dict[str, Any]]]) -> int:
+    """
+    Dakika cinsinden tahmini okuma süresi (en az 1).
+    """
+    words = len(post_body_text(content, blocks).split())
+    return max(1, math.ceil(words / WORDS_PER_MINUTE))
+
+
+def refresh_summary(post: Post) -> None:
+    """
+    Postun summary, first_image ve reading_time kolonlarını yeniden hesaplar.
+    """
+    post.summary = build_summary(post.content, post.blocks)
+    post.first_image = find_first_image(post.blocks)
+    post.reading_time = estimate_reading_time(post.content, post.blocks)
@@ -0,0 +1,288 @@
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import AsyncSessionLocal
+from models.category import Category
+from models.district import District
+from models.post import Post, PostStatus
+from models.user import User
+from schemas.post import PostTransferRecord
+from services.post_snapshot import sync_snapshots
+from services.post_summary import build_summary, estimate_reading_time, find_first_image
+from services.search_service import bulk_search_vector_expression, post_body_text, search_vector_params
+from services.slug_service import SLUG_RETRIES, allocate_slugs, is_slug_conflict
+from services.stats_service import PostKey, apply_deltas, post_deltas
+
+# Sunucu tarafı cursor'dan her seferinde çekilen satır sayısı
+EXPORT_BATCH_SIZE = 500
+IMPORT_BATCH_SIZE = 1000
+# Rapora yazılacak en fazla hata satırı
+MAX_REPORTED_ERRORS = 100
+
+EXPORT_COLUMNS = (
+    Post.id, Post.title, Post.slug, Post.content, Post.cover_image, Post.status,
+    Post.is_active, Post.is_featured, Post.featured_order, Post.latitude, Post.longitude,
+    Category.slug.label("category_slug"), District.slug.label("district_slug"),
+    User.email.label("author_email"), Post.created_at, Post.updated_at, Post.blocks,
+)
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, PostStatus):
+        return value.value
+    raise TypeError(f"{type(value).__name__} JSON'a çevrilemez")
+
+
+async def export_posts(status: Optional[PostStatus] = None) -> AsyncIterator[bytes]:
+    """
+    Postları id sırasıyla NDJSON olarak akıtır. ORM nesnesi üretilmez; satırlar
+    sunucu tarafı cursor'dan EXPORT_BATCH_SIZE'lık parçalar halinde okunur, bu
+    yüzden bellek kullanımı tablo boyutundan bağımsızdır.
+
+    Yanıt gövdesi endpoint döndükten sonra okunduğu için istek oturumu yerine
+    kendi oturumunu açar.
+    """
+    query = (
+        select(*EXPORT_COLUMNS)
+        .outerjoin(Category, Post.category_id == Category.id)
+        .outerjoin(District, Post.district_id == District.id)
+        .outerjoin(User, Post.author_id == User.id)
+        .order_by(Post.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    if status:
+        query = query.where(Post.status == status)
+
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query)
+        async for rows in result.partitions():
+            yield b"".join(
+                json.dumps(dict(row._mapping), ensure_ascii=False, default=_json_default).encode("utf-8") + b"\n"
+                for row in rows
+            )
+
+
+@dataclass
+class ImportReport:
+    processed: int = 0
+    inserted: int = 0
+    failed: int = 0
+    renamed_slugs: int = 0
+    errors: List[dict] = field(default_factory=list)
+
+    def add_error(self, line: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": error})
+
+
+async def upload_lines(file, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+    """
+    UploadFile içeriğini tamamını belleğe almadan satır satır okur. Satırlar
+    bytes döner; UTF-8 olmayan satırlar PostImporter'da rapora yazılır.
+    """
+    pending = b""
+    while chunk := await file.read(chunk_size):
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+
+class _Lookup:
+    """
+    slug/e-posta -> id eşlemesi. Her batch'te sadece daha önce görülmemiş
+    anahtarlar tek sorguyla çözülür.
+    """
+
+    def __init__(self, key_column, id_column):
+        self.key_column = key_column
+        self.id_column = id_column
+        self.ids: Dict[str, Optional[int]] = {}
+
+    async def resolve(self, db: AsyncSession, keys: Iterable[Optional[str]]) -> None:
+        missing = {key for key in keys if key and key not in self.ids}
+        if not missing:
+            return
+        rows = await db.execute(select(self.key_column, self.id_column).where(self.key_column.in_(missing)))
+        found = dict(rows.all())
+        for key in missing:
+            self.ids[key] = found.get(key)
+
+
+def _parse(line_no: int, line: str, report: ImportReport) -> Optional[PostTransferRecord]:
+    try:
+        return PostTransferRecord.model_validate_json(line)
+    except ValidationError as e:
+        error = e.errors()[0]
+        location = ".".join(str(part) for part in error["loc"]) or "satır"
+        report.add_error(line_no, f"{location}: {error['msg']}")
+        return None
+
+
+def _row(record: PostTransferRecord, slug: str, category_id, district_id, author_id) -> dict:
+    now = datetime.utcnow()
+    body = post_body_text(record.content, record.blocks)
+    return {
+        "title": record.title,
+        "slug": slug,
+        "content": record.content,
+        "cover_image": record.cover_image,
+        "status": record.status,
+        "is_active": record.is_active,
+        "is_featured": record.is_featured,
+        "featured_order": record.featured_order,
+        "latitude": record.latitude,
+        "longitude": record.longitude,
+        "category_id": category_id,
+        "district_id": district_id,
+        "author_id": author_id,
+        "created_at": record.created_at or now,
+        "updated_at": record.updated_at or record.created_at or now,
+        "blocks": record.blocks,
+        "summary": build_summary(record.content, record.blocks),
+        "first_image": find_first_image(record.blocks),
+        "reading_time": estimate_reading_time(record.content, record.blocks),
+        **search_vector_params(record.title, body),
+    }
+
+
+class PostImporter:
+    """
+    NDJSON satırlarını batch'ler halinde posts tablosuna yazar. Her batch tek
+    executemany INSERT ve tek sayaç güncellemesiyle kendi transaction'ında
+    commit edilir; hatalı satırlar atlanıp rapora yazılır.
+
+    Kayıttaki id yok sayılır (yeni id atanır). Slug doluysa korunur, başka bir
+    post tarafından kullanılıyorsa -N ekiyle yeniden adlandırılır. Kategori ve
+    ilçe slug'la, yazar e-postayla eşlenir; bilinmeyen yazar default_author_id'ye
+    atanır.
+    """
+
+    def __init__(self, db: AsyncSession, default_author_id: int, batch_size: int = IMPORT_BATCH_SIZE,
+                 on_progress: Optional[Callable[[ImportReport], None]] = None):
+        self.db = db
+        self.default_author_id = default_author_id
+        self.batch_size = batch_size
+        self.on_progress = on_progress
+        self.report = ImportReport()
+        self.categories = _Lookup(Category.slug, Category.id)
+        self.districts = _Lookup(District.slug, District.id)
+        self.authors = _Lookup(User.email, User.id)
+        self.statement = insert(Post.__table__).values(
+            search_vector=bulk_search_vector_expression(db.get_bind().dialect.name)
+        )
+
+    async def run(self, lines: AsyncIterable[Union[str, bytes]]) -> ImportReport:
+        batch: List[Tuple[int, PostTransferRecord]] = []
+        line_no = 0
+        async for line in lines:
+            line_no += 1
+            if not line.strip():
+                continue
+            self.report.processed += 1
+            if isinstance(line, bytes):
+                try:
+                    line = line.decode("utf-8")
+                except UnicodeDecodeError as e:
+                    self.report.add_error(line_no, f"Geçersiz UTF-8 ({e.start}. bayt)")
+                    continue
+            record = _parse(line_no, line, self.report)
+            if record:
+                batch.append((line_no, record))
+            if len(batch) >= self.batch_size:
+                await self._flush(batch)
+                batch = []
+        if batch:
+            await self._flush(batch)
+        return self.report
+
+    async def _flush(self, batch: List[Tuple[int, PostTransferRecord]]) -> None:
+        records = [record for _, record in batch]
+        await self.categories.resolve(self.db, (record.category_slug for record in records))
+        await self.districts.resolve(self.db, (record.district_slug for record in records))
+        await self.authors.resolve(self.db, (record.author_email for record in records))
+
+        resolved = []
+        for line_no, record in batch:
+            category_id = self.categories.ids.get(record.category_slug) if record.category_slug else None
+            district_id = self.districts.ids.get(record.district_slug) if record.district_slug else None
+            if record.category_slug and category_id is None:
+                self.report.add_error(line_no, f"Bilinmeyen kategori: {record.category_slug}")
+            elif record.district_slug and district_id is None:
+                self.report.add_error(line_no, f"Bilinmeyen ilçe: {record.district_slug}")
+            else:
+                author_id = self.authors.ids.get(record.author_email) or self.default_author_id
+                resolved.append((line_no, record, category_id, district_id, author_id))
+        if not resolved:
+            self._progress()
+            return
+
+        for attempt in range(SLUG_RETRIES):
+            rows = await self._rows(resolved)
+            try:
+                await self.db.execute(self.statement, [row for _, row, _ in rows])
+                await self._commit(rows)
+                break
+            except IntegrityError as e:
+                await self.db.rollback()
+                # Aynı anda aynı slug'ı alan başka bir yazma; slug'ları yeniden hesapla
+                if is_slug_conflict(e) and attempt < SLUG_RETRIES - 1:
+                    continue
+                # Diğer kısıt hataları (ör. bu arada silinmiş kategori/yazar) satıra
+                # özgüdür; batch satır satır yazılıp hatalılar rapora eklenir
+                rows = await self._insert_each(await self._rows(resolved))
+                await self._commit(rows)
+                break
+
+        self._progress()
+
+    async def _rows(self, resolved) -> List[Tuple[int, dict, bool]]:
+        """
+        (satır no, INSERT satırı, slug yeniden adlandırıldı mı) üçlüleri; slug'ı
+        doluyken başka bir posta ait olanlar -N eki alır.
+        """
+        slugs = await allocate_slugs(self.db, Post, [record.slug or record.title for _, record, *_ in resolved])
+        return [
+            (line_no, _row(record, slug, *ids), bool(record.slug) and slug != record.slug)
+            for slug, (line_no, record, *ids) in zip(slugs, resolved)
+        ]
+
+    async def _insert_each(self, rows: List[Tuple[int, dict, bool]]) -> List[Tuple[int, dict, bool]]:
+        inserted = []
+        for line_no, row, renamed in rows:
+            try:
+                async with self.db.begin_nested():
+                    await self.db.execute(self.statement, [row])
+            except IntegrityError as e:
+                self.report.add_error(line_no, f"Kayıt eklenemedi: {str(e.orig).splitlines()[0]}")
+            else:
+                inserted.append((line_no, row, renamed))
+        return inserted
+
+    async def _commit(self, inserted: List[Tuple[int, dict, bool]]) -> None:
+        """Eklenen satırların sayaçlarını ve snapshot'larını yazıp commit eder."""
+        rows = [row for _, row, _ in inserted]
+        await apply_deltas(self.db, post_deltas(after=[
+            PostKey(row["status"].value, row["category_id"], row["district_id"], row["author_id"])
+            for row in rows
+        ]))
+        published = [row["slug"] for row in rows if row["status"] == PostStatus.APPROVED]
+        if published:
+            await sync_snapshots(self.db, await self.db.scalars(select(Post.id).where(Post.slug.in_(published))))
+        await self.db.commit()
+        self.report.inserted += len(rows)
+        self.report.renamed_slugs += sum(1 for *_, renamed in inserted if renamed)
+
+    def _progress(self) -> None:
+        if self.on_progress:
+            self.on_progress(self.report)
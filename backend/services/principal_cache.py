@@ -0,0 +1,184 @@
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+from models.user import User, UserRole
+from services.cache import MemoryCacheBackend
+from config import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    PRINCIPAL_CACHE_TTL,
+    PRINCIPAL_CACHE_MAX_ENTRIES,
+    AUTH_TRUST_TOKEN_CLAIMS,
+    AUTH_STATE_BACKEND,
+    AUTH_REDIS_URL,
+)
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    İstek boyunca kullanılan, oturumdan bağımsız kullanıcı bilgisi.
+    Handler'lar User yerine bunu alır; ORM nesnesi istekler arasında paylaşılmaz.
+    """
+    id: int
+    email: str
+    role: UserRole
+    is_active: bool
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            role=UserRole(user.role),
+            is_active=user.is_active,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+def token_claims(user: User) -> dict:
+    """Access token'a konacak claim'ler: sub (email) ile sabit uid ve rol."""
+    return {"sub": user.email, "uid": user.id, "role": UserRole(user.role).value}
+
+
+class InvalidationStore:
+    """
+    Kullanıcı başına "bu andan önce verilmiş token'lara ve önbellek kopyalarına
+    güvenme" işaretleri. Yanıt önbelleğinden ayrıdır: LRU ile atılmaz,
+    /admin/cache/clear ile silinmez. İşaret, en uzun ömürlü access token'dan
+    daha eski olunca anlamını yitirir.
+    """
+
+    def mark(self, user_id: int, at: float) -> None:
+        raise NotImplementedError
+
+    def get(self, user_id: int) -> float:
+        raise NotImplementedError
+
+
+class MemoryInvalidationStore(InvalidationStore):
+    """
+    Süreç içi işaretler. Sadece tek worker'lı kurulumlar için doğrudur;
+    diğer worker'lar işareti görmez.
+    """
+
+    def __init__(self, lifetime: float = ACCESS_TOKEN_EXPIRE_MINUTES * 60):
+        self.lifetime = lifetime
+        self._marks: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, user_id: int, at: float) -> None:
+        with self._lock:
+            self._marks[user_id] = max(at, self._marks.get(user_id, 0.0))
+            # Kayıt sayısı kullanıcı sayısıyla sınırlı; süresi geçenler yazarken temizlenir
+            expired = at - self.lifetime
+            self._marks = {key: value for key, value in self._marks.items() if value > expired}
+
+    def get(self, user_id: int) -> float:
+        return self._marks.get(user_id, 0.0)
+
+
+class RedisInvalidationStore(InvalidationStore):
+    """
+    Tüm worker'ların paylaştığı işaretler. TTL'siz tek bir hash'te tutulur;
+    Redis'in maxmemory-policy'si allkeys-* olmamalı (noeviction veya
+    volatile-*), aksi halde hash tahliye edilebilir.
+    """
+
+    def __init__(self, client, key: str = "istancool:auth:invalidated"):
+        self.client = client
+        self.key = key
+
+    def mark(self, user_id: int, at: float) -> None:
+        self.client.hset(self.key, str(user_id), repr(at))
+
+    def get(self, user_id: int) -> float:
+        value = self.client.hget(self.key, str(user_id))
+        return float(value) if value else 0.0
+
+
+def build_invalidation_store(name: str = AUTH_STATE_BACKEND) -> InvalidationStore:
+    if AUTH_TRUST_TOKEN_CLAIMS and name != "redis":
+        # Süreç içi işaretler diğer worker'lara ulaşmaz; rolü düşürülen bir
+        # kullanıcının eski token'ı orada token süresi dolana kadar geçerli kalırdı
+        raise RuntimeError("AUTH_TRUST_TOKEN_CLAIMS=true için AUTH_STATE_BACKEND=redis gerekli")
+    if name == "memory":
+        return MemoryInvalidationStore()
+    if name == "redis":
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("AUTH_STATE_BACKEND=redis için 'redis' paketini yükleyin")
+        return RedisInvalidationStore(redis.Redis.from_url(AUTH_REDIS_URL))
+    raise ValueError(f"Bilinmeyen AUTH_STATE_BACKEND: {name}")
+
+
+invalidations = build_invalidation_store()
+
+
+class PrincipalCache:
+    """
+    Token subject'ine göre çözülmüş kullanıcıları tutan süreç içi TTL + LRU
+    önbellek. Bir kullanıcı silindiğinde, pasifleştirildiğinde veya rolü
+    değiştiğinde invalidate_user çağrılır; kendi kopyaları silinir ve
+    invalidations deposuna işaret yazılır. Redis deposunda diğer worker'lar da
+    işaretten önceki kopyaları ve token claim'lerini reddeder; bellek deposunda
+    diğer worker'ların kopyaları en fazla PRINCIPAL_CACHE_TTL kadar yaşar.
+    """
+
+    def __init__(self, max_entries: int = PRINCIPAL_CACHE_MAX_ENTRIES, ttl: int = PRINCIPAL_CACHE_TTL):
+        self.ttl = ttl
+        self._store = MemoryCacheBackend(max_entries)
+
+    def get(self, subject: str) -> Optional[Principal]:
+        entry = self._store.get(subject)
+        if entry is None:
+            return None
+        principal, cached_at = entry
+        if cached_at < invalidated_at(principal.id):
+            return None
+        return principal
+
+    def set(self, subject: str, principal: Principal) -> None:
+        self._store.set(subject, (principal, time.time()), self.ttl, tags=(f"user:{principal.id}",))
+
+    def invalidate_user(self, user_id: int) -> None:
+        self._store.invalidate_tags((f"user:{user_id}",))
+        # Daha eski token'ların claim'lerine ve önbellek kopyalarına güvenilmez
+        invalidations.mark(user_id, time.time())
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def size(self) -> int:
+        return self._store.size()
+
+
+def invalidated_at(user_id: int) -> float:
+    return invalidations.get(user_id)
+
+
+def claims_principal(payload: dict) -> Optional[Principal]:
+    """
+    AUTH_TRUST_TOKEN_CLAIMS açıksa token'daki uid/role'den veritabanına gitmeden
+    Principal üretir. Kullanıcı token'dan sonra güncellendiyse None döner.
+    """
+    if not AUTH_TRUST_TOKEN_CLAIMS:
+        return None
+    user_id, role, issued_at = payload.get("uid"), payload.get("role"), payload.get("iat")
+    if user_id is None or role is None or issued_at is None:
+        return None
+    if issued_at < invalidated_at(user_id):
+        return None
+    return Principal(id=user_id, email=payload["sub"], role=UserRole(role), is_active=True)
+
+
+principal_cache = PrincipalCache()
@@ -0,0 +1,157 @@
+import html
+import re
+from typing import Any, Dict, List, Optional
+from sqlalchemy import String, bindparam, func, literal
+from sqlalchemy.orm import Session, Query
+from models.post import Post
+from services.slug_service import TURKISH_CHAR_MAP
+
+# PostgreSQL metin arama konfigürasyonu. Türkçe karakterleri kendimiz
+# katladığımız için dil bağımsız 'simple' sözlüğü yeterli.
+SEARCH_CONFIG = "simple"
+
+SNIPPET_RADIUS = 80
+
+_FOLD_TABLE = str.maketrans(TURKISH_CHAR_MAP)
+_TOKEN_RE = re.compile(r"\w+")
+
+# Metin içeren blok tipleri (frontend'deki blok editörüyle aynı)
+TEXT_BLOCK_TYPES = {"paragraph", "text", "h1", "h2", "heading"}
+
+
+def fold_text(text: Optional[str]) -> str:
+    """
+    Türkçe karakterleri ASCII karşılıklarına çevirip küçük harfe indirir.
+    Metnin uzunluğu korunur, böylece katlanmış metindeki konumlar
+    orijinal metinde de geçerlidir.
+    """
+    if not text:
+        return ""
+    folded = text.translate(_FOLD_TABLE)
+    return "".join(ch if len(ch.lower()) != 1 else ch.lower() for ch in folded)
+
+
+def extract_block_text(blocks: Optional[List[Dict[str, Any]]]) -> str:
+    """
+    Blok listesindeki (grid içindekiler dahil) tüm okunabilir metni birleştirir.
+    """
+    parts: List[str] = []
+    for block in blocks or []:
+        if not isinstance(block, dict):
+            continue
+        block_type = block.get("type")
+        if block_type in TEXT_BLOCK_TYPES and isinstance(block.get("content"), str):
+            parts.append(block["content"])
+        elif block_type == "list":
+            parts.extend(item for item in block.get("items", []) if isinstance(item, str))
+        elif block_type == "image" and isinstance(block.get("alt"), str):
+            parts.append(block["alt"])
+        elif block_type == "grid":
+            parts.append(extract_block_text(block.get("blocks")))
+    return "\n".join(part for part in parts if part)
+
+
+def post_body_text(content: Optional[str], blocks: Optional[List[Dict[str, Any]]]) -> str:
+    return "\n".join(part for part in (content, extract_block_text(blocks)) if part)
+
+
+def search_vector_expression(db: Session, title: Optional[str], body: str):
+    """
+    Post için saklanacak search_vector değerini üretir. PostgreSQL'de başlık
+    A, gövde B ağırlığıyla tsvector olur; diğer veritabanlarında katlanmış
+    düz metin saklanır.
+    """
+    folded_title, folded_body = fold_text(title), fold_text(body)
+    if db.get_bind().dialect.name != "postgresql":
+        return f"{folded_title}\n{folded_body}"
+    return func.setweight(func.to_tsvector(SEARCH_CONFIG, folded_title), "A").op("||")(
+        func.setweight(func.to_tsvector(SEARCH_CONFIG, folded_body), "B")
+    )
+
+
+def bulk_search_vector_expression(dialect_name: str):
+    """
+    Toplu INSERT (executemany) için search_vector ifadesi. Katlanmış metinler
+    her satırın search_title/search_body parametrelerinden okunur; bkz.
+    search_vector_params.
+    """
+    folded_title, folded_body = bindparam("search_title", type_=String), bindparam("search_body", type_=String)
+    if dialect_name != "postgresql":
+        return folded_title.concat("\n").concat(folded_body)
+    return func.setweight(func.to_tsvector(SEARCH_CONFIG, folded_title), "A").op("||")(
+        func.setweight(func.to_tsvector(SEARCH_CONFIG, folded_body), "B")
+    )
+
+
+def search_vector_params(title: Optional[str], body: str) -> Dict[str, str]:
+    return {"search_title": fold_text(title), "search_body": fold_text(body)}
+
+
+def refresh_search_vector(db: Session, post: Post) -> None:
+    """
+    Postun search_vector kolonunu başlık, içerik ve blok metninden yeniden hesaplar.
+    """
+    post.search_vector = search_vector_expression(db, post.title, post_body_text(post.content, post.blocks))
+
+
+def search_terms(search: str) -> List[str]:
+    return _TOKEN_RE.findall(fold_text(search))
+
+
+def apply_search(db: Session, query: Query, search: str) -> Query:
+    """
+    Sorguya tam metin arama filtresi ekler. Son kelime yazılırken de eşleşsin
+    diye her terim önek (prefix) olarak aranır.
+    """
+    terms = search_terms(search)
+    if not terms:
+        return query
+    if db.get_bind().dialect.name != "postgresql":
+        for term in terms:
+            query = query.filter(Post.search_vector.like(f"%{term}%"))
+        return query
+    return query.filter(Post.search_vector.op("@@")(_ts_query(terms)))
+
+
+def search_rank(db: Session, search: str):
+    """
+    Arama sonuçlarını sıralamak için kullanılacak skor ifadesi.
+    """
+    terms = search_terms(search)
+    if not terms or db.get_bind().dialect.name != "postgresql":
+        return literal(0.0)
+    return func.ts_rank_cd(Post.search_vector, _ts_query(terms))
+
+
+def _ts_query(terms: List[str]):
+    return func.to_tsquery(SEARCH_CONFIG, " & ".join(f"{term}:*" for term in terms))
+
+
+def make_snippet(text: str, search: str, radius: int = SNIPPET_RADIUS) -> str:
+    """
+    Metinde ilk eşleşmenin çevresinden bir kesit alır ve eşleşen kelimeleri
+    <mark> ile işaretler. Çıktı HTML-escape edilmiştir.
+    """
+    terms = search_terms(search)
+    folded = fold_text(text)
+    matches = []
+    if terms:
+        pattern = re.compile(r"\b(?:" + "|".join(re.escape(term) for term in terms) + r")\w*")
+        matches = [match.span() for match in pattern.finditer(folded)]
+
+    center = matches[0][0] if matches else 0
+    start = max(0, center - radius)
+    end = min(len(text), center + radius)
+
+    pieces = ["..." if start > 0 else ""]
+    cursor = start
+    for match_start, match_end in matches:
+        if match_end <= start or match_start >= end:
+            continue
+        match_start, match_end = max(match_start, start), min(match_end, end)
+        pieces.append(html.escape(text[cursor:match_start]))
+        pieces.append(f"<mark>{html.escape(text[match_start:match_end])}</mark>")
+        cursor = match_end
+    pieces.append(html.escape(text[cursor:end]))
+    pieces.append("..." if end < len(text) else "")
+    return "".join(pieces)
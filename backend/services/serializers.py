@@ -0,0 +1,78 @@
+import json
+from functools import lru_cache
+from typing import Any, List
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+from config import JSON_BACKEND
+from schemas.post import Post as PostSchema, PostListItem, PostListPage, FeaturedPostSchema
+from schemas.category import Category as CategorySchema
+from schemas.district import District as DistrictSchema
+from schemas.map import MapPost
+
+if JSON_BACKEND == "orjson":
+    try:
+        import orjson
+    except ImportError:
+        raise RuntimeError("JSON_BACKEND=orjson için 'orjson' paketini yükleyin")
+elif JSON_BACKEND != "json":
+    raise ValueError(f"Bilinmeyen JSON_BACKEND: {JSON_BACKEND}")
+
+# Okuma uçlarında en sık serileştirilen şemalar; adapter'ları import sırasında derlenir
+HOT_SCHEMAS = (PostSchema, PostListItem, PostListPage, FeaturedPostSchema, CategorySchema, DistrictSchema, MapPost)
+
+
+@lru_cache(maxsize=None)
+def adapter(schema, many: bool = False) -> TypeAdapter:
+    return TypeAdapter(List[schema] if many else schema)
+
+
+for _schema in HOT_SCHEMAS:
+    adapter(_schema)
+    adapter(_schema, many=True)
+
+
+def serialize(schema, obj: Any, many: bool = False) -> bytes:
+    """
+    ORM nesnesini (veya listesini) şema üzerinden doğrudan JSON bytes'a çevirir.
+    Öznitelikler tek doğrulama geçişinde okunur, JSON'a pydantic-core yazar;
+    FastAPI'nin response_model doğrulaması, jsonable_encoder ve json.dumps
+    adımları atlanır.
+    """
+    type_adapter = adapter(schema, many)
+    return type_adapter.dump_json(type_adapter.validate_python(obj, from_attributes=True))
+
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return jsonable_encoder(value)
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Zaten doğrulanmış veriyi JSON'a çevirir. Pydantic modelleri (ve tek tip
+    model listeleri) yeniden doğrulanmadan şemanın derlenmiş serializer'ıyla
+    yazılır; diğer veriler JSON_BACKEND'e göre orjson ya da json ile.
+    """
+    if isinstance(data, BaseModel):
+        return type(data).__pydantic_serializer__.to_json(data)
+    if isinstance(data, list) and data and isinstance(data[0], BaseModel) \
+            and all(type(item) is type(data[0]) for item in data):
+        return adapter(type(data[0]), many=True).dump_json(data)
+    if JSON_BACKEND == "orjson":
+        return orjson.dumps(data, default=_orjson_default)
+    return json.dumps(jsonable_encoder(data), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """
+    Hazır JSON bytes'ı olduğu gibi, diğer içeriği dumps ile yazan yanıt sınıfı.
+    JSON_BACKEND=orjson iken uygulamanın varsayılan yanıt sınıfıdır.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
@@ -1,7 +1,9 @@
 import re
 import unicodedata
-from sqlalchemy.orm import Session
-from models.post import Post
+from typing import Dict, List, Optional
+from sqlalchemy import BigInteger, and_, case, cast, func, inspect, literal, or_, select, union_all
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Türkçe karakter eşleştirme sözlüğü
 TURKISH_CHAR_MAP = {
@@ -13,29 +15,127 @@ TURKISH_CHAR_MAP = {
     'ç': 'c', 'Ç': 'c'
 }
 
-def create_slug(title: str, db: Session) -> str:
+# Eşzamanlı oluşturmalarda unique constraint çakışırsa tekrar deneme sayısı
+SLUG_RETRIES = 3
+# Toplu atamada tek sorguda aranacak en fazla kök slug sayısı
+SLUG_BATCH_SIZE = 200
+
+
+def is_slug_conflict(error: IntegrityError) -> bool:
+    """
+    Hata slug unique kısıtından mı geliyor? (Postgres: 'duplicate key ...
+    "ix_posts_slug"', SQLite: 'UNIQUE constraint failed: posts.slug')
+    """
+    message = str(error.orig).lower()
+    return "unique" in message and "slug" in message
+
+
+def slugify(text: str) -> str:
     """
-    Başlıktan slug oluşturur ve benzersiz olduğundan emin olur.
+    Metni URL'de kullanılabilecek slug'a çevirir.
     """
     # Türkçe karakterleri dönüştür
     for turkish_char, english_char in TURKISH_CHAR_MAP.items():
-        title = title.replace(turkish_char, english_char)
-    
+        text = text.replace(turkish_char, english_char)
+
     # Diğer özel karakterleri kaldır
-    title = unicodedata.normalize('NFKD', title).encode('ASCII', 'ignore').decode('ASCII')
-    
-    # Küçük harfe çevir ve özel karakterleri kaldır
-    slug = re.sub(r'[^a-z0-9]+', '-', title.lower())
-    
-    # Baştaki ve sondaki tireleri kaldır
-    slug = slug.strip('-')
-    
-    # Benzersiz slug oluştur
-    original_slug = slug
-    counter = 1
-    
-    while db.query(Post).filter(Post.slug == slug).first() is not None:
-        slug = f"{original_slug}-{counter}"
-        counter += 1
-    
-    return slug 
\ No newline at end of file
+    text = unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('ASCII')
+
+    # Küçük harfe çevir, özel karakterleri kaldır, baştaki ve sondaki tireleri sil
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+# Sayısal ek, BIGINT'e sığsın diye en fazla bu kadar hane
+MAX_SUFFIX_DIGITS = 18
+
+
+def _highest_suffix(model, base: str, exclude_id: Optional[int] = None):
+    """
+    base ve base-N slug'ları arasındaki en büyük N'yi tek satır olarak döndüren
+    sorgu: base dolu ama ekli slug yoksa 0, hiçbiri yoksa NULL. "base-foo-2"
+    gibi başka bir kökün slug'ları sayılmaz. slug, text_pattern_ops index'i
+    sayesinde önek aramasında index kullanılır.
+    """
+    suffix = func.substr(model.slug, len(base) + 2)
+    numbered = and_(
+        model.slug.like(f"{base}-%"),
+        func.length(suffix).between(1, MAX_SUFFIX_DIGITS),
+        # Sadece rakamlardan oluşuyor mu? (ltrim Postgres ve SQLite'ta aynı)
+        func.ltrim(suffix, "0123456789") == "",
+    )
+    query = select(func.max(case((model.slug == base, 0), else_=cast(suffix, BigInteger)))).where(
+        or_(model.slug == base, numbered)
+    )
+    if exclude_id is not None:
+        query = query.where(model.id != exclude_id)
+    return query
+
+
+def slug_after(base: str, highest: Optional[int]) -> str:
+    """Ailede en büyük ek highest iken (None: hiç kullanılmamış) sıradaki boş slug."""
+    return base if highest is None else f"{base}-{highest + 1}"
+
+
+async def allocate_slug(db: AsyncSession, model, text: str, exclude_id: Optional[int] = None) -> str:
+    """
+    model tablosunda text için boş slug'ı tek sorguda bulur.
+    exclude_id verilirse o kaydın kendi slug'ı dolu sayılmaz (yeniden adlandırma).
+    """
+    base = slugify(text)
+    return slug_after(base, await db.scalar(_highest_suffix(model, base, exclude_id)))
+
+
+async def allocate_slugs(db: AsyncSession, model, texts: List[str]) -> List[str]:
+    """
+    İçe aktarma gibi toplu işler için: tüm metinlere, birbirleriyle de
+    çakışmayacak şekilde slug atar. Kök slug başına bir sorgu yerine
+    SLUG_BATCH_SIZE'lık gruplar halinde, her kök için tek satır dönen
+    sorguların UNION ALL'u ile sorgular.
+    """
+    bases = [slugify(text) for text in texts]
+    highest: Dict[str, Optional[int]] = dict.fromkeys(bases)
+    unique_bases = list(highest)
+    for start in range(0, len(unique_bases), SLUG_BATCH_SIZE):
+        chunk = unique_bases[start:start + SLUG_BATCH_SIZE]
+        query = union_all(*(
+            _highest_suffix(model, base).add_columns(literal(index).label("position"))
+            for index, base in enumerate(chunk)
+        ))
+        for value, position in (await db.execute(query)).all():
+            highest[chunk[position]] = value
+
+    slugs: List[str] = []
+    assigned = set()
+    for base in bases:
+        # Aynı toplu işte başka bir kökten gelmiş olabilir ("a" -> "a-1" ve "a-1")
+        while True:
+            slug = slug_after(base, highest[base])
+            highest[base] = 0 if highest[base] is None else highest[base] + 1
+            if slug not in assigned:
+                break
+        assigned.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+async def save_with_slug(db: AsyncSession, instance, text: str, retries: int = SLUG_RETRIES) -> None:
+    """
+    instance'a slug atayıp flush eder. Aynı anda aynı slug'ı alan başka bir
+    istek varsa unique constraint hatası savepoint'e geri alınır ve slug
+    yeniden hesaplanır.
+    """
+    model = type(instance)
+    # Savepoint geri alınınca kayıtlı nesnenin kolonları expire olur; instance.id'yi
+    # sonra okumak AsyncSession'da örtük lazy load'a yol açar. Kimlik baştan alınır.
+    identity = inspect(instance).identity
+    exclude_id = identity[0] if identity else None
+    for attempt in range(retries):
+        try:
+            async with db.begin_nested():
+                instance.slug = await allocate_slug(db, model, text, exclude_id=exclude_id)
+                db.add(instance)
+        except IntegrityError:
+            if attempt == retries - 1:
+                raise
+        else:
+            return
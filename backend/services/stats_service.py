@@ -0,0 +1,153 @@
+from collections import Counter, namedtuple
+from typing import Dict, Iterable, Tuple
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.post import Post
+from models.user import User
+from models.category import Category
+from models.district import District
+from models.stat_counter import StatCounter
+
+# Bir postun sayaçlara etki eden alanları
+PostKey = namedtuple("PostKey", ["status", "category_id", "district_id", "author_id"])
+CounterKey = Tuple[str, int, str]
+
+ALL = "all"
+
+
+def post_key(post) -> PostKey:
+    status = post.status.value if hasattr(post.status, "value") else post.status
+    return PostKey(status, post.category_id, post.district_id, post.author_id)
+
+
+def _post_counter_keys(key: PostKey) -> Iterable[CounterKey]:
+    yield ("posts", 0, key.status)
+    yield ("category", key.category_id or 0, key.status)
+    yield ("district", key.district_id or 0, key.status)
+    yield ("author", key.author_id or 0, key.status)
+
+
+def post_deltas(before: Iterable[PostKey] = (), after: Iterable[PostKey] = ()) -> Dict[CounterKey, int]:
+    """
+    Postların önceki ve sonraki hallerinden sayaç farklarını hesaplar.
+    Değişmeyen sayaçlar sonuçta yer almaz.
+    """
+    deltas = Counter()
+    for key in before:
+        for counter in _post_counter_keys(key):
+            deltas[counter] -= 1
+    for key in after:
+        for counter in _post_counter_keys(key):
+            deltas[counter] += 1
+    return {counter: delta for counter, delta in deltas.items() if delta}
+
+
+def entity_delta(dimension: str, delta: int) -> Dict[CounterKey, int]:
+    return {(dimension, 0, ALL): delta}
+
+
+def orphaned_author_deltas(db: Session, user_id: int) -> Dict[CounterKey, int]:
+    """
+    Kullanıcı silinince postlarının author_id'si boşalır; yazar sayaçlarını
+    atanmamış (0) yazara taşıyan farkları döndürür.
+    """
+    deltas = {}
+    rows = db.execute(
+        select(Post.status, func.count()).where(Post.author_id == user_id).group_by(Post.status)
+    ).all()
+    for status, count in rows:
+        status = status.value if hasattr(status, "value") else status
+        deltas[("author", user_id, status)] = -count
+        deltas[("author", 0, status)] = count
+    return deltas
+
+
+def _upsert(dialect: str, deltas: Dict[CounterKey, int]):
+    insert = pg_insert if dialect == "postgresql" else sqlite_insert
+    stmt = insert(StatCounter).values([
+        {"dimension": dimension, "dimension_id": dimension_id, "status": status, "count": delta}
+        for (dimension, dimension_id, status), delta in sorted(deltas.items())
+    ])
+    return stmt.on_conflict_do_update(
+        index_elements=[StatCounter.dimension, StatCounter.dimension_id, StatCounter.status],
+        set_={"count": StatCounter.count + stmt.excluded.count}
+    )
+
+
+async def apply_deltas(db: AsyncSession, deltas: Dict[CounterKey, int]) -> None:
+    """
+    Sayaç farklarını tek INSERT ... ON CONFLICT ile uygular. Yazma işlemiyle
+    aynı transaction'da çağrılmalıdır ki sayaçlar verilerle tutarlı kalsın.
+    """
+    if deltas:
+        await db.execute(_upsert(db.get_bind().dialect.name, deltas))
+
+
+def apply_deltas_sync(db: Session, deltas: Dict[CounterKey, int]) -> None:
+    if deltas:
+        db.execute(_upsert(db.get_bind().dialect.name, deltas))
+
+
+def rebuild_counters(db: Session) -> None:
+    """
+    Tüm sayaçları tablolardan baştan hesaplar (ilk kurulum veya tutarsızlık
+    şüphesinde).
+    """
+    rows = db.execute(
+        select(Post.status, Post.category_id, Post.district_id, Post.author_id, func.count())
+        .group_by(Post.status, Post.category_id, Post.district_id, Post.author_id)
+    ).all()
+    deltas = Counter()
+    for status, category_id, district_id, author_id, count in rows:
+        for counter, delta in post_deltas(after=[post_key(PostKey(status, category_id, district_id, author_id))]).items():
+            deltas[counter] += delta * count
+    deltas.update(entity_delta("users", db.scalar(select(func.count()).select_from(User))))
+    deltas.update(entity_delta("categories", db.scalar(select(func.count()).select_from(Category))))
+
+    db.execute(delete(StatCounter))
+    apply_deltas_sync(db, {counter: count for counter, count in deltas.items() if count})
+    db.commit()
+
+
+async def read_stats(db: AsyncSession) -> dict:
+    """
+    Tüm sayaçları kategori/ilçe/yazar adlarıyla birlikte tek sorguda okur
+    ve dashboard'un beklediği yapıya çevirir.
+    """
+    rows = (await db.execute(
+        select(
+            StatCounter.dimension, StatCounter.dimension_id, StatCounter.status, StatCounter.count,
+            Category.name, District.name, User.first_name, User.last_name
+        )
+        .outerjoin(Category, and_(StatCounter.dimension == "category", Category.id == StatCounter.dimension_id))
+        .outerjoin(District, and_(StatCounter.dimension == "district", District.id == StatCounter.dimension_id))
+        .outerjoin(User, and_(StatCounter.dimension == "author", User.id == StatCounter.dimension_id))
+        .where(StatCounter.count != 0)
+    )).all()
+
+    stats = {"users": 0, "categories": 0, "posts": {"total": 0, "by_status": {}}}
+    breakdowns = {"category": {}, "district": {}, "author": {}}
+    for dimension, dimension_id, status, count, category_name, district_name, first_name, last_name in rows:
+        if dimension in ("users", "categories"):
+            stats[dimension] = count
+        elif dimension == "posts":
+            stats["posts"]["total"] += count
+            stats["posts"]["by_status"][status] = count
+        elif dimension in breakdowns:
+            name = {
+                "category": category_name,
+                "district": district_name,
+                "author": " ".join(part for part in (first_name, last_name) if part) or None,
+            }[dimension]
+            entry = breakdowns[dimension].setdefault(
+                dimension_id, {"id": dimension_id or None, "name": name, "total": 0, "by_status": {}}
+            )
+            entry["total"] += count
+            entry["by_status"][status] = count
+
+    for dimension, entries in breakdowns.items():
+        stats[f"posts_by_{dimension}"] = sorted(entries.values(), key=lambda entry: -entry["total"])
+    return stats
@@ -0,0 +1,95 @@
+import hashlib
+import heapq
+import math
+import threading
+import time
+from typing import Dict, List, Tuple
+from config import TOKEN_DENYLIST_CAPACITY
+
+
+class BloomFilter:
+    """
+    Sabit boyutlu bloom filter. "Yok" cevabı kesindir, "var" cevabı
+    error_rate olasılıkla yanlış olabilir.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.sha256(key.encode()).digest()
+        # Kirsch-Mitzenmacher: iki hash'ten k pozisyon türet
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:16], "big") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class TokenDenylist:
+    """
+    İptal edilmiş access token jti'leri. İsteklerin neredeyse tamamı iptal
+    edilmemiş token taşıdığından önce bloom filter'a bakılır; yalnızca
+    "belki" cevabında kesin küme kontrol edilir. Süresi dolan kayıtlar
+    bitiş zamanına göre sıralı bir heap'ten silinir; filtre ancak kurulduğundan
+    beri capacity kadar ekleme olunca yeniden kurulur, canlı kayıtlar
+    kapasitenin yarısını aşıyorsa kapasite ikiye katlanır. Böylece ekleme
+    maliyeti amortize O(log n) kalır.
+
+    Süreç içi tutulur: bir worker'da yapılan çıkış diğer worker'larda token'ı
+    iptal etmez, orada token süresi dolana kadar (ACCESS_TOKEN_EXPIRE_MINUTES)
+    geçerli kalır. Yenileme token'ı ise veritabanında iptal edildiği için
+    hiçbir worker'da yeni access token alınamaz.
+    """
+
+    def __init__(self, capacity: int = TOKEN_DENYLIST_CAPACITY):
+        self.capacity = capacity
+        self._bloom = BloomFilter(capacity)
+        self._bloom_inserts = 0
+        self._expires: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def add(self, jti: str, expires_at: float) -> None:
+        with self._lock:
+            self._drop_expired(time.time())
+            self._expires[jti] = expires_at
+            heapq.heappush(self._heap, (expires_at, jti))
+            self._bloom.add(jti)
+            self._bloom_inserts += 1
+            if self._bloom_inserts > self.capacity:
+                self._rebuild_bloom()
+
+    def __contains__(self, jti: str) -> bool:
+        if jti not in self._bloom:
+            return False
+        expires_at = self._expires.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def _drop_expired(self, now: float) -> None:
+        while self._heap and self._heap[0][0] <= now:
+            expires_at, jti = heapq.heappop(self._heap)
+            # Aynı jti tekrar eklendiyse sadece son kaydı geçerlidir
+            if self._expires.get(jti) == expires_at:
+                del self._expires[jti]
+
+    def _rebuild_bloom(self) -> None:
+        if len(self._expires) > self.capacity // 2:
+            self.capacity *= 2
+        self._bloom = BloomFilter(self.capacity)
+        for jti in self._expires:
+            self._bloom.add(jti)
+        self._bloom_inserts = len(self._expires)
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+
+denylist = TokenDenylist()
@@ -0,0 +1,115 @@
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from models.refresh_token import RefreshToken
+from models.user import User
+from services.token_denylist import denylist
+from config import REFRESH_TOKEN_EXPIRE_DAYS
+
+
+def _hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _invalid_refresh_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def issue_refresh_token(db: AsyncSession, user_id: int, family_id: Optional[str] = None) -> Tuple[str, RefreshToken]:
+    """
+    Yeni bir yenileme token'ı üretir ve özetini kaydeder (commit çağıranda).
+    Ham token yalnızca istemciye bir kez döndürülür.
+    """
+    token = secrets.token_urlsafe(48)
+    record = RefreshToken(
+        user_id=user_id,
+        token_hash=_hash_token(token),
+        family_id=family_id or uuid.uuid4().hex,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+    )
+    db.add(record)
+    await db.flush()
+    return token, record
+
+
+def _revoke(*criteria):
+    return (
+        update(RefreshToken)
+        .where(*criteria, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
+
+
+async def _revoke_family(db: AsyncSession, family_id: str) -> None:
+    await db.execute(_revoke(RefreshToken.family_id == family_id))
+
+
+async def revoke_user_refresh_tokens(db: AsyncSession, user_id: int) -> None:
+    """
+    Kullanıcının tüm yenileme token ailelerini iptal eder (parola sıfırlama).
+    Commit çağıranda; değişiklikle aynı transaction'da kalır.
+    """
+    await db.execute(_revoke(RefreshToken.user_id == user_id))
+
+
+def revoke_user_refresh_tokens_sync(db: Session, user_id: int) -> None:
+    db.execute(_revoke(RefreshToken.user_id == user_id))
+
+
+async def rotate_refresh_token(db: AsyncSession, token: str) -> Tuple[User, str]:
+    """
+    Yenileme token'ını kullanılmış sayıp aynı aileden yenisini verir.
+    Önceden kullanılmış bir token gelirse çalınmış kabul edilir ve aile iptal edilir.
+    """
+    record = await db.scalar(
+        select(RefreshToken).where(RefreshToken.token_hash == _hash_token(token)).with_for_update()
+    )
+    if record is None:
+        raise _invalid_refresh_token()
+    if record.revoked_at is not None:
+        await _revoke_family(db, record.family_id)
+        await db.commit()
+        raise _invalid_refresh_token()
+    expires_at = record.expires_at if record.expires_at.tzinfo else record.expires_at.replace(tzinfo=timezone.utc)
+    if expires_at <= datetime.now(timezone.utc):
+        raise _invalid_refresh_token()
+
+    user = await db.get(User, record.user_id)
+    if user is None or not user.is_active:
+        raise _invalid_refresh_token()
+
+    new_token, new_record = await issue_refresh_token(db, user.id, record.family_id)
+    record.revoked_at = datetime.now(timezone.utc)
+    record.replaced_by_id = new_record.id
+    await db.commit()
+    return user, new_token
+
+
+async def revoke_refresh_token(db: AsyncSession, token: str) -> None:
+    """Çıkışta token'ın ait olduğu aileyi iptal eder."""
+    record = await db.scalar(select(RefreshToken).where(RefreshToken.token_hash == _hash_token(token)))
+    if record is not None:
+        await _revoke_family(db, record.family_id)
+        await db.commit()
+
+
+def revoke_access_token(payload: dict) -> None:
+    """Access token'ı süresi dolana kadar denylist'e ekler."""
+    jti = payload.get("jti")
+    if jti:
+        denylist.add(jti, float(payload.get("exp", 0)))
+
+
+def is_access_token_revoked(payload: dict) -> bool:
+    jti = payload.get("jti")
+    return bool(jti) and jti in denylist
@@ -0,0 +1,141 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+# config import edilmeden önce: testler geçici bir SQLite dosyasında çalışır
+_DB_PATH = os.path.join(tempfile.mkdtemp(prefix="istancool-tests-"), "test.db")
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{_DB_PATH}",
+    "SECRET_KEY": "test-secret",
+    "ALGORITHM": "HS256",
+    "BCRYPT_ROUNDS": "4",
+    "CACHE_BACKEND": "memory",
+    "AUTH_TRUST_TOKEN_CLAIMS": "false",
+    "CREATE_TABLES_ON_STARTUP": "false",
+    "SEED_ON_STARTUP": "false",
+})
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import models.refresh_token, models.stat_counter, models.seed_state, models.post_snapshot  # noqa: F401
+from database import Base, SessionLocal, engine
+from functions.auth_functions import create_access_token, get_password_hash
+from models.category import Category
+from models.post import Post, PostStatus
+from models.user import User, UserRole
+from services.cache import cache
+from services.post_summary import refresh_summary
+from services.principal_cache import principal_cache, token_claims
+from services.search_service import refresh_search_vector
+from services.stats_service import apply_deltas_sync, entity_delta, post_deltas, post_key
+
+PASSWORD = "test-password"
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    cache.clear()
+    principal_cache.clear()
+    yield
+
+
+@pytest.fixture
+def client():
+    # Context manager kullanılmaz; startup (create_all/seed) çalışmasın
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def make_user(db):
+    counter = iter(range(1, 1000))
+
+    def factory(role: UserRole = UserRole.USER, **values) -> User:
+        number = next(counter)
+        user = User(
+            email=values.pop("email", f"user{number}@test.dev"),
+            first_name=values.pop("first_name", "Test"),
+            last_name=values.pop("last_name", f"User{number}"),
+            hashed_password=get_password_hash(PASSWORD),
+            role=role,
+            **values,
+        )
+        db.add(user)
+        apply_deltas_sync(db, entity_delta("users", 1))
+        db.commit()
+        return user
+    return factory
+
+
+@pytest.fixture
+def make_category(db):
+    counter = iter(range(1, 1000))
+
+    def factory(**values) -> Category:
+        number = next(counter)
+        category = Category(
+            name=values.pop("name", f"Kategori {number}"),
+            slug=values.pop("slug", f"kategori-{number}"),
+            color="#ffffff",
+            **values,
+        )
+        db.add(category)
+        apply_deltas_sync(db, entity_delta("categories", 1))
+        db.commit()
+        return category
+    return factory
+
+
+@pytest.fixture
+def make_post(db):
+    counter = iter(range(1, 10000))
+    base_time = datetime(2024, 1, 1)
+
+    def factory(author: User, category: Category, status: PostStatus = PostStatus.APPROVED, **values) -> Post:
+        number = next(counter)
+        post = Post(
+            title=values.pop("title", f"Post {number}"),
+            slug=values.pop("slug", f"post-{number}"),
+            content=values.pop("content", "içerik"),
+            blocks=values.pop("blocks", [{"type": "text", "content": "içerik"}]),
+            status=status,
+            category_id=category.id,
+            author_id=author.id,
+            created_at=values.pop("created_at", base_time + timedelta(minutes=number)),
+            **values,
+        )
+        # Türetilmiş kolonlar create_post'taki gibi hesaplanır
+        refresh_summary(post)
+        refresh_search_vector(db, post)
+        db.add(post)
+        db.flush()
+        apply_deltas_sync(db, post_deltas(after=[post_key(post)]))
+        db.commit()
+        return post
+    return factory
+
+
+@pytest.fixture
+def auth_headers():
+    def factory(user: User) -> dict:
+        return {"Authorization": f"Bearer {create_access_token(token_claims(user))}"}
+    return factory
+
+
+@pytest.fixture
+def login(client):
+    def factory(user: User) -> dict:
+        response = client.post("/auth/login", json={"email": user.email, "password": PASSWORD})
+        assert response.status_code == 200
+        return response.json()
+    return factory
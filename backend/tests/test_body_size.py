@@ -0,0 +1,75 @@
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
+from fastapi.testclient import TestClient
+
+from middlewares.body_size import BodySizeLimitMiddleware
+
+LIMIT = 1024
+BOUNDARY = "test-boundary"
+
+
+@pytest.fixture
+def upload_client():
+    app = FastAPI()
+    app.add_middleware(BodySizeLimitMiddleware, max_body_size=LIMIT)
+
+    @app.post("/upload")
+    async def upload(title: str = Form(...), file: Optional[UploadFile] = File(None)):
+        return {"title": title, "size": len(await file.read()) if file else 0}
+
+    @app.post("/raw")
+    async def raw(request: Request):
+        # Gövde okuma hatalarını 400'e çeviren bir ayrıştırıcı gibi davranır
+        try:
+            return {"size": len(await request.body())}
+        except Exception:
+            raise HTTPException(status_code=400, detail="There was an error parsing the body")
+
+    return TestClient(app)
+
+
+def _multipart(file_size: int, chunk_size: int = 256):
+    """Content-Length olmadan (chunked) gönderilecek multipart gövde."""
+    yield (
+        f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"title\"\r\n\r\nbaşlık\r\n"
+        f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"a.jpg\"\r\n"
+        "Content-Type: image/jpeg\r\n\r\n"
+    ).encode()
+    for start in range(0, file_size, chunk_size):
+        yield b"x" * min(chunk_size, file_size - start)
+    yield f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def _post_chunked(client, file_size, path="/upload"):
+    return client.post(
+        path, content=_multipart(file_size),
+        headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"}
+    )
+
+
+def test_chunked_upload_over_limit_gets_413(upload_client):
+    response = _post_chunked(upload_client, LIMIT * 4)
+
+    assert response.status_code == 413
+    assert str(LIMIT) in response.json()["detail"]
+
+
+def test_413_is_sent_even_if_the_app_wraps_body_errors(upload_client):
+    response = _post_chunked(upload_client, LIMIT * 4, path="/raw")
+
+    assert response.status_code == 413
+
+
+def test_chunked_upload_under_limit_passes(upload_client):
+    response = _post_chunked(upload_client, LIMIT // 2)
+
+    assert response.status_code == 200
+    assert response.json() == {"title": "başlık", "size": LIMIT // 2}
+
+
+def test_content_length_over_limit_is_rejected_before_reading(upload_client):
+    response = upload_client.post("/upload", data={"title": "x"}, files={"file": ("a.jpg", b"x" * LIMIT * 2)})
+
+    assert response.status_code == 413
@@ -0,0 +1,46 @@
+import asyncio
+import threading
+
+from services.cache import MemoryCacheBackend, ResponseCache
+
+
+class RecordingBackend(MemoryCacheBackend):
+    blocking = True
+
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key, value, ttl, tags=()):
+        self.threads.append(threading.get_ident())
+        super().set(key, value, ttl, tags)
+
+
+def test_blocking_backend_is_called_off_the_event_loop():
+    cache = ResponseCache(RecordingBackend())
+
+    async def run():
+        await cache.set("posts:1", b"body", tags=["posts"])
+        value = await cache.get("posts:1")
+        await cache.invalidate("posts")
+        return threading.get_ident(), value, await cache.get("posts:1")
+
+    loop_thread, value, after_invalidate = asyncio.run(run())
+
+    assert value == b"body" and after_invalidate is None
+    assert cache.backend.threads and loop_thread not in cache.backend.threads
+
+
+def test_memory_backend_stays_on_the_event_loop():
+    cache = ResponseCache(MemoryCacheBackend())
+
+    async def run():
+        await cache.set("posts:1", b"body")
+        return await cache.get("posts:1")
+
+    assert asyncio.run(run()) == b"body"
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,74 @@
+import gzip
+import json
+
+from models.user import UserRole
+from services.cache import cache
+from services.compression import choose_encoding
+
+
+def _featured(make_user, make_category, make_post, count=10):
+    author, category = make_user(), make_category()
+    for order in range(count):
+        make_post(author, category, is_featured=True, featured_order=order, content="Boğaz kıyısında bir yürüyüş " * 10)
+
+
+def test_encoding_negotiation_respects_q_values():
+    assert choose_encoding("deflate, gzip") == "gzip"
+    assert choose_encoding("gzip;q=0, identity") is None
+    assert choose_encoding("*;q=0.5") is not None
+    assert choose_encoding("identity") is None
+    assert choose_encoding(None) is None
+
+
+def test_large_json_is_gzipped_with_weak_etag(client, make_user, make_category, make_post):
+    _featured(make_user, make_category, make_post)
+
+    plain = client.get("/posts/featured", headers={"Accept-Encoding": "identity"})
+    zipped = client.get("/posts/featured", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in plain.headers
+    assert zipped.headers["content-encoding"] == "gzip"
+    assert zipped.headers["vary"] == "Accept-Encoding"
+    assert zipped.headers["etag"] == f"W/{plain.headers['etag']}"
+    assert zipped.json() == plain.json()
+
+
+def test_compressed_variant_is_cached_next_to_the_body(client, make_user, make_category, make_post):
+    _featured(make_user, make_category, make_post)
+    client.get("/posts/featured", headers={"Accept-Encoding": "gzip"})
+
+    variant = cache.backend.get("posts:featured:0:10:gzip")
+    etag, compressed = variant.split(b"\n", 1)
+    response = client.get("/posts/featured", headers={"Accept-Encoding": "gzip"})
+
+    assert json.loads(gzip.decompress(compressed)) == response.json()
+    assert response.headers["etag"] == f"W/{etag.decode()}"
+
+
+def test_weak_etag_of_a_compressed_variant_revalidates(client, make_user, make_category, make_post):
+    _featured(make_user, make_category, make_post)
+    etag = client.get("/posts/featured", headers={"Accept-Encoding": "gzip"}).headers["etag"]
+
+    response = client.get("/posts/featured", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_small_responses_are_not_compressed(client):
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+
+
+def test_streamed_export_is_compressed_chunk_by_chunk(client, make_user, make_category, make_post, auth_headers):
+    admin = make_user(UserRole.ADMIN)
+    category = make_category()
+    for _ in range(20):
+        make_post(admin, category)
+
+    response = client.get("/posts/export", headers={**auth_headers(admin), "Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert len(response.text.splitlines()) == 20
@@ -0,0 +1,45 @@
+def test_post_detail_answers_if_none_match_with_304(client, make_user, make_category, make_post):
+    post = make_post(make_user(), make_category())
+
+    first = client.get(f"/posts/{post.id}")
+    etag = first.headers["etag"]
+    cached = client.get(f"/posts/{post.id}", headers={"If-None-Match": f'"other", W/{etag}'})
+
+    assert first.status_code == 200 and "last-modified" in first.headers
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+
+def test_post_detail_etag_changes_after_update(client, make_user, make_category, make_post, auth_headers):
+    author = make_user()
+    post = make_post(author, make_category())
+    etag = client.get(f"/posts/{post.id}").headers["etag"]
+
+    client.put(f"/posts/{post.id}", json={"title": "Yeni başlık"}, headers=auth_headers(author))
+    response = client.get(f"/posts/{post.id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "Yeni başlık"
+    assert response.headers["etag"] != etag
+
+
+def test_category_answers_if_modified_since_with_304(client, make_category):
+    category = make_category()
+
+    first = client.get(f"/categories/{category.id}")
+    cached = client.get(f"/categories/{category.id}", headers={"If-Modified-Since": first.headers["last-modified"]})
+    stale = client.get(f"/categories/{category.id}", headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"})
+
+    assert cached.status_code == 304
+    assert stale.status_code == 200
+
+
+def test_cached_list_revalidates_with_etag(client, make_category):
+    make_category(show_on_homepage=True)
+
+    first = client.get("/categories/homepage")
+    cached = client.get("/categories/homepage", headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == 200 and len(first.json()) == 1
+    assert cached.status_code == 304
@@ -0,0 +1,29 @@
+from models.post import Post
+from models.user import UserRole
+
+
+def test_featured_order_rejects_duplicates_and_unknown_ids(client, make_user, make_category, make_post, auth_headers):
+    admin, category = make_user(UserRole.ADMIN), make_category()
+    post = make_post(admin, category)
+    headers = auth_headers(admin)
+
+    duplicate = client.post("/posts/featured/order", json={"post_ids": [post.id, post.id]}, headers=headers)
+    unknown = client.post("/posts/featured/order", json={"post_ids": [post.id, 999]}, headers=headers)
+
+    assert duplicate.status_code == 400
+    assert unknown.status_code == 404
+    assert unknown.json()["detail"]["ids"] == [999]
+
+
+def test_featured_order_replaces_previous_selection(client, db, make_user, make_category, make_post, auth_headers):
+    admin, category = make_user(UserRole.ADMIN), make_category()
+    first, second, third = (make_post(admin, category) for _ in range(3))
+    headers = auth_headers(admin)
+    client.post("/posts/featured/order", json={"post_ids": [first.id, second.id]}, headers=headers)
+
+    response = client.post("/posts/featured/order", json={"post_ids": [third.id, second.id]}, headers=headers)
+
+    assert response.status_code == 200
+    db.expire_all()
+    featured = {post.id: (post.is_featured, post.featured_order) for post in db.query(Post)}
+    assert featured == {first.id: (False, None), second.id: (True, 1), third.id: (True, 0)}
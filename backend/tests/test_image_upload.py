@@ -0,0 +1,70 @@
+import asyncio
+import io
+import threading
+import time
+
+import pytest
+from fastapi import UploadFile
+
+import services.cloudinary_service as cloudinary_service
+from config import UPLOAD_CONCURRENCY
+from services.cloudinary_service import ImageUploadError, upload_images
+
+
+class FakeUploader:
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.running = self.peak = 0
+        self.timeouts, self.destroyed = [], []
+        self._lock = threading.Lock()
+
+    def upload_large(self, stream, timeout=None, **options):
+        name = stream.read().decode()
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.timeouts.append(timeout)
+        time.sleep(0.02)
+        with self._lock:
+            self.running -= 1
+        if name in self.fail:
+            raise RuntimeError("bağlantı koptu")
+        return {"secure_url": f"https://cdn/{name}.jpg", "public_id": name, "resource_type": "image"}
+
+    def destroy(self, public_id, resource_type=None, timeout=None):
+        self.destroyed.append(public_id)
+
+
+@pytest.fixture
+def uploader(monkeypatch):
+    def install(**options):
+        fake = FakeUploader(**options)
+        monkeypatch.setattr(cloudinary_service, "get_uploader", lambda: fake)
+        return fake
+    return install
+
+
+def _files(count):
+    return {f"block_image_{index}": UploadFile(io.BytesIO(f"img{index}".encode()), filename="a.jpg") for index in range(count)}
+
+
+def test_uploads_never_queue_behind_busy_threads(uploader):
+    fake = uploader()
+
+    urls = asyncio.run(upload_images(_files(UPLOAD_CONCURRENCY * 3)))
+
+    assert len(urls) == UPLOAD_CONCURRENCY * 3
+    assert urls["block_image_0"] == "https://cdn/img0.jpg"
+    assert fake.peak <= UPLOAD_CONCURRENCY
+    # Zaman aşımı SDK'ya verilir, thread'deki çağrının kendisini sınırlar
+    assert set(fake.timeouts) == {cloudinary_service.UPLOAD_TIMEOUT}
+
+
+def test_failed_batch_deletes_uploaded_assets(uploader):
+    fake = uploader(fail={"img1"})
+
+    with pytest.raises(ImageUploadError) as error:
+        asyncio.run(upload_images(_files(3)))
+
+    assert list(error.value.failed) == ["block_image_1"]
+    assert sorted(fake.destroyed) == ["img0", "img2"]
@@ -0,0 +1,29 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from models.post import Post
+from services.map_service import bbox_condition
+
+
+def test_bbox_returns_only_points_inside(client, make_user, make_category, make_post):
+    author, category = make_user(), make_category()
+    inside = make_post(author, category, latitude=41.01, longitude=28.97)
+    make_post(author, category, latitude=41.01, longitude=30.50)  # aynı enlem bandı, bbox dışı
+    make_post(author, category, latitude=39.00, longitude=28.97)
+
+    response = client.get("/posts/map", params={"bbox": "28.9,40.9,29.1,41.1", "zoom": 20})
+
+    assert response.status_code == 200
+    assert [point["id"] for point in response.json()["points"]] == [inside.id]
+
+
+def test_postgres_bbox_query_matches_gist_index_expression():
+    index = next(index for index in Post.__table__.indexes if index.name == "ix_posts_location")
+    dialect = postgresql.dialect()
+
+    index_sql = str(CreateIndex(index).compile(dialect=dialect))
+    query_sql = str(select(Post.id).where(bbox_condition("postgresql", (28.9, 40.9, 29.1, 41.1))).compile(dialect=dialect))
+
+    assert "USING gist (point(longitude, latitude))" in index_sql
+    assert "point(posts.longitude, posts.latitude) <@ box(" in query_sql
@@ -0,0 +1,51 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+import functions.auth_functions as auth_functions
+from config import PASSWORD_HASH_RETRY_AFTER
+
+
+def test_full_queue_is_rejected_with_503(monkeypatch):
+    monkeypatch.setattr(auth_functions, "PASSWORD_HASH_MAX_QUEUE", 2)
+    release = threading.Event()
+
+    async def run():
+        running = [asyncio.create_task(auth_functions._run_hash_job(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        try:
+            with pytest.raises(HTTPException) as error:
+                await auth_functions._run_hash_job(lambda: "hash")
+        finally:
+            release.set()
+        await asyncio.gather(*running)
+        return error.value, await auth_functions._run_hash_job(lambda: "hash")
+
+    rejected, after_drain = asyncio.run(run())
+
+    assert rejected.status_code == 503
+    assert rejected.headers["Retry-After"] == str(PASSWORD_HASH_RETRY_AFTER)
+    assert after_drain == "hash"
+    assert auth_functions._hash_pending == 0
+
+
+def test_login_returns_503_while_the_pool_is_saturated(client, make_user, monkeypatch):
+    user = make_user()
+    monkeypatch.setattr(auth_functions, "_hash_pending", auth_functions.PASSWORD_HASH_MAX_QUEUE)
+
+    response = client.post("/auth/login", json={"email": user.email, "password": "test-password"})
+
+    assert response.status_code == 503
+    assert "retry-after" in response.headers
+
+
+def test_hashing_runs_off_the_event_loop():
+    async def run():
+        return threading.current_thread().name, await auth_functions._run_hash_job(lambda: threading.current_thread().name)
+
+    loop_thread, worker_thread = asyncio.run(run())
+
+    assert loop_thread != worker_thread
+    assert worker_thread.startswith("password-hash")
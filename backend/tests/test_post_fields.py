@@ -0,0 +1,53 @@
+from sqlalchemy import event
+
+from database import engine
+from functions.backfill_posts import backfill_search_vectors, backfill_summaries
+
+
+def test_default_list_leaves_heavy_columns_out(client, make_user, make_category, make_post):
+    make_post(make_user(), make_category())
+
+    item = client.get("/posts/").json()["items"][0]
+
+    assert "content" not in item and "blocks" not in item
+    assert item["category"]["name"] == "Kategori 1"
+
+
+def test_fields_projects_requested_columns_and_relations(client, make_user, make_category, make_post):
+    post = make_post(make_user(), make_category(), content="Karaköy")
+
+    response = client.get("/posts/", params={"fields": "title,content,category"})
+
+    assert response.status_code == 200
+    item, = response.json()["items"]
+    assert set(item) == {"id", "title", "content", "category"}
+    assert (item["id"], item["content"]) == (post.id, "Karaköy")
+    assert set(item["category"]) == {"id", "name", "slug", "color"}
+
+
+def test_unknown_fields_are_rejected(client):
+    response = client.get("/posts/", params={"fields": "title,hashed_password"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["fields"] == ["hashed_password"]
+
+
+def test_backfill_loads_bodies_with_the_batch(make_user, make_category, make_post):
+    author, category = make_user(), make_category()
+    for _ in range(30):
+        make_post(author, category)
+    selects = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        backfill_summaries()
+        backfill_search_vectors()
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    # Her görev için: bir batch + boş dönen son sorgu; post başına ek sorgu yok
+    assert len(selects) == 4
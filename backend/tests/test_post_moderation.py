@@ -0,0 +1,48 @@
+from models.post import Post, PostStatus
+from models.user import UserRole
+
+
+def _results(response):
+    return {item["id"]: item["result"] for item in response.json()["results"]}
+
+
+def test_bulk_approve_reports_updated_and_not_found(client, db, make_user, make_category, make_post, auth_headers):
+    admin, category = make_user(UserRole.ADMIN), make_category()
+    pending = [make_post(admin, category, status=PostStatus.PENDING) for _ in range(3)]
+
+    response = client.post(
+        "/posts/bulk", json={"action": "approve", "ids": [post.id for post in pending] + [999]},
+        headers=auth_headers(admin)
+    )
+
+    assert response.status_code == 200
+    assert response.json()["updated"] == 3
+    assert _results(response) == {**{post.id: "updated" for post in pending}, 999: "not_found"}
+    db.expire_all()
+    assert {db.get(Post, post.id).status for post in pending} == {PostStatus.APPROVED}
+
+
+def test_bulk_toggle_status_forbids_other_authors_posts(client, db, make_user, make_category, make_post, auth_headers):
+    owner, other, category = make_user(), make_user(), make_category()
+    own_post = make_post(owner, category)
+    foreign_post = make_post(other, category)
+
+    response = client.post(
+        "/posts/bulk", json={"action": "toggle-status", "ids": [own_post.id, foreign_post.id]},
+        headers=auth_headers(owner)
+    )
+
+    assert response.status_code == 200
+    assert _results(response) == {own_post.id: "updated", foreign_post.id: "forbidden"}
+    db.expire_all()
+    assert db.get(Post, own_post.id).is_active is False
+    assert db.get(Post, foreign_post.id).is_active is True
+
+
+def test_bulk_approve_requires_admin(client, make_user, make_category, make_post, auth_headers):
+    editor, category = make_user(UserRole.EDITOR), make_category()
+    post = make_post(editor, category, status=PostStatus.PENDING)
+
+    response = client.post("/posts/bulk", json={"action": "approve", "ids": [post.id]}, headers=auth_headers(editor))
+
+    assert response.status_code == 403
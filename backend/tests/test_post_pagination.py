@@ -0,0 +1,53 @@
+from datetime import datetime
+
+from models.post import PostStatus
+
+
+def _collect(client, limit, **params):
+    ids, cursor, pages = [], None, 0
+    while True:
+        response = client.get("/posts/", params={"limit": limit, **params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        page = response.json()
+        ids.extend(item["id"] for item in page["items"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids, pages
+
+
+def test_cursor_walks_every_post_once_in_order(client, make_user, make_category, make_post):
+    author, category = make_user(), make_category()
+    posts = [make_post(author, category) for _ in range(25)]
+
+    ids, pages = _collect(client, limit=10)
+
+    assert ids == [post.id for post in reversed(posts)]
+    assert pages == 3
+
+
+def test_cursor_breaks_created_at_ties_by_id(client, make_user, make_category, make_post):
+    author, category = make_user(), make_category()
+    same_time = datetime(2024, 6, 1, 12, 0)
+    posts = [make_post(author, category, created_at=same_time) for _ in range(7)]
+
+    ids, _ = _collect(client, limit=3)
+
+    assert ids == sorted((post.id for post in posts), reverse=True)
+
+
+def test_cursor_skips_unpublished_posts(client, make_user, make_category, make_post):
+    author, category = make_user(), make_category()
+    published = [make_post(author, category) for _ in range(4)]
+    make_post(author, category, status=PostStatus.PENDING)
+    make_post(author, category, status=PostStatus.REJECTED)
+
+    ids, _ = _collect(client, limit=2)
+
+    assert sorted(ids) == sorted(post.id for post in published)
+
+
+def test_invalid_cursor_is_rejected(client):
+    response = client.get("/posts/", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
@@ -0,0 +1,81 @@
+import functions.seed_districts as seed_module
+from models.district import District, DistrictRegion
+from models.post import PostStatus
+from models.post_snapshot import PostSnapshot
+from models.user import UserRole
+
+
+def _snapshot(db, post_id):
+    db.expire_all()
+    return db.get(PostSnapshot, post_id)
+
+
+def test_approve_writes_snapshot_and_reject_removes_it(client, db, make_user, make_category, make_post, auth_headers):
+    admin, category = make_user(UserRole.ADMIN), make_category()
+    post = make_post(admin, category, status=PostStatus.PENDING)
+    headers = auth_headers(admin)
+
+    client.patch(f"/posts/{post.id}/approve", headers=headers)
+    snapshot = _snapshot(db, post.id)
+    assert snapshot is not None and snapshot.version == 1 and snapshot.slug == post.slug
+
+    client.patch(f"/posts/{post.id}/reject", headers=headers)
+    assert _snapshot(db, post.id) is None
+
+
+def test_version_bumps_only_when_body_changes(client, db, make_user, make_category, make_post, auth_headers):
+    admin, category = make_user(UserRole.ADMIN), make_category()
+    post = make_post(admin, category, status=PostStatus.PENDING)
+    headers = auth_headers(admin)
+    client.patch(f"/posts/{post.id}/approve", headers=headers)
+
+    client.put(f"/posts/{post.id}", json={"title": "Yeni başlık"}, headers=headers)
+    assert _snapshot(db, post.id).version == 2
+
+    client.put(f"/categories/{category.id}", json={"name": "Yeni kategori"}, headers=headers)
+    snapshot = _snapshot(db, post.id)
+    assert snapshot.version == 3
+    assert b"Yeni kategori" in snapshot.body
+
+
+def test_detail_routes_serve_snapshot_body(client, make_user, make_category, make_post, auth_headers):
+    admin, category = make_user(UserRole.ADMIN), make_category()
+    post = make_post(admin, category, status=PostStatus.PENDING)
+    client.patch(f"/posts/{post.id}/approve", headers=auth_headers(admin))
+
+    by_id = client.get(f"/posts/{post.id}")
+    by_slug = client.get(f"/posts/slug/{post.slug}")
+    revalidated = client.get(f"/posts/{post.id}", headers={"If-None-Match": by_id.headers["etag"]})
+
+    assert by_id.headers["x-snapshot-version"] == "1"
+    assert by_slug.content == by_id.content
+    assert by_id.json()["title"] == post.title
+    assert revalidated.status_code == 304
+
+
+def test_detail_falls_back_to_live_query_without_snapshot(client, make_user, make_category, make_post):
+    author, category = make_user(), make_category()
+    post = make_post(author, category)
+
+    response = client.get(f"/posts/{post.id}")
+
+    assert response.status_code == 200
+    assert "x-snapshot-version" not in response.headers
+    assert response.json()["id"] == post.id
+
+
+def test_district_seed_change_refreshes_embedded_district(client, db, make_user, make_category, make_post, auth_headers, monkeypatch):
+    seed_module.seed_districts(db)
+    district = db.query(District).filter(District.name == "Ataşehir").one()
+    admin = make_user(UserRole.ADMIN)
+    post = make_post(admin, make_category(), status=PostStatus.PENDING, district_id=district.id)
+    client.patch(f"/posts/{post.id}/approve", headers=auth_headers(admin))
+
+    # Slug aynı kalır, satır güncellenir
+    moved = [{**item, "region": DistrictRegion.ASIA} if item["name"] == "Ataşehir" else item for item in seed_module.districts]
+    monkeypatch.setattr(seed_module, "districts", moved)
+    seed_module.seed_districts(db)
+    response = client.get(f"/posts/{post.id}")
+
+    assert response.json()["district"]["region"] == "asia"
+    assert response.headers["X-Snapshot-Version"] == "2"
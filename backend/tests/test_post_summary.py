@@ -0,0 +1,46 @@
+from services.post_summary import SUMMARY_LENGTH, build_summary, estimate_reading_time, find_first_image
+
+
+def test_summary_prefers_first_text_block_and_truncates():
+    blocks = [
+        {"type": "image", "src": "a.jpg"},
+        {"type": "paragraph", "content": "x" * (SUMMARY_LENGTH + 10)},
+        {"type": "text", "content": "ikinci"},
+    ]
+
+    assert build_summary("içerik", blocks) == "x" * SUMMARY_LENGTH + "..."
+
+
+def test_summary_falls_back_to_content_then_block_text():
+    assert build_summary("kısa içerik", [{"type": "h1", "content": "Başlık"}]) == "kısa içerik"
+    assert build_summary(None, [{"type": "list", "items": ["bir", "iki"]}]) == "bir\niki"
+    assert build_summary(None, []) is None
+
+
+def test_first_image_is_found_inside_grids():
+    blocks = [
+        {"type": "image"},
+        {"type": "grid", "blocks": [{"type": "text", "content": "a"}, {"type": "image", "src": "grid.jpg"}]},
+        {"type": "image", "src": "later.jpg"},
+    ]
+
+    assert find_first_image(blocks) == "grid.jpg"
+
+
+def test_reading_time_counts_content_and_blocks():
+    blocks = [{"type": "paragraph", "content": "kelime " * 300}]
+
+    assert estimate_reading_time("kelime " * 150, blocks) == 3
+    assert estimate_reading_time(None, None) == 1
+
+
+def test_update_refreshes_stored_summary(client, make_user, make_category, make_post, auth_headers):
+    author, category = make_user(), make_category()
+    post = make_post(author, category)
+    blocks = [{"type": "image", "src": "kapak.jpg"}, {"type": "paragraph", "content": "Yeni özet"}]
+
+    response = client.put(f"/posts/{post.id}", json={"blocks": blocks}, headers=auth_headers(author))
+    listed = client.get("/posts/").json()["items"]
+
+    assert response.status_code == 200
+    assert (listed[0]["summary"], listed[0]["first_image"], listed[0]["reading_time"]) == ("Yeni özet", "kapak.jpg", 1)
@@ -0,0 +1,79 @@
+import asyncio
+import json
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from database import async_engine
+from models.post import Post, PostStatus
+from models.user import UserRole
+from services.post_transfer import PostImporter
+
+
+def _import(client, headers, payload: bytes):
+    return client.post("/posts/import", files={"file": ("posts.ndjson", payload, "application/x-ndjson")}, headers=headers)
+
+
+def _export(client, headers):
+    response = client.get("/posts/export", headers=headers)
+    assert response.status_code == 200
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_export_import_round_trip(client, db, make_user, make_category, make_post, auth_headers):
+    admin, category = make_user(UserRole.ADMIN), make_category()
+    make_post(admin, category, title="Kuzguncuk", blocks=[{"type": "paragraph", "content": "Ahşap evler"}])
+    make_post(admin, category, status=PostStatus.PENDING, latitude=41.03, longitude=29.03)
+    headers = auth_headers(admin)
+    exported = _export(client, headers)
+
+    db.query(Post).delete()
+    db.commit()
+    report = _import(client, headers, "".join(json.dumps(record) + "\n" for record in exported).encode())
+    reimported = _export(client, headers)
+
+    assert report.json() == {"processed": 2, "inserted": 2, "failed": 0, "renamed_slugs": 0, "errors": []}
+    strip_id = lambda records: [{key: value for key, value in record.items() if key != "id"} for record in records]
+    assert strip_id(reimported) == strip_id(exported)
+
+
+def test_non_utf8_line_is_reported_not_fatal(client, make_user, make_category, auth_headers):
+    admin, category = make_user(UserRole.ADMIN), make_category()
+    good = json.dumps({"title": "Balat", "category_slug": category.slug}).encode()
+
+    response = _import(client, auth_headers(admin), good + b"\n" + b'{"title": "\xff\xfe"}\n' + good)
+
+    assert response.status_code == 200
+    assert response.json()["inserted"] == 2
+    assert response.json()["errors"] == [{"line": 2, "error": "Geçersiz UTF-8 (11. bayt)"}]
+
+
+def test_foreign_key_violation_is_reported_per_line(make_user, make_category):
+    admin, category = make_user(UserRole.ADMIN), make_category()
+    lines = [
+        json.dumps({"title": "Fener", "category_slug": category.slug, "author_email": admin.email}),
+        json.dumps({"title": "Yazarı silinmiş", "category_slug": category.slug}),
+    ]
+
+    # SQLite yabancı anahtarları ancak bağlantı başına açılınca denetler
+    engine = create_async_engine(async_engine.url)
+    event.listen(engine.sync_engine, "connect", lambda connection, _: connection.execute("PRAGMA foreign_keys=ON"))
+
+    async def run():
+        try:
+            async with AsyncSession(engine) as db:
+                # Eşlenemeyen yazarlar, artık var olmayan bir kullanıcıya düşer
+                return await PostImporter(db, default_author_id=999).run(_aiter(lines))
+        finally:
+            await engine.dispose()
+
+    report = asyncio.run(run())
+
+    assert (report.inserted, report.failed) == (1, 1)
+    assert report.errors[0]["line"] == 2
+    assert "FOREIGN KEY" in report.errors[0]["error"]
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
@@ -0,0 +1,60 @@
+import pytest
+
+import services.principal_cache as principal_module
+from models.user import UserRole
+from services.cache import cache
+from services.principal_cache import RedisInvalidationStore, build_invalidation_store
+
+
+@pytest.fixture
+def trust_claims(monkeypatch):
+    monkeypatch.setattr(principal_module, "AUTH_TRUST_TOKEN_CLAIMS", True)
+
+
+def test_demoted_admin_token_is_rejected_after_cache_clear(client, make_user, auth_headers, trust_claims):
+    admin, demoted = make_user(UserRole.ADMIN), make_user(UserRole.ADMIN)
+    old_headers = auth_headers(demoted)
+    assert client.get("/admin/stats", headers=old_headers).status_code == 200
+
+    client.patch(f"/users/{demoted.id}/role", json={"role": "user"}, headers=auth_headers(admin))
+    client.post("/admin/cache/clear", headers=auth_headers(admin))
+    for index in range(cache.backend.max_entries + 1):
+        cache.backend.set(f"filler:{index}", b"x", 60)
+
+    assert client.get("/admin/stats", headers=old_headers).status_code == 403
+
+
+def test_deactivated_user_token_is_rejected(client, make_user, auth_headers, trust_claims):
+    admin, user = make_user(UserRole.ADMIN), make_user()
+    old_headers = auth_headers(user)
+    request = {"action": "toggle-status", "ids": [999]}
+    assert client.post("/posts/bulk", json=request, headers=old_headers).status_code == 200
+
+    client.patch(f"/users/{user.id}/toggle-status", headers=auth_headers(admin))
+
+    assert client.post("/posts/bulk", json=request, headers=old_headers).status_code == 400
+
+
+def test_trusting_claims_requires_redis(trust_claims):
+    with pytest.raises(RuntimeError):
+        build_invalidation_store("memory")
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes = {}
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value.encode()
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+
+def test_redis_store_round_trip():
+    store = RedisInvalidationStore(FakeRedis())
+
+    store.mark(7, 1234.5)
+
+    assert store.get(7) == 1234.5
+    assert store.get(8) == 0.0
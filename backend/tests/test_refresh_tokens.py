@@ -0,0 +1,67 @@
+def test_refresh_rotates_token(client, make_user, login):
+    user = make_user()
+    tokens = login(user)
+
+    response = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+
+    assert response.status_code == 200
+    assert response.json()["refresh_token"] != tokens["refresh_token"]
+    assert client.get("/auth/me", headers={"Authorization": f"Bearer {response.json()['access_token']}"}).status_code == 200
+
+
+def test_reusing_refresh_token_revokes_whole_family(client, make_user, login):
+    user = make_user()
+    stolen = login(user)["refresh_token"]
+    rotated = client.post("/auth/refresh", json={"refresh_token": stolen}).json()["refresh_token"]
+
+    reuse = client.post("/auth/refresh", json={"refresh_token": stolen})
+    after_reuse = client.post("/auth/refresh", json={"refresh_token": rotated})
+
+    assert reuse.status_code == 401
+    assert after_reuse.status_code == 401
+
+
+def test_reuse_does_not_affect_other_sessions(client, make_user, login):
+    user = make_user()
+    stolen = login(user)["refresh_token"]
+    other_session = login(user)["refresh_token"]
+    client.post("/auth/refresh", json={"refresh_token": stolen})
+
+    client.post("/auth/refresh", json={"refresh_token": stolen})
+
+    assert client.post("/auth/refresh", json={"refresh_token": other_session}).status_code == 200
+
+
+def test_logout_revokes_access_and_refresh_tokens(client, make_user, login):
+    user = make_user()
+    tokens = login(user)
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+    response = client.post("/auth/logout", json={"refresh_token": tokens["refresh_token"]}, headers=headers)
+
+    assert response.status_code == 204
+    assert client.get("/auth/me", headers=headers).status_code == 401
+    assert client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).status_code == 401
+
+
+def test_password_reset_revokes_existing_refresh_tokens(client, make_user, login):
+    from functions.auth_functions import create_reset_token
+    user = make_user()
+    tokens = [login(user)["refresh_token"] for _ in range(2)]
+
+    response = client.post("/auth/reset-password", json={"token": create_reset_token(user.email), "new_password": "new-password"})
+
+    assert response.status_code == 200
+    assert [client.post("/auth/refresh", json={"refresh_token": token}).status_code for token in tokens] == [401, 401]
+
+
+def test_deactivation_revokes_refresh_tokens(client, make_user, login, auth_headers):
+    from models.user import UserRole
+    admin, user = make_user(UserRole.ADMIN), make_user()
+    token = login(user)["refresh_token"]
+
+    client.patch(f"/users/{user.id}/toggle-status", headers=auth_headers(admin))
+    client.patch(f"/users/{user.id}/toggle-status", headers=auth_headers(admin))
+
+    # Yeniden aktifleştirmek eski oturumları geri getirmez
+    assert client.post("/auth/refresh", json={"refresh_token": token}).status_code == 401
@@ -0,0 +1,53 @@
+from models.post import PostStatus
+from services.search_service import fold_text, make_snippet
+
+
+def test_search_matches_block_text_with_turkish_folding(client, make_user, make_category, make_post):
+    author, category = make_user(), make_category()
+    match = make_post(author, category, title="Boğaz turu", blocks=[
+        {"type": "paragraph", "content": "Akşamüstü Kız Kulesi manzarası eşsizdir."},
+        {"type": "grid", "blocks": [{"type": "image", "src": "a.jpg", "alt": "Salacak sahili"}]},
+    ])
+    make_post(author, category, title="Başka bir yazı")
+
+    by_folded = client.get("/posts/search", params={"q": "kiz kule"})
+    by_grid_alt = client.get("/posts/search", params={"q": "SALACAK"})
+
+    assert [item["id"] for item in by_folded.json()] == [match.id]
+    assert [item["id"] for item in by_grid_alt.json()] == [match.id]
+
+
+def test_search_skips_unpublished_and_inactive_posts(client, make_user, make_category, make_post):
+    author, category = make_user(), make_category()
+    make_post(author, category, title="Galata gizli", status=PostStatus.PENDING)
+    make_post(author, category, title="Galata pasif", is_active=False)
+    visible = make_post(author, category, title="Galata kulesi")
+
+    response = client.get("/posts/search", params={"q": "galata"})
+
+    assert [item["id"] for item in response.json()] == [visible.id]
+
+
+def test_search_result_snippet_marks_the_match(client, make_user, make_category, make_post):
+    author, category = make_user(), make_category()
+    make_post(author, category, title="Moda", content="Moda sahilinde <b>çay</b> bahçeleri")
+
+    response = client.get("/posts/search", params={"q": "cay"})
+
+    assert response.json()[0]["snippet"].startswith("Moda sahilinde &lt;b&gt;<mark>çay</mark>&lt;/b&gt;")
+
+
+def test_snippet_is_cut_around_the_first_match():
+    text = "a" * 200 + " Beşiktaş çarşısı " + "b" * 200
+
+    snippet = make_snippet(text, "besiktas", radius=20)
+
+    assert snippet.startswith("...") and snippet.endswith("...")
+    assert "<mark>Beşiktaş</mark>" in snippet
+
+
+def test_fold_text_keeps_offsets():
+    text = "İstanbul'da Üsküdar ÇARŞI"
+
+    assert fold_text(text) == "istanbul'da uskudar carsi"
+    assert len(fold_text(text)) == len(text)
@@ -0,0 +1,69 @@
+import asyncio
+
+from database import AsyncSessionLocal
+from models.post import Post
+from models.user import UserRole
+from services import slug_service
+from services.slug_service import allocate_slug, allocate_slugs
+
+
+def _run(coroutine_factory):
+    async def runner():
+        async with AsyncSessionLocal() as session:
+            return await coroutine_factory(session)
+    return asyncio.run(runner())
+
+
+def _seed(make_user, make_category, make_post, *slugs):
+    author, category = make_user(), make_category()
+    return [make_post(author, category, slug=slug) for slug in slugs]
+
+
+def test_free_base_is_used_as_is(make_user, make_category, make_post):
+    _seed(make_user, make_category, make_post, "galata-kulesi")
+
+    assert _run(lambda db: allocate_slug(db, Post, "Ayasofya")) == "ayasofya"
+
+
+def test_next_suffix_follows_the_highest_number(make_user, make_category, make_post):
+    _seed(make_user, make_category, make_post, "ayasofya", "ayasofya-2", "ayasofya-10")
+
+    assert _run(lambda db: allocate_slug(db, Post, "Ayasofya")) == "ayasofya-11"
+
+
+def test_other_roots_sharing_the_prefix_are_ignored(make_user, make_category, make_post):
+    _seed(make_user, make_category, make_post, "ayasofya", "ayasofya-camii-5", "ayasofya-x", "ayasofya-99999999999999999999")
+
+    assert _run(lambda db: allocate_slug(db, Post, "Ayasofya")) == "ayasofya-1"
+
+
+def test_renaming_ignores_the_record_itself(make_user, make_category, make_post):
+    post, = _seed(make_user, make_category, make_post, "ayasofya")
+
+    assert _run(lambda db: allocate_slug(db, Post, "Ayasofya", exclude_id=post.id)) == "ayasofya"
+
+
+def test_bulk_allocation_avoids_database_and_batch_collisions(make_user, make_category, make_post):
+    _seed(make_user, make_category, make_post, "kadikoy", "kadikoy-3")
+
+    slugs = _run(lambda db: allocate_slugs(db, Post, ["Kadıköy", "Kadıköy", "Moda", "Moda", "Moda 1"]))
+
+    assert slugs == ["kadikoy-4", "kadikoy-5", "moda", "moda-1", "moda-1-1"]
+
+
+def test_rename_retries_after_a_slug_race(client, make_user, make_category, auth_headers, monkeypatch):
+    admin = make_user(UserRole.ADMIN)
+    category, rival = make_category(), make_category(slug="bogaz")
+    calls = []
+
+    async def racing_allocate(db, model, text, exclude_id=None):
+        # İlk denemede başka isteğin aldığı slug'ı döndür
+        calls.append(exclude_id)
+        return rival.slug if len(calls) == 1 else await allocate_slug(db, model, text, exclude_id)
+
+    monkeypatch.setattr(slug_service, "allocate_slug", racing_allocate)
+    response = client.put(f"/categories/{category.id}", json={"name": "Boğaz"}, headers=auth_headers(admin))
+
+    assert response.status_code == 200
+    assert response.json()["slug"] == "bogaz-1"
+    assert calls == [category.id, category.id]
@@ -0,0 +1,44 @@
+from models.post import PostStatus
+from models.user import UserRole
+from services.stats_service import rebuild_counters
+
+
+def _stats(client, headers):
+    response = client.get("/admin/stats", headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_counters_follow_moderation(client, make_user, make_category, make_post, auth_headers):
+    admin, author = make_user(UserRole.ADMIN), make_user()
+    first, second = make_category(), make_category()
+    pending = [make_post(author, first, status=PostStatus.PENDING) for _ in range(3)]
+    make_post(author, second)
+    headers = auth_headers(admin)
+
+    client.patch(f"/posts/{pending[0].id}/approve", headers=headers)
+    client.patch(f"/posts/{pending[1].id}/reject", headers=headers)
+    client.delete(f"/posts/{pending[2].id}", headers=headers)
+    stats = _stats(client, headers)
+
+    assert stats["users"] == 2
+    assert stats["categories"] == 2
+    assert stats["posts"] == {"total": 3, "by_status": {"approved": 2, "rejected": 1}}
+    by_category = {entry["id"]: entry for entry in stats["posts_by_category"]}
+    assert by_category[first.id]["by_status"] == {"approved": 1, "rejected": 1}
+    assert by_category[second.id]["total"] == 1
+
+
+def test_incremental_counters_match_rebuild(client, db, make_user, make_category, make_post, auth_headers):
+    admin, author = make_user(UserRole.ADMIN), make_user()
+    category = make_category()
+    posts = [make_post(author, category, status=PostStatus.PENDING) for _ in range(5)]
+    headers = auth_headers(admin)
+    client.post("/posts/bulk", json={"action": "approve", "ids": [post.id for post in posts[:3]]}, headers=headers)
+    client.post("/posts/bulk", json={"action": "reject", "ids": [posts[3].id]}, headers=headers)
+    client.delete(f"/users/{author.id}", headers=headers)
+    incremental = _stats(client, headers)
+
+    rebuild_counters(db)
+
+    assert _stats(client, headers) == incremental
@@ -0,0 +1,38 @@
+import time
+
+from services.token_denylist import TokenDenylist
+
+
+def test_revoked_token_is_found_until_it_expires():
+    denylist = TokenDenylist(capacity=16)
+    now = time.time()
+
+    denylist.add("live", now + 60)
+    denylist.add("expired", now - 1)
+
+    assert "live" in denylist
+    assert "expired" not in denylist
+    assert "unknown" not in denylist
+
+
+def test_expired_entries_are_dropped_on_add():
+    denylist = TokenDenylist(capacity=16)
+    now = time.time()
+    for index in range(10):
+        denylist.add(f"old-{index}", now - 1)
+
+    denylist.add("new", now + 60)
+
+    assert len(denylist) == 1
+
+
+def test_capacity_grows_when_full_of_live_tokens():
+    denylist = TokenDenylist(capacity=8)
+    expires_at = time.time() + 60
+
+    for index in range(100):
+        denylist.add(f"jti-{index}", expires_at)
+
+    assert len(denylist) == 100
+    assert denylist.capacity >= 100
+    assert all(f"jti-{index}" in denylist for index in range(100))
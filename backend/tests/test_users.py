@@ -0,0 +1,21 @@
+from models.user import UserRole
+
+
+def test_role_change_refreshes_cached_post_bodies(client, make_user, make_category, make_post, auth_headers):
+    admin, author, category = make_user(UserRole.ADMIN), make_user(), make_category()
+    post = make_post(author, category)
+    assert client.get(f"/posts/slug/{post.slug}").json()["author"]["role"] == "user"
+
+    client.patch(f"/users/{author.id}/role", json={"role": "editor"}, headers=auth_headers(admin))
+
+    assert client.get(f"/posts/slug/{post.slug}").json()["author"]["role"] == "editor"
+
+
+def test_deactivation_refreshes_cached_post_bodies(client, make_user, make_category, make_post, auth_headers):
+    admin, author, category = make_user(UserRole.ADMIN), make_user(), make_category()
+    post = make_post(author, category)
+    assert client.get(f"/posts/slug/{post.slug}").json()["author"]["is_active"] is True
+
+    client.patch(f"/users/{author.id}/toggle-status", headers=auth_headers(admin))
+
+    assert client.get(f"/posts/slug/{post.slug}").json()["author"]["is_active"] is False
@@ -1,7 +1,7 @@
 'use client';
 import Image from 'next/image';
 import Link from 'next/link';
-import { useEffect, useState, Suspense } from 'react';
+import { useCallback, useEffect, useRef, useState, Suspense } from 'react';
 import { useSearchParams } from 'next/navigation';
 import { postService } from '@/services/postService';
 
@@ -11,17 +11,27 @@ function BlogGrid() {
   const districtSlug = searchParams.get('district');
 
   const [posts, setPosts] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState(null);
   const [pageTitle, setPageTitle] = useState('Tüm Yazılar');
+  // Filtre değiştiyse geç gelen "daha fazla" yanıtı yeni listeye eklenmez
+  const activeFilter = useRef(null);
+
+  const filterParams = useCallback(() => {
+    const params = {};
+    if (categorySlug) params.category_slug = categorySlug;
+    if (districtSlug) params.district_slug = districtSlug;
+    return params;
+  }, [categorySlug, districtSlug]);
 
   useEffect(() => {
+    activeFilter.current = `${categorySlug}|${districtSlug}`;
     const fetchPosts = async () => {
       setLoading(true);
+      setError(null);
       try {
-        const params = {};
-        if (categorySlug) params.category_slug = categorySlug;
-        if (districtSlug) params.district_slug = districtSlug;
         if (categorySlug) {
           const formattedTitle = categorySlug
             .split('-')
@@ -37,8 +47,9 @@ function BlogGrid() {
         } else {
           setPageTitle('Tüm Yazılar');
         }
-        const data = await postService.getAllPosts(params);
-        setPosts(data);
+        const data = await postService.getAllPosts(filterParams());
+        setPosts(data.items);
+        setNextCursor(data.next_cursor);
       } catch (err) {
         setError('Blog yazıları yüklenemedi.');
         console.error(err);
@@ -47,7 +58,25 @@ function BlogGrid() {
       }
     };
     fetchPosts();
-  }, [categorySlug, districtSlug]);
+  }, [categorySlug, districtSlug, filterParams]);
+
+  // Liste sayfa sayfa gelir; sonraki sayfa bir önceki yanıttaki cursor ile istenir
+  const loadMore = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    const filter = activeFilter.current;
+    try {
+      const data = await postService.getAllPosts({ ...filterParams(), cursor: nextCursor });
+      if (filter !== activeFilter.current) return;
+      setPosts(prev => [...prev, ...data.items]);
+      setNextCursor(data.next_cursor);
+    } catch (err) {
+      setError('Daha fazla yazı yüklenemedi.');
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   return (
     <main className="min-h-screen bg-gray-50 py-12">
@@ -61,9 +90,10 @@ function BlogGrid() {
         
         {loading ? (
           <div className="text-center text-gray-500 py-20">Yükleniyor...</div>
-        ) : error ? (
+        ) : error && posts.length === 0 ? (
           <div className="text-center text-red-500 py-20">{error}</div>
         ) : posts.length > 0 ? (
+          <>
           <div className="grid gap-8 md:grid-cols-2 lg:grid-cols-3">
             {posts.map((post) => (
               <article key={post.id} className="group overflow-hidden rounded-2xl bg-white shadow-lg border border-gray-100 hover:shadow-2xl transition-all duration-300 ease-in-out hover:-translate-y-1">
@@ -108,6 +138,19 @@ function BlogGrid() {
               </article>
             ))}
           </div>
+          {error && <div className="mt-8 text-center text-red-500">{error}</div>}
+          {nextCursor && (
+            <div className="mt-12 text-center">
+              <button
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="bg-blue-600 text-white px-6 py-3 rounded-lg hover:bg-blue-700 transition disabled:opacity-50"
+              >
+                {loadingMore ? 'Yükleniyor...' : 'Daha Fazla Yazı'}
+              </button>
+            </div>
+          )}
+          </>
         ) : (
            <div className="text-center text-gray-500 py-20">
               <h2 className="text-2xl font-semibold mb-4">Yazı Bulunamadı</h2>
@@ -5,8 +5,8 @@ import { Bar, Doughnut } from 'react-chartjs-2';
 import { Chart as ChartJS, ArcElement, Tooltip, Legend, CategoryScale, LinearScale, BarElement, Title } from 'chart.js';
 import { FileText, Folder, Users } from 'lucide-react';
 import { postService } from '../../services/postService';
-import { categoryService } from '../../services/category';
 import { userService } from '../../services/userService';
+import { adminService } from '../../services/adminService';
 
 ChartJS.register(ArcElement, Tooltip, Legend, CategoryScale, LinearScale, BarElement, Title);
 
@@ -19,34 +19,25 @@ export default function AdminDashboard() {
   useEffect(() => {
     async function fetchData() {
       try {
-        const [postsCount, categoriesCount, usersCount, posts, users, allPosts] = await Promise.all([
-          postService.getPostsCount(),
-          categoryService.getCategoriesCount(),
-          userService.getUsersCount(),
-          postService.getAllPostsForAdmin({ limit: 5 }),
+        // Sayılar ve kategori kırılımı sunucudaki sayaçlardan tek istekte gelir
+        const [summary, posts, users] = await Promise.all([
+          adminService.getStats(),
+          postService.getAllPostsForAdmin({ limit: 5, fields: 'id,title,status,category' }),
           userService.getUsers({ limit: 5 }),
-          postService.getAllPostsForAdmin({ limit: 1000 }) // For chart
         ]);
 
         setStats({
-          posts: postsCount.count,
-          categories: categoriesCount.count,
-          users: usersCount.count,
+          posts: summary.posts.total,
+          categories: summary.categories,
+          users: summary.users,
         });
 
         setRecentPosts(posts);
         setRecentUsers(users);
-        
-        // Calculate post counts per category for chart
-        const categoryCounts = allPosts.reduce((acc, post) => {
-          const categoryName = post.category?.name || 'Kategorisiz';
-          acc[categoryName] = (acc[categoryName] || 0) + 1;
-          return acc;
-        }, {});
 
         setCategoryPostCounts({
-          labels: Object.keys(categoryCounts),
-          data: Object.values(categoryCounts),
+          labels: summary.posts_by_category.map(entry => entry.name || 'Kategorisiz'),
+          data: summary.posts_by_category.map(entry => entry.total),
         });
 
       } catch (error) {
@@ -4,10 +4,14 @@ import { useState, useEffect } from 'react';
 import Link from 'next/link';
 import { postService } from '@/services/postService';
 
+// Toplu işlemde güncellenemeyen yazıların sebepleri
+const BULK_FAILURE_LABELS = { not_found: 'bulunamadı', forbidden: 'yetki yok' };
+
 export default function AdminPostsPage() {
   const [posts, setPosts] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
+  const [selectedIds, setSelectedIds] = useState([]);
 
   useEffect(() => {
     const fetchPosts = async () => {
@@ -40,6 +44,40 @@ export default function AdminPostsPage() {
     }
   };
 
+  const toggleSelected = (postId) => {
+    setSelectedIds((ids) => ids.includes(postId) ? ids.filter(id => id !== postId) : [...ids, postId]);
+  };
+
+  const toggleSelectAll = () => {
+    setSelectedIds(selectedIds.length === posts.length ? [] : posts.map(post => post.id));
+  };
+
+  // Seçili yazıların hepsini tek istekte onayla/reddet
+  const handleBulkAction = async (action) => {
+    if (selectedIds.length === 0) return;
+    try {
+      const { results } = await postService.bulkUpdatePosts(selectedIds, action);
+      const updatedIds = results.filter(item => item.result === 'updated').map(item => item.id);
+      const failed = results.filter(item => item.result !== 'updated');
+      const newStatus = action === 'approve' ? 'approved' : 'rejected';
+      setPosts(posts.map(post => updatedIds.includes(post.id) ? { ...post, status: newStatus } : post));
+      // Güncellenemeyen yazılar seçili kalır ki admin hangileri olduğunu görsün
+      setSelectedIds(failed.map(item => item.id));
+      if (failed.length > 0) {
+        const titles = failed.map(item => {
+          const post = posts.find(post => post.id === item.id);
+          return `"${post?.title || item.id}" (${BULK_FAILURE_LABELS[item.result] || item.result})`;
+        });
+        setError(`${failed.length} yazı güncellenemedi: ${titles.join(', ')}`);
+      } else {
+        setError(null);
+      }
+    } catch (error) {
+      console.error("Toplu işlem sırasında hata:", error);
+      setError(error.message);
+    }
+  };
+
   return (
     <div>
       <div className="mb-8 flex items-center justify-between">
@@ -67,6 +105,18 @@ export default function AdminPostsPage() {
         </div>
       )}
 
+      {selectedIds.length > 0 && (
+        <div className="mb-4 flex items-center gap-4 rounded bg-gray-100 px-4 py-3">
+          <span className="text-sm text-gray-700">{selectedIds.length} yazı seçildi</span>
+          <button onClick={() => handleBulkAction('approve')} className="rounded bg-green-600 px-3 py-1 text-sm text-white hover:bg-green-700">
+            Onayla
+          </button>
+          <button onClick={() => handleBulkAction('reject')} className="rounded bg-red-600 px-3 py-1 text-sm text-white hover:bg-red-700">
+            Reddet
+          </button>
+        </div>
+      )}
+
       {loading ? (
         <div className="text-center py-4">Yükleniyor...</div>
       ) : (
@@ -74,6 +124,9 @@ export default function AdminPostsPage() {
           <table className="w-full">
             <thead className="bg-gray-50">
               <tr>
+                <th className="px-6 py-3">
+                  <input type="checkbox" checked={posts.length > 0 && selectedIds.length === posts.length} onChange={toggleSelectAll} />
+                </th>
                 <th className="px-6 py-3 text-left text-xs font-medium uppercase tracking-wider text-gray-500">Başlık</th>
                 <th className="px-6 py-3 text-left text-xs font-medium uppercase tracking-wider text-gray-500">Kategori</th>
                 <th className="px-6 py-3 text-left text-xs font-medium uppercase tracking-wider text-gray-500">Durum</th>
@@ -84,6 +137,9 @@ export default function AdminPostsPage() {
               {posts.length > 0 ? (
                 posts.map((post) => (
                   <tr key={post.id}>
+                    <td className="px-6 py-4">
+                      <input type="checkbox" checked={selectedIds.includes(post.id)} onChange={() => toggleSelected(post.id)} />
+                    </td>
                     <td className="whitespace-nowrap px-6 py-4 text-sm font-medium text-gray-900">{post.title}</td>
                     <td className="whitespace-nowrap px-6 py-4 text-sm text-gray-500">{post.category?.name || 'N/A'}</td>
                     <td className="whitespace-nowrap px-6 py-4">
@@ -107,7 +163,7 @@ export default function AdminPostsPage() {
                 ))
               ) : (
                 <tr>
-                  <td colSpan="4" className="px-6 py-4 text-center text-sm text-gray-500">Henüz hiç yazı oluşturulmamış.</td>
+                  <td colSpan="5" className="px-6 py-4 text-center text-sm text-gray-500">Henüz hiç yazı oluşturulmamış.</td>
                 </tr>
               )}
             </tbody>
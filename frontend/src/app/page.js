@@ -36,12 +36,6 @@ export default function Home() {
     fetchData();
   }, []);
 
-  // İçerik özeti oluştur
-  const createSummary = (content) => {
-    if (!content) return '';
-    return content.length > 150 ? content.substring(0, 150) + '...' : content;
-  };
-
   return (
     <main className="min-h-screen bg-gray-50">
       <Header />
@@ -67,7 +61,7 @@ export default function Home() {
                       </span>
                     </div>
                     <h3 class="text-lg font-semibold text-gray-900">${post.title}</h3>
-                    <p class="text-sm text-gray-600">${createSummary(post.content)}</p>
+                    <p class="text-sm text-gray-600">${post.summary || ''}</p>
                     <a href="/blog/${post.id}" class="inline-flex items-center text-sm text-blue-600 hover:text-blue-800">
                       Devamını Oku
                       <svg class="ml-1 w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -0,0 +1,32 @@
+import Cookies from 'js-cookie';
+
+const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
+
+const handleResponse = async (response) => {
+  if (!response.ok) {
+    const errorData = await response.json().catch(() => ({ detail: 'Bilinmeyen bir sunucu hatası oluştu.' }));
+    throw new Error(errorData.detail || `API Hatası: ${response.status}`);
+  }
+  return response.json();
+};
+
+const getAuthHeaders = () => {
+  const token = Cookies.get('token');
+  if (!token) {
+    throw new Error('Yetkilendirme tokenı bulunamadı.');
+  }
+  return {
+    'Content-Type': 'application/json',
+    'Authorization': `Bearer ${token}`,
+  };
+};
+
+export const adminService = {
+  // Dashboard toplamları ve kategori/ilçe/yazar kırılımları (tek sorgu)
+  async getStats() {
+    const response = await fetch(`${API_URL}/admin/stats`, {
+      headers: getAuthHeaders(),
+    });
+    return handleResponse(response);
+  },
+};
@@ -11,13 +11,7 @@ export const authService = {
         password,
       });
       console.log('Login response:', response.data);
-      if (response.data.access_token) {
-        Cookies.set('token', response.data.access_token, { 
-          secure: false,
-          sameSite: 'lax',
-          path: '/'
-        });
-      }
+      this.storeTokens(response.data);
       return response.data;
     } catch (error) {
       console.error('Login error:', error);
@@ -43,25 +37,76 @@ export const authService = {
     }
   },
 
+  storeTokens(data) {
+    // Token'lar JS'ten okunabildiği için en azından sadece HTTPS üzerinden ve
+    // sadece kendi sitemizden gelen isteklerle gönderilsin (localhost'ta da
+    // tarayıcılar Secure çerezi kabul eder)
+    const options = { secure: true, sameSite: 'strict', path: '/' };
+    if (data.access_token) {
+      Cookies.set('token', data.access_token, options);
+    }
+    if (data.refresh_token) {
+      Cookies.set('refresh_token', data.refresh_token, options);
+    }
+  },
+
+  // Access token süresi dolduğunda parola istemeden yenisini alır
+  async refresh() {
+    const refreshToken = Cookies.get('refresh_token');
+    if (!refreshToken) return null;
+    try {
+      const response = await axios.post(`${API_URL}/auth/refresh`, {
+        refresh_token: refreshToken,
+      });
+      this.storeTokens(response.data);
+      return response.data.access_token;
+    } catch (error) {
+      Cookies.remove('token');
+      Cookies.remove('refresh_token');
+      return null;
+    }
+  },
+
   async getCurrentUser() {
+    const fetchMe = (token) => axios.get(`${API_URL}/auth/me`, {
+      headers: {
+        'Authorization': `Bearer ${token}`
+      }
+    });
     try {
-      const token = Cookies.get('token');
+      let token = Cookies.get('token');
+      if (!token) token = await this.refresh();
       if (!token) return null;
 
-      const response = await axios.get(`${API_URL}/auth/me`, {
-        headers: {
-          'Authorization': `Bearer ${token}`
-        }
-      });
-      return response.data;
+      try {
+        const response = await fetchMe(token);
+        return response.data;
+      } catch (error) {
+        if (error.response?.status !== 401) throw error;
+        token = await this.refresh();
+        if (!token) return null;
+        const response = await fetchMe(token);
+        return response.data;
+      }
     } catch (error) {
       console.error('Kullanıcı bilgileri alınamadı:', error);
       return null;
     }
   },
 
-  logout() {
+  async logout() {
+    const token = Cookies.get('token');
+    const refreshToken = Cookies.get('refresh_token');
     Cookies.remove('token');
+    Cookies.remove('refresh_token');
+    if (!token) return;
+    try {
+      await axios.post(`${API_URL}/auth/logout`, { refresh_token: refreshToken || null }, {
+        headers: { 'Authorization': `Bearer ${token}` }
+      });
+    } catch (error) {
+      // Sunucu tarafı iptal başarısız olsa da yerel oturum kapatıldı
+    }
   },
 
   getToken() {
@@ -70,6 +70,16 @@ export const postService = {
     return handleResponse(response);
   },
   
+  // Birden çok yazıya tek istekte aynı işlemi uygula (approve, reject, toggle-status, toggle-featured)
+  async bulkUpdatePosts(ids, action) {
+    const response = await fetch(`${API_URL}/posts/bulk`, {
+      method: 'POST',
+      headers: getAuthHeaders(),
+      body: JSON.stringify({ ids, action }),
+    });
+    return handleResponse(response);
+  },
+
   // Yazıyı sil
   async deletePost(postId) {
     const response = await fetch(`${API_URL}/posts/${postId}`, {